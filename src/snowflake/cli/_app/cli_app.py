@@ -28,8 +28,6 @@ from snowflake.cli import __about__
 from snowflake.cli._app.commands_registration.commands_registration_with_callbacks import (
     CommandsRegistrationWithCallbacks,
 )
-from snowflake.cli._app.dev.commands_structure import generate_commands_structure
-from snowflake.cli._app.dev.docs.generator import generate_docs
 from snowflake.cli._app.dev.pycharm_remote_debug import (
     setup_pycharm_remote_debugger_if_provided,
 )
@@ -94,9 +92,12 @@ class CliAppFactory:
 
     def _docs_callback(self):
         @_do_not_execute_on_completion
-        @self._commands_registration.after
+        @self._commands_registration.after_registering_all_commands
         def callback(value: bool):
             if value:
+                # imported here, as the generator imports all project definition models
+                from snowflake.cli._app.dev.docs.generator import generate_docs
+
                 ctx = click.get_current_context()
                 generate_docs(SecurePath("gen_docs"), ctx.command)
                 self._exit_with_cleanup()
@@ -116,9 +117,13 @@ class CliAppFactory:
 
     def _commands_structure_callback(self):
         @_do_not_execute_on_completion
-        @self._commands_registration.after
+        @self._commands_registration.after_registering_all_commands
         def callback(value: bool):
             if value:
+                from snowflake.cli._app.dev.commands_structure import (
+                    generate_commands_structure,
+                )
+
                 ctx = click.get_current_context()
                 generate_commands_structure(ctx.command).print_node()
                 self._exit_with_cleanup()
@@ -12,47 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from snowflake.cli._plugins.auth.keypair import plugin_spec as auth_plugin_spec
-from snowflake.cli._plugins.connection import plugin_spec as connection_plugin_spec
-from snowflake.cli._plugins.cortex import plugin_spec as cortex_plugin_spec
-from snowflake.cli._plugins.git import plugin_spec as git_plugin_spec
-from snowflake.cli._plugins.helpers import plugin_spec as migrate_plugin_spec
-from snowflake.cli._plugins.init import plugin_spec as init_plugin_spec
-from snowflake.cli._plugins.logs import plugin_spec as logs_plugin_spec
-from snowflake.cli._plugins.nativeapp import plugin_spec as nativeapp_plugin_spec
-from snowflake.cli._plugins.notebook import plugin_spec as notebook_plugin_spec
-from snowflake.cli._plugins.object import plugin_spec as object_plugin_spec
-from snowflake.cli._plugins.plugin import plugin_spec as plugin_plugin_spec
-from snowflake.cli._plugins.project import plugin_spec as project_plugin_spec
-from snowflake.cli._plugins.snowpark import plugin_spec as snowpark_plugin_spec
-from snowflake.cli._plugins.spcs import plugin_spec as spcs_plugin_spec
-from snowflake.cli._plugins.sql import plugin_spec as sql_plugin_spec
-from snowflake.cli._plugins.stage import plugin_spec as stage_plugin_spec
-from snowflake.cli._plugins.streamlit import plugin_spec as streamlit_plugin_spec
-from snowflake.cli._plugins.workspace import plugin_spec as workspace_plugin_spec
-
-
-# plugin name to plugin spec
-def get_builtin_plugin_name_to_plugin_spec():
-    plugin_specs = {
-        "auth": auth_plugin_spec,
-        "connection": connection_plugin_spec,
-        "helpers": migrate_plugin_spec,
-        "spcs": spcs_plugin_spec,
-        "app": nativeapp_plugin_spec,
-        "object": object_plugin_spec,
-        "project": project_plugin_spec,
-        "snowpark": snowpark_plugin_spec,
-        "stage": stage_plugin_spec,
-        "sql": sql_plugin_spec,
-        "streamlit": streamlit_plugin_spec,
-        "git": git_plugin_spec,
-        "notebook": notebook_plugin_spec,
-        "cortex": cortex_plugin_spec,
-        "init": init_plugin_spec,
-        "workspace": workspace_plugin_spec,
-        "plugin": plugin_plugin_spec,
-        "logs": logs_plugin_spec,
-    }
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Dict, List
+
+# Plugin specs are imported only when needed,
+# so that invoking a command does not import every plugin
+_BUILTIN_PLUGIN_SPEC_MODULES = {
+    "auth": "snowflake.cli._plugins.auth.keypair.plugin_spec",
+    "connection": "snowflake.cli._plugins.connection.plugin_spec",
+    "helpers": "snowflake.cli._plugins.helpers.plugin_spec",
+    "spcs": "snowflake.cli._plugins.spcs.plugin_spec",
+    "app": "snowflake.cli._plugins.nativeapp.plugin_spec",
+    "object": "snowflake.cli._plugins.object.plugin_spec",
+    "project": "snowflake.cli._plugins.project.plugin_spec",
+    "snowpark": "snowflake.cli._plugins.snowpark.plugin_spec",
+    "stage": "snowflake.cli._plugins.stage.plugin_spec",
+    "sql": "snowflake.cli._plugins.sql.plugin_spec",
+    "streamlit": "snowflake.cli._plugins.streamlit.plugin_spec",
+    "git": "snowflake.cli._plugins.git.plugin_spec",
+    "notebook": "snowflake.cli._plugins.notebook.plugin_spec",
+    "cortex": "snowflake.cli._plugins.cortex.plugin_spec",
+    "init": "snowflake.cli._plugins.init.plugin_spec",
+    "workspace": "snowflake.cli._plugins.workspace.plugin_spec",
+    "plugin": "snowflake.cli._plugins.plugin.plugin_spec",
+    "logs": "snowflake.cli._plugins.logs.plugin_spec",
+}
+
+
+def get_builtin_plugin_names() -> List[str]:
+    return list(_BUILTIN_PLUGIN_SPEC_MODULES)
 
-    return plugin_specs
+
+def get_builtin_plugin_spec(plugin_name: str) -> ModuleType:
+    return importlib.import_module(_BUILTIN_PLUGIN_SPEC_MODULES[plugin_name])
+
+
+def get_builtin_plugin_name_to_plugin_spec() -> Dict[str, ModuleType]:
+    return {
+        plugin_name: get_builtin_plugin_spec(plugin_name)
+        for plugin_name in _BUILTIN_PLUGIN_SPEC_MODULES
+    }
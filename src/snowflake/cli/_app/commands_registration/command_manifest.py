@@ -0,0 +1,270 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cached manifest of the command tree, used to load only the plugin of the invoked command.
+
+After all command plugins are registered, the names and help of the top-level
+commands are saved in the manifest, together with the plugins providing them. While the manifest is fresh (it was generated by the same
+CLI version, with the same feature flags and external plugins), the top-level commands
+are resolved from it, and only the plugins of the invoked command are loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import click
+from snowflake.cli import __about__
+from snowflake.cli._app.commands_registration import LoadedCommandPlugin
+from snowflake.cli.api.config import (
+    FEATURE_FLAGS_SECTION_PATH,
+    get_env_variable_name,
+    get_feature_flags_section,
+)
+from snowflake.cli.api.exceptions import FileTooLargeError
+from snowflake.cli.api.plugins.command import SNOWCLI_COMMAND_PLUGIN_NAMESPACE
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.connector.config_manager import CONFIG_MANAGER
+from typer.core import TyperCommand
+from typer.models import DefaultPlaceholder
+
+log = logging.getLogger(__name__)
+
+COMMAND_MANIFEST_VERSION = 2
+COMMAND_MANIFEST_FILE_NAME = ".cli_commands_manifest.json"
+COMMAND_MANIFEST_FILE_SIZE_LIMIT_MB = 16
+
+
+def command_manifest_path() -> Optional[Path]:
+    """Returns the path of the manifest, next to the config file, if it is known."""
+    config_file_path = CONFIG_MANAGER.file_path
+    if config_file_path is None:
+        return None
+    return config_file_path.parent / COMMAND_MANIFEST_FILE_NAME
+
+
+def command_tree_digest(external_plugin_names: Optional[List[str]]) -> str:
+    """
+    Identifies everything the registered command tree depends on, apart from the
+    code of the CLI itself: its version, the Python version, feature flags (which
+    hide or disable commands) and the enabled external plugins with their versions.
+    external_plugin_names is None when external plugins are disabled.
+    """
+    feature_flags_env_prefix = get_env_variable_name(
+        *FEATURE_FLAGS_SECTION_PATH, key=""
+    )
+    inputs = {
+        "cli_version": __about__.VERSION,
+        "python_version": list(sys.version_info[:2]),
+        "feature_flags": get_feature_flags_section(),
+        "feature_flags_env": {
+            key: value
+            for key, value in os.environ.items()
+            if key.startswith(feature_flags_env_prefix)
+        },
+        "external_plugins": (
+            None
+            if external_plugin_names is None
+            else _external_plugin_versions(external_plugin_names)
+        ),
+    }
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _external_plugin_versions(plugin_names: List[str]) -> Dict[str, Optional[str]]:
+    versions: Dict[str, Optional[str]] = {name: None for name in plugin_names}
+    for entry_point in entry_points(group=SNOWCLI_COMMAND_PLUGIN_NAMESPACE):
+        if entry_point.name in versions and entry_point.dist:
+            versions[entry_point.name] = entry_point.dist.version
+    return versions
+
+
+def _resolve_default(value):
+    # typer keeps defaults of command attributes it was not given as placeholders
+    return value.value if isinstance(value, DefaultPlaceholder) else value
+
+
+@dataclass
+class ManifestCommand:
+    """Description of a registered command, enough to list it in help messages."""
+
+    name: str
+    help_text: Optional[str] = None
+    short_help: Optional[str] = None
+    hidden: bool = False
+    deprecated: bool = False
+    rich_help_panel: Optional[str] = None
+    plugins: List[str] = field(default_factory=list)
+    "Plugins to load (in order) to register a top-level command"
+
+    @classmethod
+    def from_click_command(
+        cls, command: click.Command, plugins: Optional[List[str]] = None
+    ) -> ManifestCommand:
+        return cls(
+            name=command.name or "",
+            help_text=_resolve_default(command.help),
+            short_help=_resolve_default(command.short_help),
+            hidden=_resolve_default(command.hidden),
+            deprecated=_resolve_default(command.deprecated),
+            rich_help_panel=_resolve_default(getattr(command, "rich_help_panel", None)),
+            plugins=plugins or [],
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ManifestCommand:
+        fields = {**data}
+        fields["help_text"] = fields.pop("help", None)
+        return cls(**fields)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "help": self.help_text,
+            "short_help": self.short_help,
+            "hidden": self.hidden,
+            "deprecated": self.deprecated,
+            "rich_help_panel": self.rich_help_panel,
+            "plugins": self.plugins,
+        }
+
+    def placeholder(self) -> click.Command:
+        """
+        Returns a command standing in for this one in the list of commands of its
+        parent. It has the same help, but cannot be invoked.
+        """
+        return TyperCommand(
+            name=self.name,
+            help=self.help_text,
+            short_help=self.short_help,
+            hidden=self.hidden,
+            deprecated=self.deprecated,
+            rich_help_panel=self.rich_help_panel,
+        )
+
+
+class CommandManifest:
+    """Top-level commands of the command tree, in the order they are listed."""
+
+    def __init__(self, fingerprint: str, commands: List[ManifestCommand]):
+        self.fingerprint = fingerprint
+        self.commands = {command.name: command for command in commands}
+
+    @classmethod
+    def from_registered_commands(
+        cls,
+        fingerprint: str,
+        ctx: click.Context,
+        group: click.Group,
+        plugins: List[LoadedCommandPlugin],
+    ) -> CommandManifest:
+        plugins_by_command: Dict[str, List[str]] = {}
+        for plugin in plugins:
+            command_name = plugin.command_spec.full_command_path.path_segments[0]
+            plugins_by_command.setdefault(command_name, []).append(plugin.plugin_name)
+        return cls(
+            fingerprint,
+            [
+                ManifestCommand.from_click_command(
+                    group.commands[name], plugins_by_command.get(name)
+                )
+                for name in group.list_commands(ctx)
+            ],
+        )
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> Optional[CommandManifest]:
+        """Returns the manifest saved at path, or None if it is missing or stale."""
+        manifest_file = SecurePath(path)
+        if not manifest_file.exists():
+            return None
+        try:
+            data = json.loads(
+                manifest_file.read_text(
+                    file_size_limit_mb=COMMAND_MANIFEST_FILE_SIZE_LIMIT_MB
+                )
+            )
+            if (
+                data.get("version") != COMMAND_MANIFEST_VERSION
+                or data.get("fingerprint") != fingerprint
+            ):
+                log.debug("Ignoring stale command manifest %s", path)
+                return None
+            return cls(
+                fingerprint,
+                [ManifestCommand.from_dict(entry) for entry in data["commands"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError, FileTooLargeError) as err:
+            log.debug("Ignoring unreadable command manifest %s: %s", path, err)
+            return None
+
+    def save(self, path: Path) -> None:
+        """
+        Persists the manifest. Failures are logged and ignored,
+        as the manifest is only an optimisation.
+        """
+        data = {
+            "version": COMMAND_MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "commands": [command.to_dict() for command in self.commands.values()],
+        }
+        manifest_file = SecurePath(path)
+        try:
+            tmp_file = manifest_file.parent / f".{manifest_file.name}.{os.getpid()}.tmp"
+            tmp_file.write_text(json.dumps(data))
+            os.replace(tmp_file.path, manifest_file.path)
+        except OSError as err:
+            log.debug("Could not save command manifest %s: %s", path, err)
+
+
+class LazyCommands:
+    """
+    Top-level commands resolved from the manifest. Until a command is loaded,
+    it is listed using a placeholder with the help from the manifest.
+    """
+
+    def __init__(
+        self,
+        manifest: CommandManifest,
+        load_command: Callable[[ManifestCommand], None],
+    ):
+        self._manifest = manifest
+        self._load_command = load_command
+        self._placeholders: Dict[str, click.Command] = {}
+
+    def names(self) -> List[str]:
+        return list(self._manifest.commands)
+
+    def placeholder(self, name: str) -> Optional[click.Command]:
+        if name not in self._manifest.commands:
+            return None
+        if name not in self._placeholders:
+            self._placeholders[name] = self._manifest.commands[name].placeholder()
+        return self._placeholders[name]
+
+    def load(self, name: str) -> None:
+        """Registers the command by loading the plugins providing it."""
+        if name in self._manifest.commands:
+            self._load_command(self._manifest.commands[name])
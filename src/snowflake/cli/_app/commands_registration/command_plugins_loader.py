@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import pluggy
 from snowflake.cli._app.commands_registration import (
@@ -25,6 +25,7 @@ from snowflake.cli._app.commands_registration import (
 )
 from snowflake.cli._app.commands_registration.builtin_plugins import (
     get_builtin_plugin_name_to_plugin_spec,
+    get_builtin_plugin_spec,
 )
 from snowflake.cli._app.commands_registration.exception_logging import exception_logging
 from snowflake.cli.api.plugins.command import (
@@ -45,13 +46,23 @@ class CommandPluginsLoader:
         self._plugin_manager = plugin_manager
         self._loaded_plugins: Dict[str, LoadedCommandPlugin] = {}
         self._loaded_command_paths: Dict[CommandPath, LoadedCommandPlugin] = {}
-
-    def register_builtin_plugins(self) -> None:
-        for plugin_name, plugin in sorted(
-            get_builtin_plugin_name_to_plugin_spec().items()
-        ):
+        self._builtin_plugin_names: Set[str] = set()
+
+    def register_builtin_plugins(
+        self, plugin_names: Optional[List[str]] = None
+    ) -> None:
+        """Registers the given built-in plugins, or all of them if plugin_names is None."""
+        if plugin_names is None:
+            plugins = sorted(get_builtin_plugin_name_to_plugin_spec().items())
+        else:
+            plugins = [
+                (plugin_name, get_builtin_plugin_spec(plugin_name))
+                for plugin_name in sorted(plugin_names)
+            ]
+        for plugin_name, plugin in plugins:
             try:
                 self._plugin_manager.register(plugin=plugin, name=plugin_name)
+                self._builtin_plugin_names.add(plugin_name)
             except Exception as ex:
                 log_exception(
                     f"Cannot register plugin [{plugin_name}]: {ex.__str__()}", ex
@@ -111,7 +122,7 @@ class CommandPluginsLoader:
     def _load_plugin_spec(
         self, plugin_name: str, plugin
     ) -> Optional[LoadedCommandPlugin]:
-        if plugin_name in get_builtin_plugin_name_to_plugin_spec().keys():
+        if plugin_name in self._builtin_plugin_names:
             return self._load_builtin_plugin_spec(plugin_name, plugin)
         else:
             return self._load_external_plugin_spec(plugin_name, plugin)
@@ -169,3 +180,13 @@ def load_builtin_and_external_command_plugins(
     loader.register_builtin_plugins()
     loader.register_external_plugins(external_plugin_names)
     return loader.load_all_registered_plugins()
+
+
+def load_command_plugins(
+    builtin_plugin_names: List[str],
+    external_plugin_names: List[str],
+) -> List[LoadedCommandPlugin]:
+    loader = CommandPluginsLoader()
+    loader.register_builtin_plugins(builtin_plugin_names)
+    loader.register_external_plugins(external_plugin_names)
+    return loader.load_all_registered_plugins()
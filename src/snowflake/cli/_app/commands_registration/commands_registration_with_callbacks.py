@@ -14,22 +14,40 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, List, Optional
 
+import click
+from snowflake.cli._app.commands_registration import LoadedCommandPlugin
+from snowflake.cli._app.commands_registration.builtin_plugins import (
+    get_builtin_plugin_names,
+)
+from snowflake.cli._app.commands_registration.command_manifest import (
+    CommandManifest,
+    LazyCommands,
+    ManifestCommand,
+    command_manifest_path,
+    command_tree_digest,
+)
 from snowflake.cli._app.commands_registration.command_plugins_loader import (
     load_builtin_and_external_command_plugins,
+    load_command_plugins,
     load_only_builtin_command_plugins,
 )
 from snowflake.cli._app.commands_registration.typer_registration import (
     register_commands_from_plugins,
 )
+from snowflake.cli._app.main_typer import SnowCliMainGroup
 from snowflake.cli.api.plugins.plugin_config import PluginConfigProvider
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class CommandRegistrationConfig:
     enable_external_command_plugins: bool
+    register_all_commands: bool = False
 
 
 class CommandsRegistrationWithCallbacks:
@@ -42,28 +60,89 @@ class CommandsRegistrationWithCallbacks:
         self._commands_already_registered: bool = False
 
     def register_commands_from_plugins(self) -> None:
-        if self._commands_registration_config.enable_external_command_plugins:
-            self._register_builtin_and_enabled_external_plugin_commands()
+        """
+        Registers commands of all plugins, or only resolves the top-level commands
+        from the command manifest if it is fresh. Their plugins are then loaded when
+        the command is invoked.
+        """
+        external_plugin_names = self._enabled_external_plugin_names()
+        fingerprint = command_tree_digest(external_plugin_names)
+        manifest_path = command_manifest_path()
+        manifest = None
+        if (
+            manifest_path is not None
+            and not self._commands_registration_config.register_all_commands
+        ):
+            manifest = CommandManifest.load(manifest_path, fingerprint)
+
+        main_group = click.get_current_context().command
+        if manifest and isinstance(main_group, SnowCliMainGroup):
+            main_group.lazy_commands = LazyCommands(
+                manifest,
+                load_command=lambda command: self._load_command_from_manifest(
+                    command, main_group, external_plugin_names, fingerprint
+                ),
+            )
         else:
-            self._register_only_builtin_plugin_commands()
+            self._register_all_commands(external_plugin_names, fingerprint)
 
         self._commands_already_registered = True
         for callback in self._callbacks_after_registration:
             callback()
 
+    def _enabled_external_plugin_names(self) -> Optional[List[str]]:
+        if not self._commands_registration_config.enable_external_command_plugins:
+            return None
+        return self._plugin_config_manager.get_enabled_plugin_names()
+
     @staticmethod
-    def _register_only_builtin_plugin_commands() -> None:
-        loaded_command_plugins = load_only_builtin_command_plugins()
+    def _register_all_commands(
+        external_plugin_names: Optional[List[str]], fingerprint: str
+    ) -> None:
+        loaded_command_plugins: List[LoadedCommandPlugin]
+        if external_plugin_names is None:
+            loaded_command_plugins = load_only_builtin_command_plugins()
+        else:
+            loaded_command_plugins = load_builtin_and_external_command_plugins(
+                external_plugin_names
+            )
         register_commands_from_plugins(loaded_command_plugins)
 
-    def _register_builtin_and_enabled_external_plugin_commands(self):
-        enabled_external_plugins = (
-            self._plugin_config_manager.get_enabled_plugin_names()
-        )
-        loaded_command_plugins = load_builtin_and_external_command_plugins(
-            enabled_external_plugins
+        manifest_path = command_manifest_path()
+        if manifest_path is None:
+            return
+        ctx = click.get_current_context()
+        CommandManifest.from_registered_commands(
+            fingerprint, ctx, ctx.command, loaded_command_plugins  # type: ignore[arg-type]
+        ).save(manifest_path)
+
+    def _load_command_from_manifest(
+        self,
+        command: ManifestCommand,
+        main_group: SnowCliMainGroup,
+        external_plugin_names: Optional[List[str]],
+        fingerprint: str,
+    ) -> None:
+        builtin_plugin_names = set(get_builtin_plugin_names())
+        register_commands_from_plugins(
+            load_command_plugins(
+                builtin_plugin_names=[
+                    name for name in command.plugins if name in builtin_plugin_names
+                ],
+                external_plugin_names=[
+                    name for name in command.plugins if name not in builtin_plugin_names
+                ],
+            )
         )
-        register_commands_from_plugins(loaded_command_plugins)
+        if command.name not in main_group.commands:
+            log.debug(
+                "Command %s is not provided by plugins listed in the command manifest, "
+                "registering all commands.",
+                command.name,
+            )
+            main_group.lazy_commands = None
+            main_group.commands.clear()
+            self._register_all_commands(external_plugin_names, fingerprint)
 
     def disable_external_command_plugins(self):
         self._commands_registration_config.enable_external_command_plugins = False
@@ -74,6 +153,21 @@ class CommandsRegistrationWithCallbacks:
 
         return delayed_callback
 
+    def after_registering_all_commands(self, callback):
+        """
+        Like after, but if the option is set, commands of all plugins are registered
+        instead of being resolved from the command manifest.
+        """
+        delayed_callback = self.after(callback)
+
+        def callback_requiring_all_commands(value):
+            if value:
+                self._commands_registration_config.register_all_commands = True
+            delayed_callback(value)
+
+        return callback_requiring_all_commands
+
     def reset_running_instance_registration_state(self):
         self._callbacks_after_registration.clear()
         self._commands_registration_config.enable_external_command_plugins = True
+        self._commands_registration_config.register_all_commands = False
@@ -15,11 +15,16 @@
 from __future__ import annotations
 
 import sys
+from typing import List, Optional
 
+import click
 import typer
+from click.utils import make_str
+from snowflake.cli._app.commands_registration.command_manifest import LazyCommands
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.commands.flags import DEFAULT_CONTEXT_SETTINGS, DebugOption
 from snowflake.cli.api.console import cli_console
+from typer.core import TyperGroup
 
 
 def _handle_exception(exception: Exception):
@@ -33,6 +38,35 @@ def _handle_exception(exception: Exception):
         raise SystemExit(1)
 
 
+class SnowCliMainGroup(TyperGroup):
+    """
+    Top-level command group. When its commands are resolved from the command manifest,
+    the plugins of a command are loaded only once the command is invoked.
+    """
+
+    lazy_commands: Optional[LazyCommands] = None
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        if self.lazy_commands:
+            return self.lazy_commands.names()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and self.lazy_commands:
+            return self.lazy_commands.placeholder(cmd_name)
+        return command
+
+    def resolve_command(self, ctx: click.Context, args: List[str]):
+        if self.lazy_commands and args:
+            cmd_name = make_str(args[0])
+            if cmd_name not in self.commands:
+                # shell completion resolves commands outside of the context
+                with ctx.scope(cleanup=False):
+                    self.lazy_commands.load(cmd_name)
+        return super().resolve_command(ctx, args)
+
+
 class SnowCliMainTyper(typer.Typer):
     """
     Top-level SnowCLI Typer.
@@ -41,6 +75,7 @@ class SnowCliMainTyper(typer.Typer):
 
     def __init__(self):
         super().__init__(
+            cls=SnowCliMainGroup,
             context_settings=DEFAULT_CONTEXT_SETTINGS,
             pretty_exceptions_show_locals=False,
             add_completion=True,
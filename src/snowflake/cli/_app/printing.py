@@ -14,32 +14,58 @@
 
 from __future__ import annotations
 
+import csv
+import io
 import json
 import sys
-from datetime import date, datetime
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import chain, islice
 from json import JSONEncoder
 from pathlib import Path
 from textwrap import indent
-from typing import TextIO
+from typing import IO, Any, Callable, Dict, Iterator, List, Sequence, TextIO, Tuple
 
 from rich import box, get_console
 from rich import print as rich_print
-from rich.live import Live
+from rich.cells import cell_len, chop_cells, set_cell_size
 from rich.table import Table
 from snowflake.cli.api.cli_global_context import get_cli_context
+from snowflake.cli.api.config import (
+    CLI_SECTION,
+    get_config_bool_value,
+    get_config_positive_int_value,
+)
+from snowflake.cli.api.exceptions import CliError
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
+    ROW_BATCH_SIZE,
     CollectionResult,
     CommandResult,
     MessageResult,
     MultipleResults,
     ObjectResult,
+    QueryResult,
     StreamResult,
 )
 from snowflake.cli.api.sanitizers import sanitize_for_terminal
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.connector.constants import FIELD_ID_TO_NAME
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 NO_ITEMS_FOUND: str = "No data"
 
+OUTPUT_SECTION_PATH = [CLI_SECTION, "output"]
+TABLE_MAX_ROWS_KEY = "table_max_rows"
+JSON_COMPACT_KEY = "json_compact"
+# Number of rows used to lay out a table before the remaining rows are streamed
+TABLE_SAMPLE_ROWS = 1000
+
 # ensure we do not break URLs that wrap lines
 get_console().soft_wrap = True
 
@@ -47,21 +73,92 @@ get_console().soft_wrap = True
 get_console()._markup = False  # noqa: SLF001
 
 
+def _decimal_to_json(o: Decimal):
+    # Integral values, like most IDs, are written exactly
+    if o.is_finite() and o == o.to_integral_value():
+        return int(o)
+    return float(o)
+
+
+# Converters of the most common non-standard types, looked up by exact type
+# before falling back to isinstance checks
+_JSON_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    Decimal: _decimal_to_json,
+    bytes: bytes.hex,
+    bytearray: bytearray.hex,
+}
+
+
+def _to_json(o):
+    converter = _JSON_CONVERTERS.get(type(o))
+    if converter is not None:
+        return converter(o)
+    if isinstance(o, (ObjectResult, MessageResult)):
+        return o.result
+    if isinstance(o, (CollectionResult, MultipleResults)):
+        return list(o.result)
+    if isinstance(o, (date, datetime, time)):
+        return o.isoformat()
+    if isinstance(o, Decimal):
+        return _decimal_to_json(o)
+    if isinstance(o, (bytes, bytearray)):
+        return o.hex()
+    if isinstance(o, Path):
+        return str(o)
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
 class CustomJSONEncoder(JSONEncoder):
     """Custom JSON encoder handling serialization of non-standard types"""
 
     def default(self, o):
-        if isinstance(o, str):
-            return sanitize_for_terminal(o)
-        if isinstance(o, (ObjectResult, MessageResult)):
-            return o.result
-        if isinstance(o, (CollectionResult, MultipleResults)):
-            return list(o.result)
-        if isinstance(o, (date, datetime)):
-            return o.isoformat()
-        if isinstance(o, Path):
-            return str(o)
-        return super().default(o)
+        return _to_json(o)
+
+
+# Without indentation, encode() runs the C implementation of the json module
+_COMPACT_JSON_ENCODER = CustomJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_JSON_VALUE_ENCODER = CustomJSONEncoder()
+
+
+def _dumps_compact_json(o) -> str:
+    """
+    Serializes the object as compact JSON, using orjson if it is installed.
+    Values orjson cannot serialize (like integers over 64 bits) fall back to the json module.
+    """
+    if orjson is not None:
+        # Results can be read only once, so they are read before orjson may fail
+        o = _read_results(o)
+        try:
+            return orjson.dumps(
+                o,
+                default=_to_json,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _COMPACT_JSON_ENCODER.encode(o)
+
+
+def _read_results(o):
+    """Replaces command results, also nested in lists, with the values they hold."""
+    if isinstance(o, (ObjectResult, MessageResult, CollectionResult, MultipleResults)):
+        o = _to_json(o)
+    if isinstance(o, list):
+        return [_read_results(item) for item in o]
+    return o
+
+
+def is_compact_json() -> bool:
+    """
+    Returns whether JSON output is printed without indentation, as configured by
+    the cli.output.json_compact option (or SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT).
+    """
+    return bool(
+        get_config_bool_value(*OUTPUT_SECTION_PATH, key=JSON_COMPACT_KEY, default=False)
+    )
 
 
 def _get_format_type() -> OutputFormat:
@@ -75,22 +172,112 @@ def _get_table():
     return Table(show_header=True, box=box.ASCII)
 
 
+def get_table_max_rows() -> int | None:
+    """
+    Returns the maximum number of rows printed in a table, as configured by
+    the cli.output.table_max_rows option (or SNOWFLAKE_CLI_OUTPUT_TABLE_MAX_ROWS).
+    None means all rows are printed.
+    """
+    return get_config_positive_int_value(
+        *OUTPUT_SECTION_PATH, key=TABLE_MAX_ROWS_KEY, default=None
+    )
+
+
 def _print_multiple_table_results(obj: CollectionResult):
-    items = obj.result
-    try:
-        first_item = next(items)
-    except StopIteration:
+    items = iter(obj.result)
+    max_rows = get_table_max_rows()
+    rows = islice(items, max_rows) if max_rows is not None else items
+    sample = list(islice(rows, TABLE_SAMPLE_ROWS))
+    if not sample:
         rich_print(NO_ITEMS_FOUND, end="\n\n")
         return
-    table = _get_table()
-    for column in first_item.keys():
-        table.add_column(column, overflow="fold")
-    with Live(table, refresh_per_second=4):
-        table.add_row(*[str(i) for i in first_item.values()])
-        for item in items:
+    if len(sample) < TABLE_SAMPLE_ROWS:
+        table = _get_table()
+        for column in sample[0].keys():
+            table.add_column(column, overflow="fold")
+        for item in sample:
             table.add_row(*[str(i) for i in item.values()])
-    # Add separator between tables
-    rich_print(flush=True)
+        rich_print(table, flush=True)
+    else:
+        _print_streaming_table(sample, rows)
+    if max_rows is not None and next(items, None) is not None:
+        rich_print(
+            f"Output truncated to {max_rows} rows. "
+            f"Use {'.'.join((*OUTPUT_SECTION_PATH, TABLE_MAX_ROWS_KEY))} option to change the limit.",
+            flush=True,
+        )
+    # Add separator between tables, redirected output is kept without it
+    if get_console().is_terminal:
+        rich_print(flush=True)
+
+
+def _print_streaming_table(sample: List[dict], items: Iterator[dict]):
+    """
+    Prints rows as they are read, in the layout of _get_table. Column widths
+    are computed from the sample rows only, longer values are folded.
+    """
+    columns = [sanitize_for_terminal(str(c)) for c in sample[0].keys()]
+    widths = [cell_len(c) for c in columns]
+    for item in sample:
+        for i, value in enumerate(item.values()):
+            for line in _table_cell(value).splitlines():
+                widths[i] = max(widths[i], cell_len(line))
+    widths = _fit_column_widths(widths, get_console().width - 3 * len(widths) - 1)
+
+    stream = get_console().file
+    border = "+" + "-" * (sum(widths) + 3 * len(widths) - 1) + "+\n"
+    stream.write(border)
+    stream.write(_table_row_lines(columns, widths))
+    stream.write("|" + "+".join("-" * (w + 2) for w in widths) + "|\n")
+    rows = chain(sample, items)
+    for batch in iter(lambda: list(islice(rows, TABLE_SAMPLE_ROWS)), []):
+        stream.write(
+            "".join(
+                _table_row_lines([_table_cell(v) for v in item.values()], widths)
+                for item in batch
+            )
+        )
+        stream.flush()
+    stream.write(border)
+    stream.flush()
+
+
+def _table_cell(value) -> str:
+    return sanitize_for_terminal(str(value))
+
+
+def _fit_column_widths(widths: List[int], available: int) -> List[int]:
+    """Shrinks the widest columns until the table fits in the available width."""
+    widths = list(widths)
+    while sum(widths) > available and max(widths) > 1:
+        widest = max(widths)
+        index = widths.index(widest)
+        second = max((w for i, w in enumerate(widths) if i != index), default=1)
+        widths[index] = max(second, widest - (sum(widths) - available), 1)
+        if widths[index] == widest:
+            widths[index] -= 1
+    return widths
+
+
+def _table_row_lines(cells: List[str], widths: List[int]) -> str:
+    folded = [
+        [
+            part
+            for line in (cell.splitlines() or [""])
+            for part in chop_cells(line, width) or [""]
+        ]
+        for cell, width in zip(cells, widths)
+    ]
+    height = max(len(lines) for lines in folded)
+    return "".join(
+        "| "
+        + " | ".join(
+            set_cell_size(lines[i] if i < len(lines) else "", width)
+            for lines, width in zip(folded, widths)
+        )
+        + " |\n"
+        for i in range(height)
+    )
 
 
 def is_structured_format(output_format):
@@ -100,15 +287,26 @@ def is_structured_format(output_format):
 def print_structured(result: CommandResult):
     """Handles outputs like json, yml and other structured and parsable formats."""
     printed_end_line = False
+    compact = is_compact_json()
     if isinstance(result, MultipleResults):
-        _stream_json(result)
+        if compact:
+            _stream_compact_json(result)
+        else:
+            _stream_json(result)
     elif isinstance(result, StreamResult):
         # A StreamResult prints each value onto its own line
         # instead of joining all the values into a JSON array
         for r in result.result:
-            json.dump(r, sys.stdout, cls=CustomJSONEncoder)
+            if compact:
+                _write_compact_json(r, sys.stdout)
+            else:
+                json.dump(r, sys.stdout, cls=CustomJSONEncoder)
             print(flush=True)
             printed_end_line = True
+    elif compact:
+        _write_compact_json(result, sys.stdout)
+    elif _can_write_row_batches(result):
+        _write_json_rows(result, sys.stdout, indent_size=4)  # type: ignore
     else:
         json.dump(result, sys.stdout, cls=CustomJSONEncoder, indent=4)
     # Adds empty line at the end
@@ -131,12 +329,101 @@ def _stream_json(result):
     results = result.result
     res = next(results, None)
     while res:
-        json.dump(res, _Indented(sys.stdout), cls=CustomJSONEncoder, indent=indent_size)  # type: ignore
+        if _can_write_row_batches(res):
+            _write_json_rows(
+                res, sys.stdout, indent_size=indent_size, prefix=" " * indent_size
+            )
+        else:
+            json.dump(res, _Indented(sys.stdout), cls=CustomJSONEncoder, indent=indent_size)  # type: ignore
         if res := next(results, None):
             print(",")
     print("\n]")
 
 
+def _stream_compact_json(result: MultipleResults):
+    sys.stdout.write("[")
+    for index, res in enumerate(result.result):
+        if index:
+            sys.stdout.write(",")
+        _write_compact_json(res, sys.stdout)
+    sys.stdout.write("]")
+
+
+def _write_compact_json(result: CommandResult, stream: TextIO):
+    if not _can_write_row_batches(result):
+        stream.write(_dumps_compact_json(result))
+        return
+    stream.write("[")
+    separator = ""
+    for objects in _iter_compact_json_objects(
+        result.column_names, result.iter_row_batches()  # type: ignore
+    ):
+        if objects:
+            stream.write(separator + ",".join(objects))
+            separator = ","
+    stream.write("]")
+
+
+def _iter_compact_json_objects(
+    columns: List[str], batches: Iterator[Sequence[Sequence[Any]]]
+) -> Iterator[List[str]]:
+    """Yields batches of rows encoded as compact JSON objects."""
+    keys = [_dumps_compact_json(name) + ":" for name in columns]
+    for batch in batches:
+        yield [
+            "{"
+            + ",".join(key + _dumps_compact_json(v) for key, v in zip(keys, row))
+            + "}"
+            for row in batch
+        ]
+
+
+def _can_write_row_batches(result: CommandResult) -> bool:
+    # Rows with duplicated column names are merged into a single key of a dict,
+    # which is only reproduced by the per-row dict payload
+    return (
+        isinstance(result, QueryResult)
+        and result.supports_row_batches
+        and len(set(result.column_names)) == len(result.column_names)
+    )
+
+
+def _write_json_rows(
+    result: QueryResult, stream: TextIO, indent_size: int, prefix: str = ""
+):
+    """
+    Writes rows of a query result as a JSON array of objects, read in batches
+    from the cursor instead of building a dict for every row. The output is
+    the same as json.dump(result, indent=indent_size) with lines prefixed by prefix.
+    """
+    encoder = CustomJSONEncoder(indent=indent_size)
+    row_prefix = prefix + " " * indent_size
+    value_prefix = row_prefix + " " * indent_size
+    keys = [value_prefix + encoder.encode(name) + ": " for name in result.column_names]
+
+    def _encode(value) -> str:
+        if isinstance(value, (dict, list, tuple)):
+            return encoder.encode(value).replace("\n", "\n" + value_prefix)
+        # Other values are written the same without indentation
+        return _JSON_VALUE_ENCODER.encode(value)
+
+    stream.write(prefix + "[")
+    separator = "\n"
+    for batch in result.iter_row_batches():
+        chunk = []
+        for row in batch:
+            if keys:
+                fields = ",\n".join(
+                    key + _encode(value) for key, value in zip(keys, row)
+                )
+                chunk.append(f"{separator}{row_prefix}{{\n{fields}\n{row_prefix}}}")
+            else:
+                chunk.append(f"{separator}{row_prefix}{{}}")
+            separator = ",\n"
+        stream.write("".join(chunk))
+    stream.write("]" if separator == "\n" else f"\n{prefix}]")
+
+
 def print_unstructured(obj: CommandResult | None):
     """Handles outputs like table, plain text and other unstructured types."""
     if not obj:
@@ -165,13 +452,250 @@ def _print_single_table(obj):
     rich_print(table, flush=True)
 
 
+def _iter_tables(
+    result: CommandResult | None,
+) -> Iterator[Tuple[List[str], Iterator[Sequence[Sequence[Any]]], List[Any] | None]]:
+    """
+    Yields (column names, row batches, column metadata) for every tabular part of
+    the result, reading query results in batches from their cursors. Column metadata
+    is the description of the cursor for query results, None for other results.
+    """
+    if result is None:
+        return
+    if isinstance(result, (MultipleResults, StreamResult)):
+        for res in result.result:
+            yield from _iter_tables(res)
+    elif _can_write_row_batches(result):
+        query_result: QueryResult = result  # type: ignore
+        yield (
+            query_result.column_names,
+            query_result.iter_row_batches(),
+            query_result.description,
+        )
+    elif isinstance(result, CollectionResult):
+        items = iter(result.result)
+        first_item = next(items, None)
+        if first_item is None:
+            return
+        columns = list(first_item.keys())
+        rows = (tuple(item.get(c) for c in columns) for item in items)
+        yield columns, _batched([tuple(first_item.values())], rows), None
+    elif isinstance(result, (ObjectResult, MessageResult)):
+        item = result.result
+        if item is not None:
+            yield list(item.keys()), iter([[tuple(item.values())]]), None
+    else:
+        raise ValueError(f"Unexpected type {type(result)}")
+
+
+def _batched(first_batch: List[Tuple], rows: Iterator[Tuple]) -> Iterator[List[Tuple]]:
+    yield first_batch
+    yield from iter(lambda: list(islice(rows, ROW_BATCH_SIZE)), [])
+
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=CustomJSONEncoder)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _write_csv(result: CommandResult | None, stream: TextIO):
+    """Writes every table of the result as CSV, separated by empty lines."""
+    writer = csv.writer(stream, lineterminator="\n")
+    for index, (columns, batches, _) in enumerate(_iter_tables(result)):
+        if index:
+            stream.write("\n")
+        writer.writerow(columns)
+        for batch in batches:
+            writer.writerows([_csv_value(v) for v in row] for row in batch)
+    stream.flush()
+
+
+def _write_ndjson(result: CommandResult | None, stream: TextIO):
+    """Writes every row of the result as a compact JSON object on its own line."""
+    for columns, batches, _ in _iter_tables(result):
+        for objects in _iter_compact_json_objects(columns, batches):
+            stream.write("".join(f"{o}\n" for o in objects))
+    stream.flush()
+
+
+def _write_parquet(result: CommandResult | None, stream: IO[bytes]):
+    """
+    Writes the single table of the result as Parquet, one row group per batch.
+    Column types of query results are taken from the types of the result columns.
+    Otherwise, they are inferred from the values of all rows, widened so that every
+    value fits, which requires reading all rows before writing them.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise CliError(
+            "Parquet output format requires pyarrow. Install it with `pip install pyarrow`."
+        )
+
+    tables = _iter_tables(result)
+    columns, batches, description = next(tables, ([], iter([]), None))
+    column_types = [_parquet_type(pa, column) for column in description or []]
+    if description and None not in column_types:
+        schema = pa.schema(list(zip(columns, column_types)))
+        record_batches: Iterator[Any] = (
+            pa.RecordBatch.from_arrays(
+                [pa.array(c, type=t) for c, t in zip(zip(*batch), column_types)],
+                schema=schema,
+            )
+            for batch in batches
+        )
+    else:
+        inferred = [
+            pa.RecordBatch.from_arrays(
+                [pa.array(c) for c in zip(*batch)], names=columns
+            )
+            for batch in batches
+        ]
+        try:
+            schema = (
+                pa.unify_schemas(
+                    [b.schema for b in inferred], promote_options="permissive"
+                )
+                if inferred
+                else pa.schema([(c, pa.null()) for c in columns])
+            )
+        except pa.ArrowException as err:
+            raise CliError(f"Result cannot be written as Parquet: {err}")
+        record_batches = (b.cast(schema) for b in inferred)
+
+    if columns:
+        with pq.ParquetWriter(stream, schema) as writer:
+            for record_batch in record_batches:
+                writer.write_batch(record_batch)
+    if next(tables, None) is not None:
+        raise CliError("Parquet output format supports only a single result.")
+
+
+def _parquet_type(pa, column):
+    """
+    Returns the Parquet column type for values of the result column,
+    or None if the values of its Snowflake type have no fixed Parquet type.
+    """
+    type_name = FIELD_ID_TO_NAME.get(getattr(column, "type_code", None))
+    if type_name == "FIXED":
+        if column.precision is None:
+            return None
+        if not column.scale and column.precision <= 18:
+            return pa.int64()
+        return pa.decimal128(column.precision, column.scale or 0)
+    return {
+        "REAL": pa.float64(),
+        "TEXT": pa.string(),
+        "DATE": pa.date32(),
+        "TIMESTAMP_NTZ": pa.timestamp("us"),
+        "TIMESTAMP_LTZ": pa.timestamp("us", tz="UTC"),
+        "TIMESTAMP_TZ": pa.timestamp("us", tz="UTC"),
+        "TIME": pa.time64("us"),
+        "BOOLEAN": pa.bool_(),
+        "BINARY": pa.binary(),
+        # Semi-structured and geospatial values are read as JSON strings
+        "VARIANT": pa.string(),
+        "OBJECT": pa.string(),
+        "ARRAY": pa.string(),
+        "GEOGRAPHY": pa.string(),
+        "GEOMETRY": pa.string(),
+    }.get(type_name)
+
+
+_STREAMING_WRITERS = {
+    OutputFormat.CSV: _write_csv,
+    OutputFormat.NDJSON: _write_ndjson,
+}
+
+
+class _OutputFile:
+    """--output-file of a running command, opened when the first result is printed."""
+
+    def __init__(self):
+        self._exit_stack = ExitStack()
+        self._binary_stream: IO[bytes] | None = None
+        self._text_stream: io.TextIOWrapper | None = None
+        self.has_parquet = False
+
+    def binary_stream(self) -> IO[bytes]:
+        if self._binary_stream is None:
+            output_file = SecurePath(get_cli_context().output_file)  # type: ignore
+            self._binary_stream = self._exit_stack.enter_context(output_file.open("wb"))
+        return self._binary_stream  # type: ignore
+
+    def text_stream(self) -> TextIO:
+        if self._text_stream is None:
+            self._text_stream = io.TextIOWrapper(
+                self.binary_stream(), encoding="utf-8", newline="", write_through=True
+            )
+        return self._text_stream
+
+    def close(self):
+        if self._text_stream is not None:
+            self._text_stream.detach()
+        self._exit_stack.close()
+
+
+_output_files: List[_OutputFile] = []
+
+
+@contextmanager
+def keep_output_file_open() -> Iterator[None]:
+    """
+    Writes all results printed inside the block to a single --output-file stream,
+    closed when the block exits. Results printed while another one is being written,
+    like IDs of queries scheduled by snow sql, are added to the file in order
+    instead of truncating it.
+    """
+    output_file = _OutputFile()
+    _output_files.append(output_file)
+    try:
+        yield
+    finally:
+        _output_files.pop()
+        output_file.close()
+
+
 def print_result(cmd_result: CommandResult, output_format: OutputFormat | None = None):
     output_format = output_format or _get_format_type()
-    if is_structured_format(output_format):
+    if get_cli_context().output_file is None:
+        _print_result(cmd_result, output_format)
+    elif not _output_files:
+        with keep_output_file_open():
+            print_result(cmd_result, output_format)
+    elif output_format == OutputFormat.PARQUET:
+        output_file = _output_files[-1]
+        if output_file.has_parquet:
+            raise CliError("Parquet output format supports only a single result.")
+        output_file.has_parquet = True
+        _write_parquet(cmd_result, output_file.binary_stream())
+    else:
+        with redirect_stdout(_output_files[-1].text_stream()):
+            _print_result(cmd_result, output_format)
+
+
+def _print_result(cmd_result: CommandResult, output_format: OutputFormat):
+    if output_format in _STREAMING_WRITERS:
+        _STREAMING_WRITERS[output_format](cmd_result, sys.stdout)
+    elif output_format == OutputFormat.PARQUET:
+        if sys.stdout.isatty():
+            raise CliError(
+                "Parquet output cannot be printed to a terminal. Use --output-file option or redirect the output."
+            )
+        sys.stdout.flush()
+        _write_parquet(cmd_result, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    elif is_structured_format(output_format):
         print_structured(cmd_result)
     elif isinstance(cmd_result, (MultipleResults, StreamResult)):
         for res in cmd_result.result:
-            print_result(res)
+            _print_result(res, output_format)
     elif (
         isinstance(cmd_result, (MessageResult, ObjectResult, CollectionResult))
         or cmd_result is None
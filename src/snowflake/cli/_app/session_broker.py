@@ -0,0 +1,414 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local process logging in Snowflake sessions ahead of time for short-lived CLI invocations.
+
+When the cli.session_broker.enabled option is set, connect_to_snowflake asks the broker,
+listening on a Unix socket, for a session of a configured connection. Connection parameters
+and secrets are never sent to the broker: it resolves the parameters of the connection
+itself, from the same config file and environment, and only hands over a session if they
+match the parameters resolved by the invocation. Parameters are compared by their HMAC
+with a random key of the broker, which it stores next to the socket, readable only by
+the current user, so the identity sent over the socket does not reveal any secrets. The broker hands over the
+session and master tokens of a session it has already logged in, and logs in the next one
+in the background. The invocation then owns the session and logs it out when it finishes,
+so sessions are never shared between invocations. The broker is started on first use and
+exits after being idle for cli.session_broker.idle_timeout seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+
+from snowflake.cli.api.config import (
+    CLI_SECTION,
+    config_init,
+    get_config_bool_value,
+    get_config_value,
+)
+from snowflake.cli.api.connections import INTERACTIVE_AUTHENTICATORS
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.compat import IS_WINDOWS
+from snowflake.connector.config_manager import CONFIG_MANAGER
+
+log = logging.getLogger(__name__)
+
+SESSION_BROKER_SECTION_PATH = [CLI_SECTION, "session_broker"]
+SESSION_BROKER_ENABLED_KEY = "enabled"
+SESSION_BROKER_IDLE_TIMEOUT_KEY = "idle_timeout"
+SESSION_BROKER_DEFAULT_IDLE_TIMEOUT_SEC = 10.0 * 60
+SESSION_BROKER_SOCKET_NAME = "session_broker.sock"
+SESSION_BROKER_KEY_SUFFIX = ".key"
+SESSION_BROKER_KEY_BYTES = 32
+
+CONNECT_TIMEOUT_SEC = 0.5
+LEASE_TIMEOUT_SEC = 120.0
+
+
+def is_session_broker_enabled() -> bool:
+    if IS_WINDOWS or getattr(sys, "frozen", False):
+        return False
+    return bool(
+        get_config_bool_value(
+            *SESSION_BROKER_SECTION_PATH, key=SESSION_BROKER_ENABLED_KEY, default=False
+        )
+    )
+
+
+def get_session_broker_idle_timeout() -> float:
+    value = get_config_value(
+        *SESSION_BROKER_SECTION_PATH,
+        key=SESSION_BROKER_IDLE_TIMEOUT_KEY,
+        default=SESSION_BROKER_DEFAULT_IDLE_TIMEOUT_SEC,
+    )
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        log.debug("Ignoring invalid session broker idle timeout %r", value)
+        return SESSION_BROKER_DEFAULT_IDLE_TIMEOUT_SEC
+
+
+def session_broker_socket_path() -> Optional[Path]:
+    config_file_path = CONFIG_MANAGER.file_path
+    if config_file_path is None:
+        return None
+    return config_file_path.parent / SESSION_BROKER_SOCKET_NAME
+
+
+def session_broker_key_path(socket_path: Path) -> Path:
+    return socket_path.with_suffix(SESSION_BROKER_KEY_SUFFIX)
+
+
+def can_be_brokered(connection_parameters: Dict) -> bool:
+    authenticator = str(connection_parameters.get("authenticator", "")).lower()
+    return (
+        # authenticators which need user interaction cannot be used by the broker
+        authenticator not in INTERACTIVE_AUTHENTICATORS
+        and "passcode" not in connection_parameters
+        and "session_token" not in connection_parameters
+        and "master_token" not in connection_parameters
+    )
+
+
+def connection_identity(connection_parameters: Dict, key: bytes) -> str:
+    """
+    HMAC of the connection parameters with the key of the broker, sent to the broker
+    instead of them.
+    """
+    return hmac.new(
+        key,
+        json.dumps(connection_parameters, sort_keys=True, default=str).encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def lease_session(
+    connection_name: str, connection_parameters: Dict
+) -> Optional[Dict[str, str]]:
+    """
+    Returns the session and master tokens of a session logged in by the broker for
+    the connection, or None if the broker could not provide one with the same
+    connection parameters. Starts the broker if it is not running, so that later
+    invocations can use it.
+    """
+    socket_path = session_broker_socket_path()
+    if socket_path is None:
+        return None
+    try:
+        key = session_broker_key_path(socket_path).read_bytes()
+        request = {
+            "connection_name": connection_name,
+            "identity": connection_identity(connection_parameters, key),
+        }
+        response = _send_request(socket_path, request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        log.debug("Session broker is not running, starting it")
+        _start_broker(socket_path, connection_name)
+        return None
+    except (OSError, ValueError) as err:
+        log.debug("Could not get session from session broker: %s", err)
+        return None
+
+    if "error" in response:
+        log.debug("Session broker could not provide a session: %s", response["error"])
+        return None
+    return {
+        "session_token": response["session_token"],
+        "master_token": response["master_token"],
+    }
+
+
+def _send_request(socket_path: Path, request: Dict) -> Dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT_SEC)
+        client.connect(str(socket_path))
+        client.settimeout(LEASE_TIMEOUT_SEC)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def _start_broker(socket_path: Path, connection_name: str) -> None:
+    """
+    Starts the broker in a new session, so that it outlives this process and does not
+    receive signals sent to the terminal. The broker reads the same config file, and
+    logs in the first session of the connection before it is asked for it.
+    """
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                __name__,
+                str(socket_path),
+                str(get_session_broker_idle_timeout()),
+                str(CONFIG_MANAGER.file_path),
+                connection_name,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as err:
+        log.debug("Could not start session broker: %s", err)
+
+
+def _resolve_connection_parameters(connection_name: str) -> Dict:
+    from snowflake.cli._app.snow_connector import resolve_connection_parameters
+
+    return resolve_connection_parameters(connection_name=connection_name)
+
+
+def _log_in(connection_parameters: Dict) -> SnowflakeConnection:
+    import snowflake.connector
+    from snowflake.cli._app.constants import PARAM_APPLICATION_NAME
+    from snowflake.cli._app.snow_connector import (
+        update_connection_details_with_private_key,
+    )
+
+    connection_parameters = dict(connection_parameters)
+    update_connection_details_with_private_key(connection_parameters)
+    # Handing the session over must not log it out
+    connection_parameters["server_session_keep_alive"] = True
+    return snowflake.connector.connect(
+        application=f"{PARAM_APPLICATION_NAME}.SESSION_BROKER",
+        **connection_parameters,
+    )
+
+
+class SessionBroker:
+    """
+    Keeps one logged-in session ready for every connection it was asked for.
+    Ready sessions which are not leased within idle_timeout are logged out.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float,
+        resolve_connection_parameters: Callable[
+            [str], Dict
+        ] = _resolve_connection_parameters,
+        log_in: Callable[[Dict], SnowflakeConnection] = _log_in,
+    ) -> None:
+        self.key = secrets.token_bytes(SESSION_BROKER_KEY_BYTES)
+        self._idle_timeout = idle_timeout
+        self._resolve_connection_parameters = resolve_connection_parameters
+        self._log_in = log_in
+        self._lock = threading.Lock()
+        self._ready: Dict[str, SnowflakeConnection] = {}
+        self._last_used: Dict[str, float] = {}
+        self._logging_in: Set[str] = set()
+        self.last_activity = time.monotonic()
+
+    def lease(self, connection_name: str, identity: str) -> Dict[str, str]:
+        """
+        Hands over the ready session for the connection (logging one in if there is
+        none yet) and starts logging in the next one in the background. Fails if the
+        connection parameters known to the broker do not have the given identity.
+        """
+        connection_parameters = self._resolve_connection_parameters(connection_name)
+        if not hmac.compare_digest(
+            connection_identity(connection_parameters, self.key), identity
+        ):
+            raise ValueError(
+                f"Parameters of connection {connection_name} differ from the ones of the invocation"
+            )
+        with self._lock:
+            self.last_activity = self._last_used[identity] = time.monotonic()
+            connection = self._ready.pop(identity, None)
+        if connection is None:
+            connection = self._log_in(connection_parameters)
+        self._prepare_in_background(identity, connection_parameters)
+
+        rest = connection.rest
+        if rest is None or rest.token is None or rest.master_token is None:
+            raise ValueError("Session has no session and master tokens")
+        tokens = {"session_token": rest.token, "master_token": rest.master_token}
+        # The session is kept alive on the server, only the local resources are released
+        connection.close()
+        return tokens
+
+    def prepare(self, connection_name: str) -> None:
+        """Logs in a session for the connection in the background."""
+        connection_parameters = self._resolve_connection_parameters(connection_name)
+        self._prepare_in_background(
+            connection_identity(connection_parameters, self.key), connection_parameters
+        )
+
+    def _prepare_in_background(self, key: str, connection_parameters: Dict) -> None:
+        with self._lock:
+            if key in self._ready or key in self._logging_in:
+                return
+            self._logging_in.add(key)
+            self._last_used.setdefault(key, time.monotonic())
+        threading.Thread(
+            target=self._prepare, args=(key, connection_parameters), daemon=True
+        ).start()
+
+    def _prepare(self, key: str, connection_parameters: Dict) -> None:
+        try:
+            connection = self._log_in(connection_parameters)
+        except Exception as err:
+            log.debug("Session broker could not log in: %s", err)
+            return
+        finally:
+            with self._lock:
+                self._logging_in.discard(key)
+        with self._lock:
+            self._ready[key] = connection
+
+    def expire_idle_sessions(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key
+                for key in self._ready
+                if now - self._last_used.get(key, now) > self._idle_timeout
+            ]
+            connections = [self._ready.pop(key) for key in expired]
+        for connection in connections:
+            _log_out(connection)
+
+    def is_idle(self) -> bool:
+        with self._lock:
+            return (
+                not self._logging_in
+                and time.monotonic() - self.last_activity > self._idle_timeout
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._ready.values())
+            self._ready.clear()
+        for connection in connections:
+            _log_out(connection)
+
+
+def _log_out(connection: SnowflakeConnection) -> None:
+    try:
+        if connection.rest is not None:
+            connection.rest.delete_session()
+        connection.close()
+    except Exception as err:
+        log.debug("Could not log out session: %s", err)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        broker: SessionBroker = self.server.broker  # type: ignore[attr-defined]
+        try:
+            request = json.loads(self.rfile.readline())
+            response = broker.lease(request["connection_name"], request["identity"])
+        except Exception as err:
+            response = {"error": str(err)}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class _SessionBrokerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, broker: SessionBroker):
+        self.broker = broker
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def serve(socket_path: Path, broker: SessionBroker, poll_interval: float = 1.0):
+    """
+    Serves lease requests on the socket until the broker is idle. The socket and the
+    key of the broker are only accessible by the current user. Returns immediately if
+    another broker is running.
+    """
+    if socket_path.exists():
+        try:
+            _send_request(socket_path, {})
+            return
+        except ConnectionRefusedError:
+            # left behind by a broker which did not exit cleanly
+            socket_path.unlink()
+        except (OSError, ValueError):
+            return
+
+    key_path = session_broker_key_path(socket_path)
+    old_umask = os.umask(0o077)
+    try:
+        key_path.unlink(missing_ok=True)
+        key_fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(key_fd, "wb") as key_file:
+            key_file.write(broker.key)
+        server = _SessionBrokerServer(socket_path, broker)
+    finally:
+        os.umask(old_umask)
+
+    def stop_when_idle():
+        while not broker.is_idle():
+            time.sleep(poll_interval)
+            broker.expire_idle_sessions()
+        server.shutdown()
+
+    threading.Thread(target=stop_when_idle, daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=poll_interval)
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        key_path.unlink(missing_ok=True)
+        broker.close()
+
+
+def main(argv):
+    socket_path, idle_timeout = Path(argv[1]), float(argv[2])
+    config_file, connection_name = Path(argv[3]), argv[4]
+    config_init(config_file)
+    broker = SessionBroker(idle_timeout=idle_timeout)
+    broker.prepare(connection_name)
+    serve(socket_path, broker)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -17,6 +17,7 @@ from __future__ import annotations
 import contextlib
 import logging
 import os
+import threading
 from typing import Dict, Optional
 
 import snowflake.connector
@@ -26,6 +27,11 @@ from snowflake.cli._app.constants import (
     INTERNAL_APPLICATION_NAME,
     PARAM_APPLICATION_NAME,
 )
+from snowflake.cli._app.session_broker import (
+    can_be_brokered,
+    is_session_broker_enabled,
+    lease_session,
+)
 from snowflake.cli._app.telemetry import command_info
 from snowflake.cli.api.config import (
     get_connection_dict,
@@ -113,16 +119,70 @@ def connect_to_snowflake(
         temporary_connection, using_session_token, using_master_token
     )
 
-    connection_parameters = {}
+    connection_parameters = resolve_connection_parameters(
+        connection_name=connection_name, **overrides
+    )
+
+    brokered_session = None
+    if (
+        connection_name
+        and is_session_broker_enabled()
+        and not mfa_passcode
+        and not enable_diag
+        and can_be_brokered(connection_parameters)
+    ):
+        brokered_session = lease_session(connection_name, connection_parameters)
+
+    update_connection_details_with_private_key(connection_parameters)
+
+    if mfa_passcode:
+        connection_parameters["passcode"] = mfa_passcode
+
+    if connection_parameters.get("authenticator") == "username_password_mfa":
+        connection_parameters["client_request_mfa_token"] = True
+
+    if enable_diag:
+        connection_parameters["enable_connection_diag"] = enable_diag
+        if diag_log_path:
+            connection_parameters["connection_diag_log_path"] = diag_log_path
+        if diag_allowlist_path:
+            connection_parameters[
+                "connection_diag_allowlist_path"
+            ] = diag_allowlist_path
+
+    # Make sure the connection is not closed if it was shared to the SnowCLI, instead of being created in the SnowCLI
+    _avoid_closing_the_connection_if_it_was_shared(
+        using_session_token, using_master_token, connection_parameters
+    )
+
+    if brokered_session:
+        try:
+            return _connect({**connection_parameters, **brokered_session})
+        except DatabaseError as err:
+            log.debug("Could not use session from session broker: %s", err)
+
+    try:
+        return _connect(connection_parameters)
+    except ForbiddenError as err:
+        raise SnowflakeConnectionError(err)
+    except DatabaseError as err:
+        raise InvalidConnectionConfigurationError(err.msg)
+
+
+def resolve_connection_parameters(
+    connection_name: Optional[str] = None, **overrides
+) -> Dict:
+    """
+    Returns parameters of the named connection (or of a temporary connection if there
+    is no name) with the overrides and generic environment variables applied.
+    """
+    connection_parameters: Dict = {}
     if connection_name:
         connection_parameters = {
             _resolve_alias(k): v
             for k, v in get_connection_dict(connection_name).items()
         }
 
-    elif temporary_connection:
-        connection_parameters = {}  # we will apply overrides in next step
-
     connection_parameters["using_session_keep_alive"] = True
 
     # Apply overrides to connection details
@@ -144,46 +204,30 @@ def connect_to_snowflake(
         k: v for k, v in connection_parameters.items() if v is not None
     }
 
-    update_connection_details_with_private_key(connection_parameters)
-
-    if mfa_passcode:
-        connection_parameters["passcode"] = mfa_passcode
-
-    if connection_parameters.get("authenticator") == "username_password_mfa":
-        connection_parameters["client_request_mfa_token"] = True
-
-    if enable_diag:
-        connection_parameters["enable_connection_diag"] = enable_diag
-        if diag_log_path:
-            connection_parameters["connection_diag_log_path"] = diag_log_path
-        if diag_allowlist_path:
-            connection_parameters[
-                "connection_diag_allowlist_path"
-            ] = diag_allowlist_path
-
-    # Make sure the connection is not closed if it was shared to the SnowCLI, instead of being created in the SnowCLI
-    _avoid_closing_the_connection_if_it_was_shared(
-        using_session_token, using_master_token, connection_parameters
-    )
-
     _update_connection_application_name(connection_parameters)
 
     _update_internal_application_info(connection_parameters)
 
-    try:
-        # Whatever output is generated when creating connection,
-        # we don't want it in our output. This is particularly important
-        # for cases when external browser and json format are used.
-        # Redirecting both stdout and stderr for offline usage.
-        with contextlib.redirect_stdout(None), contextlib.redirect_stderr(None):
-            return snowflake.connector.connect(
-                application=command_info(),
-                **connection_parameters,
-            )
-    except ForbiddenError as err:
-        raise SnowflakeConnectionError(err)
-    except DatabaseError as err:
-        raise InvalidConnectionConfigurationError(err.msg)
+    return connection_parameters
+
+
+def _connect(connection_parameters: Dict) -> SnowflakeConnection:
+    # Whatever output is generated when creating connection,
+    # we don't want it in our output. This is particularly important
+    # for cases when external browser and json format are used.
+    # Redirecting both stdout and stderr for offline usage.
+    # Redirecting is process-wide, so it must not be done by logins in the background
+    # which would hide the output of the command. Those never need user interaction
+    # (see OpenConnectionCache.connect_in_background), so they print nothing.
+    silenced_output = contextlib.ExitStack()
+    if threading.current_thread() is threading.main_thread():
+        silenced_output.enter_context(contextlib.redirect_stdout(None))
+        silenced_output.enter_context(contextlib.redirect_stderr(None))
+    with silenced_output:
+        return snowflake.connector.connect(
+            application=command_info(),
+            **connection_parameters,
+        )
 
 
 def _avoid_closing_the_connection_if_it_was_shared(
@@ -18,7 +18,7 @@ import os
 import platform
 import sys
 from enum import Enum, unique
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 import click
 import typer
@@ -203,6 +203,15 @@ def python_version() -> str:
 
 
 class CLITelemetryClient:
+    """
+    Collects telemetry events of a command and sends them when flushed.
+    Events are not added to the connection's batch right away, so that logging them
+    at the start of a command does not wait for a connection opened in the background.
+    """
+
+    def __init__(self):
+        self._pending: List[TelemetryData] = []
+
     @property
     def _ctx(self) -> _CliGlobalContextAccess:
         return get_cli_context()
@@ -232,15 +241,19 @@ class CLITelemetryClient:
         return self._ctx.connection._telemetry  # noqa
 
     def send(self, payload: TelemetryDict):
-        if self._telemetry:
-            message = self.generate_telemetry_data_dict(payload)
-            telemetry_data = TelemetryData.from_telemetry_data_dict(
+        message = self.generate_telemetry_data_dict(payload)
+        self._pending.append(
+            TelemetryData.from_telemetry_data_dict(
                 from_dict=message, timestamp=get_time_millis()
             )
-            self._telemetry.try_add_log_to_batch(telemetry_data)
+        )
 
     def flush(self):
-        self._telemetry.send_batch()
+        pending, self._pending = self._pending, []
+        if self._telemetry:
+            for telemetry_data in pending:
+                self._telemetry.try_add_log_to_batch(telemetry_data)
+            self._telemetry.send_batch()
 
 
 _telemetry = CLITelemetryClient()
@@ -98,7 +98,7 @@ def _mask_sensitive_parameters(connection_params: dict):
     return connection_params
 
 
-@app.command(name="list")
+@app.command(name="list", supports_output_file=True)
 def list_connections(**options) -> CommandResult:
     """
     Lists configured connections.
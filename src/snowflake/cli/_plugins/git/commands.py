@@ -223,6 +223,7 @@ def setup(
 @app.command(
     "list-branches",
     requires_connection=True,
+    supports_output_file=True,
 )
 def list_branches(
     repository_name: FQN = RepoNameArgument,
@@ -242,6 +243,7 @@ def list_branches(
 @app.command(
     "list-tags",
     requires_connection=True,
+    supports_output_file=True,
 )
 def list_tags(
     repository_name: FQN = RepoNameArgument,
@@ -261,6 +263,7 @@ def list_tags(
 @app.command(
     "list-files",
     requires_connection=True,
+    supports_output_file=True,
 )
 def list_files(
     repository_path: str = RepoPathArgument,
@@ -125,7 +125,7 @@ def app_diff(
     return None
 
 
-@app.command("run", requires_connection=True)
+@app.command("run", requires_connection=True, connect_early=True)
 @with_project_definition()
 @force_project_definition_v2(app_required=True)
 def app_run(
@@ -289,7 +289,7 @@ def app_teardown(
     return MessageResult(f"Teardown is now complete.")
 
 
-@app.command("deploy", requires_connection=True)
+@app.command("deploy", requires_connection=True, connect_early=True)
 @with_project_definition()
 @force_project_definition_v2()
 def app_deploy(
@@ -357,7 +357,7 @@ def app_deploy(
     )
 
 
-@app.command("validate", requires_connection=True)
+@app.command("validate", requires_connection=True, connect_early=True)
 @with_project_definition()
 @force_project_definition_v2()
 def app_validate(
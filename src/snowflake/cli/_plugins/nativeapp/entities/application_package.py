@@ -67,6 +67,7 @@ from snowflake.cli._plugins.stage.manager import (
     StageManager,
     StagePathParts,
 )
+from snowflake.cli._plugins.stage.md5_cache import Md5Cache
 from snowflake.cli._plugins.stage.utils import print_diff_to_console
 from snowflake.cli._plugins.streamlit.streamlit_entity_model import (
     StreamlitEntityModel,
@@ -299,6 +300,7 @@ class ApplicationPackageEntity(EntityBase[ApplicationPackageEntityModel]):
         diff = compute_stage_diff(
             local_root=self.deploy_root,
             stage_path=self.stage_path,
+            md5_cache=Md5Cache.for_project(self.project_root),
         )
 
         if print_to_console:
@@ -136,6 +136,7 @@ class SnowflakeSQLFacade:
                 if err.errno == DOES_NOT_EXIST_OR_CANNOT_BE_PERFORMED:
                     raise CouldNotUseObjectError(object_type, name) from err
             handle_unclassified_error(err, f"Failed to use {object_type} {name}.")
+        self._sql_executor.record_session_object(object_type.value, name)
 
     @contextmanager
     def _use_object_optional(self, object_type: UseObjectType, name: str | None):
@@ -149,19 +150,12 @@ class SnowflakeSQLFacade:
             return
 
         try:
-            current_obj_result_row = self._sql_executor.execute_query(
-                f"select current_{object_type}()"
-            ).fetchone()
+            prev_obj = self._sql_executor.current_object(object_type.value)
         except Exception as err:
             return handle_unclassified_error(
                 err, f"Failed to select current {object_type}."
             )
 
-        try:
-            prev_obj = current_obj_result_row[0]
-        except IndexError:
-            prev_obj = None
-
         if prev_obj is not None and same_identifiers(prev_obj, name):
             yield
             return
@@ -174,6 +168,7 @@ class SnowflakeSQLFacade:
             if prev_obj is not None:
                 self._log.debug(f"Switching back to {object_type}: {prev_obj}")
                 self._use_object(object_type, prev_obj)
+                self._sql_executor.restore_session_object(object_type.value, prev_obj)
 
     def _use_warehouse_optional(self, new_wh: str | None):
         """
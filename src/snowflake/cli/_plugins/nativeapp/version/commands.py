@@ -47,7 +47,7 @@ app = SnowTyperFactory(
 log = logging.getLogger(__name__)
 
 
-@app.command(requires_connection=True)
+@app.command(requires_connection=True, connect_early=True)
 @with_project_definition()
 @force_project_definition_v2()
 def create(
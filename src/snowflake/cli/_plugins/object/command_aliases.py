@@ -46,7 +46,7 @@ def add_object_command_aliases(
 
         if not scope_option:
 
-            @app.command("list", requires_connection=True)
+            @app.command("list", requires_connection=True, supports_output_file=True)
             def list_cmd(like: str = like_option, **options):  # type: ignore
                 return list_(
                     object_type=object_type.value.cli_name,
@@ -57,7 +57,7 @@ def add_object_command_aliases(
 
         else:
 
-            @app.command("list", requires_connection=True)
+            @app.command("list", requires_connection=True, supports_output_file=True)
             def list_cmd(
                 like: str = like_option,  # type: ignore
                 scope: Tuple[str, str] = scope_option,  # type: ignore
@@ -86,7 +86,7 @@ def add_object_command_aliases(
 
     if "describe" not in ommit_commands:
 
-        @app.command("describe", requires_connection=True)
+        @app.command("describe", requires_connection=True, supports_output_file=True)
         def describe_cmd(name: FQN = name_argument, **options):
             return describe(
                 object_type=object_type.value.cli_name,
@@ -105,6 +105,7 @@ SUPPORTED_TYPES_MSG = "\n\nSupported types: " + ", ".join(SUPPORTED_OBJECTS)
     "list",
     help=f"Lists all available Snowflake objects of given type.{SUPPORTED_TYPES_MSG}",
     requires_connection=True,
+    supports_output_file=True,
 )
 def list_(
     object_type: str = ObjectArgument,
@@ -133,6 +134,7 @@ DESCRIBE_SUPPORTED_TYPES_MSG = f"\n\nSupported types: {', '.join(obj for obj in
 @app.command(
     help=f"Provides description of an object of given type. {DESCRIBE_SUPPORTED_TYPES_MSG}",
     requires_connection=True,
+    supports_output_file=True,
 )
 def describe(
     object_type: str = ObjectArgument, object_name: FQN = NameArgument, **options
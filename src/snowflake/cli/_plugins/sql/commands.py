@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import List, Optional
 
 import typer
-from snowflake.cli._plugins.sql.manager import SqlManager
+from snowflake.cli._plugins.sql.manager import UNKNOWN_RESULTS_COUNT, SqlManager
 from snowflake.cli.api.commands.decorators import with_project_definition
 from snowflake.cli.api.commands.flags import (
     variables_option,
@@ -43,7 +43,12 @@ SourceOption = OverrideableOption(
 )
 
 
-@app.command(name="sql", requires_connection=True, no_args_is_help=False)
+@app.command(
+    name="sql",
+    requires_connection=True,
+    no_args_is_help=False,
+    supports_output_file=True,
+)
 @with_project_definition(is_optional=True)
 def execute_sql(
     query: Optional[str] = SourceOption(
@@ -74,6 +79,21 @@ def execute_sql(
         "--retain-comments",
         help="Retains comments in queries passed to Snowflake",
     ),
+    stream: Optional[bool] = typer.Option(
+        False,
+        "--stream",
+        help="Executes statements one by one as they are read and rendered, instead of "
+        "reading and rendering the whole input first. Results of every statement are "
+        "reported separately, and rendering errors stop the execution when reached.",
+    ),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        min=1,
+        help="Maximum number of queries running at the same time. Queries are submitted "
+        "asynchronously and their results are reported in the order of statements. "
+        "Use `!wait` between statements to wait for all submitted queries to finish.",
+    ),
     **options,
 ) -> CommandResult:
     """
@@ -108,8 +128,17 @@ def execute_sql(
         sys.exit(0)
 
     expected_results_cnt, cursors = SqlManager().execute(
-        query, files, std_in, data=data, retain_comments=retain_comments
+        query,
+        files,
+        std_in,
+        data=data,
+        retain_comments=retain_comments,
+        stream=bool(stream),
+        parallel=parallel,
     )
+    if expected_results_cnt == UNKNOWN_RESULTS_COUNT:
+        return MultipleResults((QueryResult(c) for c in cursors))
+
     if expected_results_cnt == 0:
         # case expected if input only scheduled async queries
         list(cursors)  # evaluate the result to schedule potential async queries
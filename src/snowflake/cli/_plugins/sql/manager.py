@@ -15,15 +15,19 @@
 from __future__ import annotations
 
 import logging
+import re
 import sys
+from collections import deque
 from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Deque, Dict, Generator, Iterable, List, Tuple
 
 from snowflake.cli._app.printing import print_result
 from snowflake.cli._plugins.sql.snowsql_templating import transpile_snowsql_templates
 from snowflake.cli._plugins.sql.statement_reader import (
     CompiledStatement,
+    RecursiveStatementReader,
+    compile_statement,
     compile_statements,
     files_reader,
     query_reader,
@@ -32,15 +36,32 @@ from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console import cli_console
 from snowflake.cli.api.exceptions import CliArgumentError, CliSqlError
 from snowflake.cli.api.output.types import CollectionResult
+from snowflake.cli.api.project.util import to_string_literal
 from snowflake.cli.api.rendering.sql_templates import snowflake_sql_jinja_render
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutionMixin, VerboseCursor
+from snowflake.connector import ProgrammingError
 from snowflake.connector.cursor import SnowflakeCursor
 
 ExpectedResultsCount = int
+# Number of expected results is not known upfront when statements are streamed
+UNKNOWN_RESULTS_COUNT: ExpectedResultsCount = -1
 
 logger = logging.getLogger(__name__)
 
+# Statements which can't run concurrently with others: file transfers, and statements
+# changing the session, like the current objects, variables, transactions or temporary objects
+_SYNCHRONOUS_STATEMENT = re.compile(
+    r"\s*(put|get|use|set|unset|begin|start\s+transaction|commit|rollback"
+    r"|alter\s+session"
+    r"|create\s+(or\s+replace\s+)?((local|global)\s+)?(temp|temporary|volatile))\b",
+    re.IGNORECASE,
+)
+
+
+def _runs_synchronously(statement: str) -> bool:
+    return _SYNCHRONOUS_STATEMENT.match(statement) is not None
+
 
 class SqlManager(SqlExecutionMixin):
     def execute(
@@ -50,6 +71,8 @@ class SqlManager(SqlExecutionMixin):
         std_in: bool,
         data: Dict | None = None,
         retain_comments: bool = False,
+        stream: bool = False,
+        parallel: int = 1,
     ) -> Tuple[ExpectedResultsCount, Iterable[SnowflakeCursor]]:
         """Reads, transforms and execute statements from input.
 
@@ -57,6 +80,17 @@ class SqlManager(SqlExecutionMixin):
         When no compilation errors are detected, the sequence on queries
         in executed and returned as tuple.
 
+        With stream=True statements are read, rendered and executed one by one,
+        while the returned cursors are consumed. The number of expected results
+        is then UNKNOWN_RESULTS_COUNT, and compilation errors are raised when
+        the failing statement is reached.
+
+        With parallel > 1 queries are submitted asynchronously, with at most
+        `parallel` of them running at the same time. SnowSQL commands, including
+        `!wait`, file transfers and statements changing the session are barriers:
+        all submitted queries are finished first, then they are executed synchronously.
+        Cursors are returned in the order of statements.
+
         Throws an exception ff multiple inputs are provided.
         """
         query = sys.stdin.read() if std_in else query
@@ -75,37 +109,124 @@ class SqlManager(SqlExecutionMixin):
         else:
             raise CliArgumentError("Use either query, filename or input option.")
 
-        errors, expected_results_cnt, compiled_statements = compile_statements(
-            stmt_reader
-        )
-        if not any((errors, expected_results_cnt, compiled_statements)):
-            raise CliArgumentError("Use either query, filename or input option.")
-
-        if errors:
-            for error in errors:
-                logger.info("Statement compilation error: %s", error)
-                cli_console.warning(error)
-            raise CliSqlError("SQL rendering error")
+        if parallel < 1:
+            raise CliArgumentError("Parallel must be greater than 0.")
 
         cursor_class = SnowflakeCursor if get_cli_context().is_repl else VerboseCursor
+        compiled_statements: Iterable[CompiledStatement]
+        if stream:
+            expected_results_cnt = UNKNOWN_RESULTS_COUNT
+            compiled_statements = self._stream_compiled_statements(stmt_reader)
+        else:
+            errors, expected_results_cnt, compiled_statements = compile_statements(
+                stmt_reader
+            )
+            if not any((errors, expected_results_cnt, compiled_statements)):
+                raise CliArgumentError("Use either query, filename or input option.")
+
+            if errors:
+                self._raise_compilation_errors(errors)
+
+        if parallel > 1:
+            return expected_results_cnt, self._execute_compiled_statements_in_parallel(
+                compiled_statements, cursor_class=cursor_class, parallel=parallel
+            )
         return expected_results_cnt, self._execute_compiled_statements(
-            compiled_statements,
-            cursor_class=cursor_class,
+            compiled_statements, cursor_class=cursor_class
         )
 
+    @staticmethod
+    def _raise_compilation_errors(errors: List[str]):
+        for error in errors:
+            logger.info("Statement compilation error: %s", error)
+            cli_console.warning(error)
+        raise CliSqlError("SQL rendering error")
+
+    def _stream_compiled_statements(
+        self, stmt_reader: RecursiveStatementReader
+    ) -> Generator[CompiledStatement, None, None]:
+        for stmt in stmt_reader:
+            errors, compiled_statement = compile_statement(stmt)
+            if errors:
+                self._raise_compilation_errors(errors)
+            if compiled_statement is not None:
+                yield compiled_statement
+
     def _execute_compiled_statements(
-        self, compiled_statements: List[CompiledStatement], cursor_class
+        self, compiled_statements: Iterable[CompiledStatement], cursor_class
     ) -> Iterable[SnowflakeCursor]:
+        # User statements may change the current role, warehouse, database or schema
+        self.invalidate_session_state()
         for stmt in compiled_statements:
             if stmt.execute_async:
-                cursor = self._conn.cursor(cursor_class=cursor_class)
-                cursor.execute(stmt.statement, _no_results=True)
-                # only log query ID for consistency with SnowSQL
-                logger.info("Async execution id: %s", cursor.sfqid)
-                print_result(CollectionResult([{"scheduled query ID": cursor.sfqid}]))
+                self._schedule_async_statement(stmt, cursor_class)
             elif stmt.statement:
                 yield from self.execute_string(
                     stmt.statement, cursor_class=cursor_class
                 )
             if stmt.command:
                 stmt.command.execute(self._conn)
+
+    def _execute_compiled_statements_in_parallel(
+        self,
+        compiled_statements: Iterable[CompiledStatement],
+        cursor_class,
+        parallel: int,
+    ) -> Iterable[SnowflakeCursor]:
+        """
+        Submits queries asynchronously, keeping at most `parallel` of them running.
+        File transfers, which the connector can't run asynchronously, and statements
+        changing the session, which affect the statements after them, are executed
+        synchronously once all submitted queries are finished.
+        Queries are awaited in the order of submission, so one long query delays
+        submitting the next ones once the limit is reached. Queries still running
+        when the execution is interrupted are cancelled.
+        """
+        self.invalidate_session_state()
+        running: Deque[str] = deque()
+        try:
+            for stmt in compiled_statements:
+                if stmt.execute_async:
+                    self._schedule_async_statement(stmt, cursor_class)
+                elif stmt.statement and _runs_synchronously(stmt.statement):
+                    while running:
+                        yield self._get_async_query_result(running.popleft())
+                    yield from self.execute_string(
+                        stmt.statement, cursor_class=cursor_class
+                    )
+                elif stmt.statement:
+                    if len(running) >= parallel:
+                        yield self._get_async_query_result(running.popleft())
+                    cursor = self._conn.cursor(cursor_class=cursor_class)
+                    cursor.execute_async(stmt.statement)
+                    running.append(cursor.sfqid)
+                if stmt.command:
+                    while running:
+                        yield self._get_async_query_result(running.popleft())
+                    stmt.command.execute(self._conn)
+            while running:
+                yield self._get_async_query_result(running.popleft())
+        finally:
+            for query_id in running:
+                self._cancel_query(query_id)
+
+    def _get_async_query_result(self, query_id: str) -> SnowflakeCursor:
+        # Results are read with a plain cursor, the query was already printed on submission
+        cursor = self._conn.cursor()
+        cursor.get_results_from_sfqid(query_id)
+        return cursor
+
+    def _cancel_query(self, query_id: str) -> None:
+        try:
+            self._conn.cursor().execute(
+                f"select system$cancel_query({to_string_literal(query_id)})"
+            )
+        except ProgrammingError as e:
+            logger.debug("Could not cancel query %s: %s", query_id, e)
+
+    def _schedule_async_statement(self, stmt: CompiledStatement, cursor_class):
+        cursor = self._conn.cursor(cursor_class=cursor_class)
+        cursor.execute(stmt.statement, _no_results=True)
+        # only log query ID for consistency with SnowSQL
+        logger.info("Async execution id: %s", cursor.sfqid)
+        print_result(CollectionResult([{"scheduled query ID": cursor.sfqid}]))
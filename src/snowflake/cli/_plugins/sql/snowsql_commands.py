@@ -250,6 +250,27 @@ class AbortCommand(SnowSQLCommand):
         return CompileCommandResult(command=cls(args[0]))
 
 
+@dataclass
+class WaitCommand(SnowSQLCommand):
+    """
+    Barrier for parallel execution: statements after it are submitted
+    only when all statements before it are finished.
+    """
+
+    def execute(self, connection: SnowflakeConnection):
+        # Statements are executed in order unless run in parallel,
+        # in which case running statements are awaited before any command
+        pass
+
+    @classmethod
+    def from_args(cls, args, kwargs) -> CompileCommandResult:
+        if args or kwargs:
+            return CompileCommandResult(
+                error_message="'wait' command does not accept arguments. Usage: `!wait`"
+            )
+        return CompileCommandResult(command=cls())
+
+
 def compile_snowsql_command(command: str, cmd_args: List[str]):
     """Parses command into SQL query"""
     args = []
@@ -272,5 +293,7 @@ def compile_snowsql_command(command: str, cmd_args: List[str]):
             return ResultCommand.from_args(args, kwargs)
         case "!abort":
             return AbortCommand.from_args(args, kwargs)
+        case "!wait":
+            return WaitCommand.from_args(args, kwargs)
         case _:
             return CompileCommandResult(error_message=f"Unknown command '{command}'")
@@ -153,7 +153,7 @@ def parse_statement(source: str, operators: OperatorFunctions) -> ParsedStatemen
                 f"Unknown source: {command_args}",
             )
 
-        case "queries" | "result" | "abort", (str(),):
+        case "queries" | "result" | "abort" | "wait", (str(),):
             return ParsedStatement(statement, StatementType.SNOWSQL_COMMAND, None)
 
         case _:
@@ -208,10 +208,11 @@ def files_reader(
 ) -> RecursiveStatementReader:
     """Entry point for reading statements from files.
 
-    Returns a generator with statements."""
+    Returns a generator with statements. Files are read line by line,
+    as statements are consumed."""
     for path in paths:
         with path.open(read_file_limit_mb=UNLIMITED) as f:
-            stmts = split_statements(io.StringIO(f.read()), remove_comments)
+            stmts = split_statements(f, remove_comments)
             yield from recursive_statement_reader(
                 stmts,
                 [path.as_posix()],
@@ -252,6 +253,41 @@ def _is_empty_statement(statement: str) -> bool:
     return True
 
 
+def compile_statement(
+    stmt: ParsedStatement,
+) -> Tuple[List[str], CompiledStatement | None]:
+    """Compiles single parsed statement. Returns its errors and compiled statement, if any."""
+    errors = []
+    compiled = None
+
+    if stmt.statement_type == StatementType.QUERY:
+        statement = stmt.statement.read()
+        if not stmt.error and not _is_empty_statement(statement):
+            compiled = CompiledStatement(
+                statement=statement.removesuffix(ASYNC_SUFFIX),
+                execute_async=statement.endswith(ASYNC_SUFFIX),
+            )
+
+    if stmt.statement_type == StatementType.SNOWSQL_COMMAND:
+        if not stmt.error:
+            cmd = (
+                stmt.statement.read()
+                .removesuffix(ASYNC_SUFFIX)
+                .removesuffix(";")
+                .split()
+            )
+            parsed_command = compile_snowsql_command(command=cmd[0], cmd_args=cmd[1:])
+            if parsed_command.error_message:
+                errors.append(parsed_command.error_message)
+            else:
+                compiled = CompiledStatement(command=parsed_command.command)
+
+    if stmt.error:
+        errors.append(stmt.error)
+
+    return errors, compiled
+
+
 def compile_statements(
     source: RecursiveStatementReader,
 ) -> Tuple[List[str], int, List[CompiledStatement]]:
@@ -261,36 +297,11 @@ def compile_statements(
     compiled = []
 
     for stmt in source:
-        if stmt.statement_type == StatementType.QUERY:
-            statement = stmt.statement.read()
-            if not stmt.error and not _is_empty_statement(statement):
-                is_async = statement.endswith(ASYNC_SUFFIX)
-                compiled.append(
-                    CompiledStatement(
-                        statement=statement.removesuffix(ASYNC_SUFFIX),
-                        execute_async=is_async,
-                    )
-                )
-                if not is_async:
-                    expected_results_cnt += 1
-
-        if stmt.statement_type == StatementType.SNOWSQL_COMMAND:
-            if not stmt.error:
-                cmd = (
-                    stmt.statement.read()
-                    .removesuffix(ASYNC_SUFFIX)
-                    .removesuffix(";")
-                    .split()
-                )
-                parsed_command = compile_snowsql_command(
-                    command=cmd[0], cmd_args=cmd[1:]
-                )
-                if parsed_command.error_message:
-                    errors.append(parsed_command.error_message)
-                else:
-                    compiled.append(CompiledStatement(command=parsed_command.command))
-
-        if stmt.error:
-            errors.append(stmt.error)
+        stmt_errors, compiled_stmt = compile_statement(stmt)
+        errors.extend(stmt_errors)
+        if compiled_stmt is not None:
+            compiled.append(compiled_stmt)
+            if compiled_stmt.statement and not compiled_stmt.execute_async:
+                expected_results_cnt += 1
 
     return errors, expected_results_cnt, compiled
@@ -77,7 +77,7 @@ add_object_command_aliases(
 )
 
 
-@app.command("list-files", requires_connection=True)
+@app.command("list-files", requires_connection=True, supports_output_file=True)
 def stage_list_files(
     stage_name: str = StagePathArgument, pattern=PatternOption, **options
 ) -> CommandResult:
@@ -114,6 +114,11 @@ def copy(
         default=False,
         help="Specifies whether Snowflake uses gzip to compress files during upload. Ignored when downloading.",
     ),
+    max_concurrency: int = typer.Option(
+        1,
+        help="Maximum number of directories uploaded or downloaded at the same time when copying recursively.",
+        min=1,
+    ),
     **options,
 ) -> CommandResult:
     """
@@ -138,6 +143,7 @@ def copy(
             source_path=source_path,
             destination_path=destination_path,
             parallel=parallel,
+            max_concurrency=max_concurrency,
         )
     return _put(
         recursive=recursive,
@@ -146,6 +152,7 @@ def copy(
         parallel=parallel,
         overwrite=overwrite,
         auto_compress=auto_compress,
+        max_concurrency=max_concurrency,
     )
 
 
@@ -211,6 +218,12 @@ def execute(
     ),
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = ExecuteVariablesOption,
+    max_concurrency: int = typer.Option(
+        1,
+        help="Maximum number of SQL files executed at the same time. Files from one directory"
+        " are executed concurrently, directories are executed one after another.",
+        min=1,
+    ),
     **options,
 ):
     """
@@ -218,12 +231,21 @@ def execute(
     e.g. `@stage/*.sql`, `@stage/dev/*`. Only files with `.sql` extension will be executed.
     """
     results = StageManager().execute(
-        stage_path_str=stage_path, on_error=on_error, variables=variables
+        stage_path_str=stage_path,
+        on_error=on_error,
+        variables=variables,
+        max_concurrency=max_concurrency,
     )
     return CollectionResult(results)
 
 
-def get(recursive: bool, source_path: str, destination_path: str, parallel: int):
+def get(
+    recursive: bool,
+    source_path: str,
+    destination_path: str,
+    parallel: int,
+    max_concurrency: int = 1,
+):
     target = Path(destination_path).resolve()
     if not recursive:
         cli_console.warning(
@@ -235,7 +257,10 @@ def get(recursive: bool, source_path: str, destination_path: str, parallel: int)
         return QueryResult(cursor)
 
     cursors = StageManager().get_recursive(
-        stage_path=source_path, dest_path=target, parallel=parallel
+        stage_path=source_path,
+        dest_path=target,
+        parallel=parallel,
+        max_concurrency=max_concurrency,
     )
     results = [list(QueryResult(c).result) for c in cursors]
     flattened_results = list(itertools.chain.from_iterable(results))
@@ -253,6 +278,7 @@ def _put(
     parallel: int,
     overwrite: bool,
     auto_compress: bool,
+    max_concurrency: int = 1,
 ):
     if recursive and not source_path.is_file():
         cursor_generator = StageManager().put_recursive(
@@ -261,6 +287,7 @@ def _put(
             overwrite=overwrite,
             parallel=parallel,
             auto_compress=auto_compress,
+            max_concurrency=max_concurrency,
         )
         return CollectionResult(cursor_generator)
     else:
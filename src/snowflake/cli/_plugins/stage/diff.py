@@ -15,24 +15,47 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
-from typing import Collection, Dict, List, Optional, Tuple
+from tempfile import TemporaryDirectory
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from snowflake.cli.api.artifacts.bundle_map import BundleMap
+from snowflake.cli.api.config import CLI_SECTION, get_config_positive_int_value
 from snowflake.cli.api.exceptions import (
     SnowflakeSQLExecutionError,
 )
 from snowflake.cli.api.project.util import unquote_identifier
+from snowflake.cli.api.stage_path import StagePath
+from snowflake.cli.api.utils.path_utils import iter_files
+from snowflake.connector import ProgrammingError
 from snowflake.connector.cursor import DictCursor
 
-from .manager import StageManager, StagePathParts
-from .md5 import UnknownMD5FormatError, file_matches_md5sum
+from .manager import (
+    StageManager,
+    StagePathParts,
+    UserStagePathParts,
+    escape_stage_regex,
+)
+from .md5 import (
+    UnknownMD5FormatError,
+    compute_md5sum,
+    file_matches_md5sum,
+    is_md5sum,
+)
+from .md5_cache import Md5Cache, file_stat_key
+from .sync_manifest import SyncedFile, SyncManifest
 
 log = logging.getLogger(__name__)
 
 StagePathType = PurePosixPath  # alias PurePosixPath as StagePath for clarity
 
+STAGE_SECTION_PATH = [CLI_SECTION, "stage"]
+MD5_MAX_WORKERS_KEY = "md5_max_workers"
+REMOVE_PATTERN_MAX_LENGTH = 16 * 1024
+
 
 @dataclass
 class DiffResult:
@@ -52,6 +75,11 @@ class DiffResult:
     only_on_stage: List[StagePathType] = field(default_factory=list)
     "Files that only exist on the stage"
 
+    stage_md5s: Dict[StagePathType, Optional[str]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    "md5sums reported by the stage for all files on it, used to find copies of local files"
+
     def has_changes(self) -> bool:
         return (
             len(self.different) > 0
@@ -67,21 +95,14 @@ class DiffResult:
         }
 
 
-def enumerate_files(path: Path) -> List[Path]:
+def enumerate_files(path: Path) -> Iterator[Path]:
     """
-    Get a list of all files in a directory (recursively).
+    Lazily get all files in a directory (recursively), in sorted order.
     """
     if not path.is_dir():
         raise ValueError("Path must point to a directory")
 
-    paths: List[Path] = []
-    for child in sorted(path.iterdir()):
-        if child.is_dir():
-            paths += enumerate_files(child)
-        else:
-            paths.append(child)
-
-    return paths
+    return iter_files(path)
 
 
 def relative_to_stage_path(path: str, stage_path: StagePathParts) -> StagePathType:
@@ -126,22 +147,100 @@ def preserve_from_diff(
     preserved_diff.only_on_stage = [
         i for i in diff.only_on_stage if i in paths_to_preserve
     ]
+    preserved_diff.stage_md5s = diff.stage_md5s
     return preserved_diff
 
 
-def compute_stage_diff(local_root: Path, stage_path: StagePathParts) -> DiffResult:
+def get_md5_max_workers() -> Optional[int]:
+    """
+    Returns the number of worker threads used to hash local files, as configured
+    by the cli.stage.md5_max_workers option (or SNOWFLAKE_CLI_STAGE_MD5_MAX_WORKERS).
+    None means the ThreadPoolExecutor default should be used.
+    """
+    return get_config_positive_int_value(
+        *STAGE_SECTION_PATH, key=MD5_MAX_WORKERS_KEY, default=None
+    )
+
+
+def _local_file_matches(
+    local_file: Path,
+    remote_md5: Optional[str],
+    md5_cache: Optional[Md5Cache],
+    synced_file: Optional[SyncedFile] = None,
+) -> bool:
+    """
+    Returns True if the local file is identical to the file with the given remote md5sum.
+    Files that cannot be compared are reported as changed.
+    """
+    if synced_file is not None and synced_file.matches_local_file(local_file):
+        # unchanged since it was last synced to (or compared with) the stage
+        return True
+    # N.B. file size on stage is not always accurate, so cannot fail fast
+    try:
+        # We are assuming that we will not get accidental collisions here due to the
+        # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
+        # combined with the fact that the file name + path must also match elsewhere.
+        return file_matches_md5sum(local_file, remote_md5, md5_cache)
+    except UnknownMD5FormatError:
+        log.warning(
+            "Could not compare md5 for %s, assuming file has changed",
+            local_file,
+            exc_info=True,
+        )
+        return False
+
+
+def compute_stage_diff(
+    local_root: Path,
+    stage_path: StagePathParts,
+    max_workers: Optional[int] = None,
+    md5_cache: Optional[Md5Cache] = None,
+    sync_manifest: Optional[SyncManifest] = None,
+) -> DiffResult:
     """
     Diffs the files in the local_root with files in the stage path that is stage_path's full_path.
+
+    Local md5sums are computed on a pool of at most max_workers threads (defaults to the
+    cli.stage.md5_max_workers config option); results are reported in local file order.
+    If md5_cache is given, it is consulted before hashing and saved afterwards.
+
+    If sync_manifest is given and no local file changed since the stage was last synced,
+    the diff is computed from the manifest, without listing the stage. Otherwise the
+    manifest is updated with the listed state of the stage, but not saved.
     """
     stage_manager = StageManager()
-    local_files = enumerate_files(local_root)
-    remote_files = stage_manager.list_files(stage_path.full_path)
+    local_files: Iterable[Path] = enumerate_files(local_root)
+
+    recorded_files: Dict[str, SyncedFile] = {}
+    if sync_manifest is not None:
+        local_files = list(local_files)
+        recorded = sync_manifest.get_files(stage_path.full_path)
+        if recorded is not None:
+            unchanged_diff = _diff_unchanged_since_sync(
+                local_root, local_files, recorded
+            )
+            if unchanged_diff is not None:
+                log.info(
+                    "Local files unchanged since last sync to %s, not listing the stage",
+                    stage_path.full_path,
+                )
+                return unchanged_diff
+            recorded_files = recorded
 
+    remote_files = stage_manager.list_files(stage_path.full_path)
     # Create a mapping from remote_file path to file's md5sum. Path is relative to stage_name/directory.
     remote_md5 = build_md5_map(remote_files, stage_path)
+    synced_files: Dict[str, SyncedFile] = {}
+    if sync_manifest is not None:
+        synced_files = {
+            str(path): _listed_file(md5, recorded_files.get(str(path)))
+            for path, md5 in remote_md5.items()
+        }
 
-    result: DiffResult = DiffResult()
+    result: DiffResult = DiffResult(stage_md5s=dict(remote_md5))
 
+    # Local files are consumed lazily, only files present on the stage are kept for hashing
+    files_to_compare: List[Tuple[StagePathType, Path, Optional[str]]] = []
     for local_file in local_files:
         relpath = local_file.relative_to(local_root)
         rel_stage_path = to_stage_path(relpath)
@@ -149,34 +248,82 @@ def compute_stage_diff(local_root: Path, stage_path: StagePathParts) -> DiffResu
             # doesn't exist on the stage
             result.only_local.append(rel_stage_path)
         else:
-            # N.B. file size on stage is not always accurate, so cannot fail fast
-            try:
-                if file_matches_md5sum(local_file, remote_md5[rel_stage_path]):
-                    # We are assuming that we will not get accidental collisions here due to the
-                    # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
-                    # combined with the fact that the file name + path must also match elsewhere.
+            # mark this file as seen
+            files_to_compare.append(
+                (rel_stage_path, local_file, remote_md5.pop(rel_stage_path))
+            )
+
+    if files_to_compare:
+        if max_workers is None:
+            max_workers = get_md5_max_workers()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="stage_diff_md5"
+        ) as executor:
+            # executor.map yields results in submission order, keeping the diff deterministic
+            matches = executor.map(
+                lambda item: _local_file_matches(
+                    item[1], item[2], md5_cache, synced_files.get(str(item[0]))
+                ),
+                files_to_compare,
+            )
+            for (rel_stage_path, local_file, _), is_identical in zip(
+                files_to_compare, matches
+            ):
+                if is_identical:
                     result.identical.append(rel_stage_path)
+                    if sync_manifest is not None:
+                        synced_files[
+                            str(rel_stage_path)
+                        ].local_fingerprint = file_stat_key(local_file)
                 else:
                     # either the file has changed, or we can't tell if it has
                     result.different.append(rel_stage_path)
-            except UnknownMD5FormatError:
-                log.warning(
-                    "Could not compare md5 for %s, assuming file has changed",
-                    local_file,
-                    exc_info=True,
-                )
-                result.different.append(rel_stage_path)
-
-            # mark this file as seen
-            del remote_md5[rel_stage_path]
+        if md5_cache is not None:
+            md5_cache.save()
 
     # every entry here is a file we never saw locally
     for rel_stage_path in remote_md5.keys():
         result.only_on_stage.append(rel_stage_path)
 
+    if sync_manifest is not None:
+        sync_manifest.set_files(stage_path.full_path, synced_files)
+
     return result
 
 
+def _listed_file(md5: Optional[str], recorded_file: Optional[SyncedFile]) -> SyncedFile:
+    # The local fingerprint is still valid if the file was not changed on the stage
+    if recorded_file is not None and recorded_file.md5 == md5:
+        return recorded_file
+    return SyncedFile(md5)
+
+
+def _diff_unchanged_since_sync(
+    local_root: Path, local_files: List[Path], recorded_files: Dict[str, SyncedFile]
+) -> Optional[DiffResult]:
+    """
+    Returns the diff with the stage if every local file is recorded as synced and was
+    not modified since, or None if the stage has to be listed to compute it.
+    """
+    identical = []
+    for local_file in local_files:
+        rel_stage_path = to_stage_path(local_file.relative_to(local_root))
+        recorded_file = recorded_files.get(str(rel_stage_path))
+        if recorded_file is None or not recorded_file.matches_local_file(local_file):
+            return None
+        identical.append(rel_stage_path)
+    seen = {str(path) for path in identical}
+    return DiffResult(
+        identical=identical,
+        only_on_stage=[
+            StagePathType(path) for path in recorded_files if path not in seen
+        ],
+        stage_md5s={
+            StagePathType(path): file.md5 for path, file in recorded_files.items()
+        },
+    )
+
+
 def get_stage_subpath(stage_path: StagePathType) -> str:
     """
     Returns the parent portion of a stage path, as a string, for inclusion in the fully qualified stage path. Note that
@@ -197,6 +344,43 @@ def to_local_path(stage_path: StagePathType) -> Path:
     return Path(*stage_path.parts)
 
 
+def _stage_file_name_prefix(stage_root: str) -> str:
+    """
+    Returns the prefix that LIST and REMOVE put in front of the paths of files under stage_root.
+    This is the inverse of relative_to_stage_path.
+    """
+    stage_path = StageManager.stage_path_parts_from_str(stage_root)
+    parts = []
+    if not isinstance(stage_path, UserStagePathParts):
+        parts.append(unquote_identifier(stage_path.stage_name).lower())
+    if directory := stage_path.directory.strip("/"):
+        parts.append(directory)
+    return "".join(f"{part}/" for part in parts)
+
+
+def _remove_pattern_chunks(
+    prefix: str, stage_paths: List[StagePathType]
+) -> Iterator[Tuple[List[StagePathType], str]]:
+    """
+    Splits stage paths into chunks, yielding each chunk with a pattern matching exactly its files.
+    Chunks are bounded so that generated statements stay well below the statement size limit.
+    """
+    escaped_prefix = escape_stage_regex(prefix)
+    chunk: List[StagePathType] = []
+    alternatives: List[str] = []
+    length = 0
+    for _stage_path in stage_paths:
+        escaped = escape_stage_regex(str(_stage_path))
+        if chunk and length + len(escaped) > REMOVE_PATTERN_MAX_LENGTH:
+            yield chunk, f"{escaped_prefix}({'|'.join(alternatives)})"
+            chunk, alternatives, length = [], [], 0
+        chunk.append(_stage_path)
+        alternatives.append(escaped)
+        length += len(escaped) + 1
+    if chunk:
+        yield chunk, f"{escaped_prefix}({'|'.join(alternatives)})"
+
+
 def delete_only_on_stage_files(
     stage_manager: StageManager,
     stage_root: str,
@@ -205,9 +389,39 @@ def delete_only_on_stage_files(
 ):
     """
     Deletes all files from a Snowflake stage according to the input list of filenames, using a custom role.
+    Multiple files are removed with as few REMOVE ... PATTERN statements as possible; any file that
+    is not reported as removed by those is then removed on its own.
     """
-    for _stage_path in only_on_stage:
-        stage_manager.remove(stage_name=stage_root, path=str(_stage_path), role=role)
+    if len(only_on_stage) <= 1:
+        for _stage_path in only_on_stage:
+            stage_manager.remove(
+                stage_name=stage_root, path=str(_stage_path), role=role
+            )
+        return
+
+    prefix = _stage_file_name_prefix(stage_root)
+    for chunk, pattern in _remove_pattern_chunks(prefix, only_on_stage):
+        cursor = stage_manager.remove(
+            stage_name=stage_root, path="", role=role, pattern=pattern
+        )
+        removed = {row[0] for row in cursor.fetchall()}
+        for _stage_path in chunk:
+            if f"{prefix}{_stage_path}" not in removed:
+                stage_manager.remove(
+                    stage_name=stage_root, path=str(_stage_path), role=role
+                )
+
+
+def _group_by_stage_subpath(
+    stage_paths: List[StagePathType],
+) -> Dict[str, List[StagePathType]]:
+    """
+    Groups stage paths by their parent directory on the stage, preserving input order.
+    """
+    groups: Dict[str, List[StagePathType]] = {}
+    for _stage_path in stage_paths:
+        groups.setdefault(get_stage_subpath(_stage_path), []).append(_stage_path)
+    return groups
 
 
 def put_files_on_stage(
@@ -220,18 +434,97 @@ def put_files_on_stage(
 ):
     """
     Uploads all files given input list of filenames on your local filesystem, to a Snowflake stage, using a custom role.
+    Files that share a stage directory are uploaded with a single PUT statement, from a temporary
+    directory containing links to those files only.
     """
-    for _stage_path in stage_paths:
-        stage_sub_path = get_stage_subpath(_stage_path)
+    for stage_sub_path, group in _group_by_stage_subpath(stage_paths).items():
         full_stage_path = (
             f"{stage_root}/{stage_sub_path}" if stage_sub_path else stage_root
         )
-        stage_manager.put(
-            local_path=deploy_root_path / to_local_path(_stage_path),
-            stage_path=full_stage_path,
-            role=role,
-            overwrite=overwrite,
-        )
+        # PUT expands "<dir>/*" with glob, which skips hidden files, so those are uploaded one by one
+        individual = [p for p in group if p.name.startswith(".")]
+        batched = [p for p in group if not p.name.startswith(".")]
+        if len(batched) < 2:
+            individual += batched
+            batched = []
+        for _stage_path in individual:
+            stage_manager.put(
+                local_path=deploy_root_path / to_local_path(_stage_path),
+                stage_path=full_stage_path,
+                role=role,
+                overwrite=overwrite,
+            )
+        if not batched:
+            continue
+
+        with TemporaryDirectory() as tmp:
+            staging_dir = Path(tmp)
+            local_dir = deploy_root_path / to_local_path(StagePathType(stage_sub_path))
+            for _stage_path in batched:
+                stage_manager.symlink_or_copy(
+                    source_root=local_dir,
+                    source_file_or_dir=deploy_root_path / to_local_path(_stage_path),
+                    dest_dir=staging_dir,
+                )
+            stage_manager.put(
+                local_path=staging_dir,
+                stage_path=full_stage_path,
+                role=role,
+                overwrite=overwrite,
+            )
+
+
+def copy_files_on_stage(
+    stage_manager: StageManager,
+    stage_root: str,
+    deploy_root_path: Path,
+    diff_result: DiffResult,
+    role: Optional[str] = None,
+) -> List[StagePathType]:
+    """
+    Creates files that exist only locally, but whose contents are already on the stage under
+    another path with the same file name, with server-side COPY FILES instead of uploading them.
+    Returns the stage paths of the files that were copied.
+    """
+    if StagePath.from_stage_str(stage_root).is_user_stage():
+        # user stages cannot be the target of COPY FILES
+        return []
+
+    # Only plain md5sums describe the contents of a file, multi-part ones depend on the upload
+    sources: Dict[Tuple[str, str], StagePathType] = {}
+    for _stage_path, md5 in diff_result.stage_md5s.items():
+        if md5 and is_md5sum(md5):
+            sources.setdefault((_stage_path.name, md5), _stage_path)
+    if not sources:
+        return []
+    source_names = {name for name, _ in sources}
+
+    copied: List[StagePathType] = []
+    with stage_manager.use_role(role) if role else nullcontext():
+        for _stage_path in diff_result.only_local:
+            if _stage_path.name not in source_names:
+                continue
+            local_md5 = compute_md5sum(deploy_root_path / to_local_path(_stage_path))
+            source = sources.get((_stage_path.name, local_md5))
+            if source is None:
+                continue
+            # COPY FILES matches its source path as a prefix, so the file is named
+            # explicitly to avoid copying its siblings (e.g. data.csv.bak)
+            source_dir = get_stage_subpath(source)
+            source_path = (
+                f"{stage_root}/{source_dir}/" if source_dir else f"{stage_root}/"
+            )
+            try:
+                stage_manager.copy_files(
+                    source_path=source_path,
+                    destination_path=f"{stage_root}/{get_stage_subpath(_stage_path)}",
+                    files=[source.name],
+                )
+            except ProgrammingError as err:
+                log.debug("Could not copy %s to %s: %s", source, _stage_path, err)
+                continue
+            copied.append(_stage_path)
+    return copied
 
 
 def sync_local_diff_with_stage(
@@ -250,6 +543,16 @@ def sync_local_diff_with_stage(
     )
 
     try:
+        # Copies must be made before any file is removed from the stage
+        copied = set(
+            copy_files_on_stage(
+                stage_manager=stage_manager,
+                stage_root=stage_full_path,
+                deploy_root_path=deploy_root_path,
+                diff_result=diff_result,
+                role=role,
+            )
+        )
         delete_only_on_stage_files(
             stage_manager, stage_full_path, diff_result.only_on_stage, role
         )
@@ -265,7 +568,7 @@ def sync_local_diff_with_stage(
             stage_manager=stage_manager,
             stage_root=stage_full_path,
             deploy_root_path=deploy_root_path,
-            stage_paths=diff_result.only_local,
+            stage_paths=[p for p in diff_result.only_local if p not in copied],
             role=role,
         )
     except Exception as err:
@@ -274,6 +577,26 @@ def sync_local_diff_with_stage(
         raise SnowflakeSQLExecutionError()
 
 
+def record_sync_in_manifest(
+    sync_manifest: SyncManifest,
+    stage_path: StagePathParts,
+    deploy_root: Path,
+    diff_result: DiffResult,
+) -> None:
+    """
+    Records in the manifest that the given diff was synced to the stage, and saves it.
+    Should be called after the manifest was updated by compute_stage_diff.
+    """
+    if diff_result.has_changes():
+        sync_manifest.record_sync(
+            stage_path.full_path,
+            deploy_root=deploy_root,
+            uploaded=[str(p) for p in diff_result.different + diff_result.only_local],
+            removed=[str(p) for p in diff_result.only_on_stage],
+        )
+    sync_manifest.save()
+
+
 def _to_src_dest_pair(
     stage_path: StagePathType, bundle_map: Optional[BundleMap]
 ) -> Tuple[Optional[str], str]:
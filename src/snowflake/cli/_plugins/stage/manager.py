@@ -16,20 +16,36 @@ from __future__ import annotations
 
 import fnmatch
 import glob
+import hashlib
+import inspect
+import itertools
 import logging
+import marshal
 import os
+import posixpath
 import re
 import shutil
 import sys
 import time
 from collections import deque
-from contextlib import nullcontext
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from os import path
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from textwrap import dedent
-from typing import Deque, Dict, Generator, List, Optional, Union
+from types import ModuleType
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from click import ClickException, UsageError
 from snowflake.cli._plugins.snowpark.package_utils import parse_requirements
@@ -38,13 +54,20 @@ from snowflake.cli.api.commands.common import (
     Variable,
 )
 from snowflake.cli.api.commands.utils import parse_key_value_variables
+from snowflake.cli.api.config import CLI_SECTION, get_config_value
 from snowflake.cli.api.console import cli_console
 from snowflake.cli.api.constants import PYTHON_3_12
+from snowflake.cli.api.errno import (
+    DOES_NOT_EXIST_OR_NOT_AUTHORIZED,
+    UNKNOWN_FUNCTION,
+    UNKNOWN_USER_DEFINED_FUNCTION,
+)
 from snowflake.cli.api.identifiers import FQN
 from snowflake.cli.api.project.util import VALID_IDENTIFIER_REGEX, to_string_literal
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
 from snowflake.cli.api.stage_path import StagePath
+from snowflake.cli.api.utils.concurrency import map_in_threads
 from snowflake.cli.api.utils.path_utils import path_resolver, resolve_without_follow
 from snowflake.connector import DictCursor, ProgrammingError
 from snowflake.connector.cursor import SnowflakeCursor
@@ -62,12 +85,77 @@ EXECUTE_SUPPORTED_FILES_FORMATS = (
     ".sql",
     ".py",
 )  # tuple to preserve order but it's a set
+EXECUTE_ASYNC_POLL_INTERVAL_SECONDS = 0.5
+COPY_FILES_MAX_FILES = 1000
+PYTHON_EXECUTION_SCHEMA_KEY = "python_execution_schema"
+PYTHON_EXECUTION_PROCEDURE_PREFIX = "snowflake_cli_python_execution_"
+PYTHON_EXECUTION_STAGE_NAME = "snowflake_cli_python_execution"
+_MISSING_PROCEDURE_ERRNOS = (
+    UNKNOWN_FUNCTION,
+    UNKNOWN_USER_DEFINED_FUNCTION,
+    DOES_NOT_EXIST_OR_NOT_AUTHORIZED,
+)
 
 # Replace magic numbers with constants
 OMIT_FIRST = slice(1, None)
 STAGE_PATH_REGEX = rf"(?P<prefix>(@|{re.escape('snow://')}))?(?:(?P<first_qualifier>{VALID_IDENTIFIER_REGEX})\.)?(?:(?P<second_qualifier>{VALID_IDENTIFIER_REGEX})\.)?(?P<name>{VALID_IDENTIFIER_REGEX})/?(?P<directory>([^/]*/?)*)?"
 
 
+def escape_stage_regex(value: str) -> str:
+    """
+    Escapes all characters that have a special meaning in a stage PATTERN regular expression.
+    """
+    return re.sub(r"([\\.^$|?*+()\[\]{}])", r"\\\1", value)
+
+
+def get_python_execution_schema() -> Optional[str]:
+    """
+    Returns the schema for permanent Python execution procedures, as configured by
+    the cli.stage.python_execution_schema option. None means temporary procedures are used.
+    """
+    return get_config_value(
+        CLI_SECTION, "stage", key=PYTHON_EXECUTION_SCHEMA_KEY, default=None
+    )
+
+
+def _python_execution_procedure_hash(
+    packages: List[Union[str, ModuleType]], procedure: Callable
+) -> str:
+    digest = hashlib.sha256()
+    digest.update("\n".join(sorted(str(p) for p in packages)).encode())
+    try:
+        digest.update(inspect.getsource(procedure).encode())
+    except OSError:
+        # Source is not available in frozen builds
+        digest.update(marshal.dumps(procedure.__code__))
+    return digest.hexdigest()[:16]
+
+
+def _call_python_execution_procedure(
+    procedure_name: str, create_procedure: Callable[[], None]
+) -> Callable:
+    """
+    Returns a function calling the permanent procedure. Its existence is not checked
+    upfront: the procedure is created only if the first call fails because it is missing.
+    """
+    from snowflake.snowpark.exceptions import SnowparkSQLException
+
+    created = False
+
+    def _call(file_path: str, variables: Dict | None, session: Session):
+        nonlocal created
+        try:
+            return session.call(procedure_name, file_path, variables)
+        except SnowparkSQLException as err:
+            if created or err.sql_error_code not in _MISSING_PROCEDURE_ERRNOS:
+                raise
+        create_procedure()
+        created = True
+        return session.call(procedure_name, file_path, variables)
+
+    return _call
+
+
 @dataclass
 class StagePathParts:
     directory: str
@@ -312,23 +400,85 @@ class StageManager(SqlExecutionMixin):
         )
 
     def get_recursive(
-        self, stage_path: str, dest_path: Path, parallel: int = 4
+        self,
+        stage_path: str,
+        dest_path: Path,
+        parallel: int = 4,
+        max_concurrency: int = 1,
     ) -> List[SnowflakeCursor]:
+        """
+        Downloads all files under stage_path, recreating the stage directory layout in
+        dest_path. Files are downloaded with one GET per stage directory; up to
+        max_concurrency of those GETs are run at the same time, on connections leased
+        from the connection pool.
+        """
+        if max_concurrency < 1:
+            raise UsageError("Max concurrency must be greater than 0.")
         stage_root = self.build_path(stage_path)
 
-        results = []
-        for file_path in self.iter_stage(stage_root):
+        directories: Dict[Path, List[Tuple[str, StagePath]]] = {}
+        for name, file_path in self._iter_stage_files(stage_root):
             local_dir = file_path.get_local_target_path(
                 target_dir=dest_path, stage_root=stage_root
             )
+            directories.setdefault(local_dir, []).append((name, file_path))
+
+        for local_dir in directories:
             self._assure_is_existing_directory(local_dir)
 
-            result = self.execute_query(
-                f"get {file_path.path_for_sql()} {self._to_uri(f'{local_dir}/')} parallel={parallel}"
+        results: List[SnowflakeCursor] = []
+        for cursors in map_in_threads(
+            lambda directory: self._get_directory(
+                local_dir=directory[0], files=directory[1], parallel=parallel
+            ),
+            directories.items(),
+            max_workers=max_concurrency,
+            thread_name_prefix="stage-get",
+            lease_connections=True,
+        ):
+            results.extend(cursors)
+        return results
+
+    def _get_directory(
+        self,
+        local_dir: Path,
+        files: List[Tuple[str, StagePath]],
+        parallel: int,
+    ) -> List[SnowflakeCursor]:
+        """
+        Downloads files from a single stage directory to local_dir. Multiple files are
+        fetched with one GET ... PATTERN matching the files directly in the directory;
+        if it reports fewer files than expected, the files are downloaded one by one.
+        """
+        local_uri = self._to_uri(f"{local_dir}/")
+        if len(files) > 1:
+            name, file_path = files[0]
+            stage_dir = StagePath(
+                stage_name=file_path.stage,
+                path=file_path.path.parent,
+                git_ref=file_path.git_ref,
+                trailing_slash=True,
+            )
+            pattern = escape_stage_regex(posixpath.dirname(name) + "/") + "[^/]+"
+            cursor = self.execute_query(
+                f"get {stage_dir.path_for_sql()} {local_uri} parallel={parallel}"
+                f" pattern = {to_string_literal(pattern)}"
+            )
+            if cursor.rowcount is not None and cursor.rowcount >= len(files):
+                return [cursor]
+            log.debug(
+                "GET with pattern %s returned %s rows, expected %s. Downloading files one by one.",
+                pattern,
+                cursor.rowcount,
+                len(files),
             )
-            results.append(result)
 
-        return results
+        return [
+            self.execute_query(
+                f"get {file_path.path_for_sql()} {local_uri} parallel={parallel}"
+            )
+            for _, file_path in files
+        ]
 
     def put(
         self,
@@ -364,7 +514,7 @@ class StageManager(SqlExecutionMixin):
         return cursor
 
     @staticmethod
-    def _symlink_or_copy(source_root: Path, source_file_or_dir: Path, dest_dir: Path):
+    def symlink_or_copy(source_root: Path, source_file_or_dir: Path, dest_dir: Path):
 
         absolute_src = resolve_without_follow(source_file_or_dir)
         dest_path = dest_dir / source_file_or_dir.relative_to(source_root)
@@ -387,9 +537,18 @@ class StageManager(SqlExecutionMixin):
         overwrite: bool = False,
         role: Optional[str] = None,
         auto_compress: bool = False,
+        max_concurrency: int = 1,
     ) -> Generator[dict, None, None]:
+        """
+        Uploads the files matching local_path to the stage, preserving the directory
+        layout. Every local directory is uploaded with a single PUT; up to max_concurrency
+        of those PUTs are run at the same time, on connections leased from the connection
+        pool. Result rows are yielded per directory, as soon as the directory is uploaded.
+        """
         if local_path.is_file():
             raise UsageError("Cannot use recursive upload with a single file.")
+        if max_concurrency < 1:
+            raise UsageError("Max concurrency must be greater than 0.")
 
         if local_path.is_dir():
             root = local_path
@@ -398,92 +557,79 @@ class StageManager(SqlExecutionMixin):
             root = Path([p for p in local_path.parents if p.is_dir()][0])
             glob_pattern = str(local_path)
 
+        # Uploads run sequentially on the connection of the caller, which switches the
+        # role once for all of them; leased connections switch it for every upload
+        shared_connection = max_concurrency == 1
         with TemporaryDirectory() as tmp:
-            temp_dir_with_copy = Path(tmp)
-
-            # Create a symlink or copy the file to the temp directory
-            for file_or_dir in glob.iglob(glob_pattern, recursive=True):
-                self._symlink_or_copy(
-                    source_root=root,
-                    source_file_or_dir=Path(file_or_dir),
-                    dest_dir=temp_dir_with_copy,
-                )
-
-            # Find the deepest directories, we will be iterating from bottom to top
-            deepest_dirs_list = self._find_deepest_directories(temp_dir_with_copy)
-
-            while deepest_dirs_list:
-                # Remove as visited
-                directory = deepest_dirs_list.pop(0)
-
-                # We reached root but there are still directories to process
-                if directory == temp_dir_with_copy and deepest_dirs_list:
-                    continue
-
-                # Upload the directory content, at this moment the directory has only files
-                if list(directory.iterdir()):
-                    destination = StagePath.from_stage_str(
-                        stage_path
-                    ) / directory.relative_to(temp_dir_with_copy)
-                    results: list[dict] = self.put(
-                        local_path=directory,
-                        stage_path=destination,
-                        parallel=parallel,
-                        overwrite=overwrite,
-                        role=role,
-                        auto_compress=auto_compress,
-                        use_dict_cursor=True,
-                    ).fetchall()
+            staged_directories = self._stage_directories_for_put(
+                root=root, glob_pattern=glob_pattern, staging_root=Path(tmp)
+            )
 
+            def _put_directory(
+                directory: Tuple[Path, Path]
+            ) -> Tuple[Path, StagePath, list[dict]]:
+                relative_dir, staged_dir = directory
+                destination = StagePath.from_stage_str(stage_path) / relative_dir
+                results: list[dict] = self.put(
+                    local_path=staged_dir,
+                    stage_path=destination,
+                    parallel=parallel,
+                    overwrite=overwrite,
+                    role=None if shared_connection else role,
+                    auto_compress=auto_compress,
+                    use_dict_cursor=True,
+                ).fetchall()
+                return relative_dir, destination, results
+
+            with self.use_role(role) if role and shared_connection else nullcontext():
+                for relative_dir, destination, results in map_in_threads(
+                    _put_directory,
+                    staged_directories,
+                    max_workers=max_concurrency,
+                    thread_name_prefix="stage-put",
+                    lease_connections=True,
+                ):
                     # Rewrite results to have resolved paths for better UX
                     for item in results:
-                        item["source"] = (directory / item["source"]).relative_to(
-                            temp_dir_with_copy
-                        )
+                        item["source"] = relative_dir / item["source"]
                         item["target"] = str(destination / item["target"])
                         yield item
 
-                # We end if we reach the root directory
-                if directory == temp_dir_with_copy:
-                    break
-                # Add parent directory to the list if it's not already there
-                if directory.parent not in deepest_dirs_list and not any(
-                    (
-                        existing_dir.is_relative_to(directory.parent)
-                        for existing_dir in deepest_dirs_list
-                    )
-                ):
-                    deepest_dirs_list.append(directory.parent)
-
-                # Remove the directory so the parent directory will contain only files
-                shutil.rmtree(directory)
-
-    @staticmethod
-    def _find_deepest_directories(root_directory: Path) -> list[Path]:
+    def _stage_directories_for_put(
+        self, root: Path, glob_pattern: str, staging_root: Path
+    ) -> List[Tuple[Path, Path]]:
         """
-        BFS to find the deepest directories. Build a tree of directories
-        structure and return leaves.
+        Links (or copies) every file matching glob_pattern into a flat directory created
+        for its parent directory, so that each directory can be uploaded on its own.
+        Returns (directory relative to root, staging directory) pairs, parents first.
         """
-        deepest_dirs: list[Path] = list()
-
-        queue: Deque[Path] = deque()
-        queue.append(root_directory)
-        while queue:
-            current_dir = queue.popleft()
-            # Sorted to have deterministic order
-            children_directories = sorted(
-                list(d for d in current_dir.iterdir() if d.is_dir())
+        staged_directories: Dict[Path, Path] = {}
+        for file_path in glob.iglob(glob_pattern, recursive=True):
+            file = Path(file_path)
+            if not resolve_without_follow(file).is_file():
+                continue
+            relative_dir = file.parent.relative_to(root)
+            if relative_dir not in staged_directories:
+                staged_dir = staging_root / str(len(staged_directories))
+                staged_dir.mkdir()
+                staged_directories[relative_dir] = staged_dir
+            self.symlink_or_copy(
+                source_root=file.parent,
+                source_file_or_dir=file,
+                dest_dir=staged_directories[relative_dir],
             )
-            if not children_directories and current_dir not in deepest_dirs:
-                deepest_dirs.append(current_dir)
-            else:
-                queue.extend([c for c in children_directories if c not in deepest_dirs])
-        deepest_dirs_list = sorted(
-            list(deepest_dirs), key=lambda d: len(d.parts), reverse=True
-        )
-        return deepest_dirs_list
+        return sorted(staged_directories.items(), key=lambda item: item[0].parts)
 
-    def copy_files(self, source_path: str, destination_path: str) -> SnowflakeCursor:
+    def copy_files(
+        self,
+        source_path: str,
+        destination_path: str,
+        files: Optional[List[str]] = None,
+    ) -> SnowflakeCursor:
+        """
+        Copies files from source_path into destination_path. If given, only the listed
+        files (relative to source_path, at most COPY_FILES_MAX_FILES) are copied.
+        """
         source_stage_path = self.build_path(source_path)
         # We copy only into stage
         destination_stage_path = StagePath.from_stage_str(destination_path)
@@ -499,20 +645,30 @@ class StageManager(SqlExecutionMixin):
         # Destination needs to end with /
         dest = destination_stage_path.absolute_path().rstrip("/") + "/"
         query = f"copy files into {dest} from {source_stage_path}"
+        if files:
+            query += f" files = ({', '.join(to_string_literal(f) for f in files)})"
         return self.execute_query(query)
 
     def remove(
-        self, stage_name: str, path: str, role: Optional[str] = None
+        self,
+        stage_name: str,
+        path: str,
+        role: Optional[str] = None,
+        pattern: Optional[str] = None,
     ) -> SnowflakeCursor:
         """
         This method will take a file path that exists on a Snowflake stage,
-        and remove it from the stage.
+        and remove it from the stage. If a pattern is provided, only the files
+        under the path that match the regular expression are removed.
         If provided with a role, then temporarily use this role to perform the operation above,
         and switch back to the original role for the next commands to run.
         """
         with self.use_role(role) if role else nullcontext():
             stage_path = self.build_path(stage_name) / path
-            return self.execute_query(f"remove {stage_path.path_for_sql()}")
+            query = f"remove {stage_path.path_for_sql()}"
+            if pattern is not None:
+                query += f" pattern = {to_string_literal(pattern)}"
+            return self.execute_query(query)
 
     def create(
         self, fqn: FQN, comment: Optional[str] = None, temporary: bool = False
@@ -524,12 +680,22 @@ class StageManager(SqlExecutionMixin):
         return self.execute_query(query)
 
     def iter_stage(self, stage_path: StagePath):
+        for _, path in self._iter_stage_files(stage_path):
+            yield path
+
+    def _iter_stage_files(
+        self, stage_path: StagePath
+    ) -> Generator[Tuple[str, StagePath], None, None]:
+        """
+        Yields the names of files under stage_path, as listed by LIST, with their paths.
+        """
         for file in self.list_files(stage_path.absolute_path()).fetchall():
+            name: str = file["name"]
             if stage_path.is_user_stage():
-                path = StagePath.get_user_stage() / file["name"]
+                path = StagePath.get_user_stage() / name
             else:
-                path = self.build_path(file["name"])
-            yield path
+                path = self.build_path(name)
+            yield name, path
 
     def execute(
         self,
@@ -537,40 +703,85 @@ class StageManager(SqlExecutionMixin):
         on_error: OnErrorType,
         variables: Optional[List[str]] = None,
         requires_temporary_stage: bool = False,
+        max_concurrency: int = 1,
     ):
-        if requires_temporary_stage:
-            (
-                stage_path_parts,
-                original_path_parts,
-            ) = self._create_temporary_copy_of_stage(stage_path_str)
-            stage_path = StagePath.from_stage_str(
-                stage_path_parts.get_standard_stage_path()
-            )
-        else:
-            stage_path_parts = self.stage_path_parts_from_str(stage_path_str)
-            stage_path = self.build_path(stage_path_str)
+        """
+        Executes all supported files matching stage_path_str, in alphabetical order with
+        directories at the end. With max_concurrency > 1, consecutive SQL files from the same
+        directory are executed asynchronously, with at most max_concurrency running at once;
+        every directory is finished before the next one is started.
+        """
+        if max_concurrency < 1:
+            raise UsageError("Max concurrency must be greater than 0.")
+        original_path_parts = self.stage_path_parts_from_str(stage_path_str)
+        original_stage_path = self.build_path(stage_path_str)
 
-        all_files_list = self._get_files_list_from_stage(stage_path.root_path())
+        all_files_list = self._get_files_list_from_stage(
+            original_stage_path.root_path()
+        )
         if not all_files_list:
-            raise ClickException(f"No files found on stage '{stage_path}'")
+            raise ClickException(f"No files found on stage '{original_stage_path}'")
 
         all_files_with_stage_name_prefix = [
-            stage_path_parts.get_directory(file) for file in all_files_list
+            original_path_parts.get_directory(file) for file in all_files_list
         ]
 
         # filter files from stage if match stage_path pattern
         filtered_file_list = self._filter_files_list(
-            stage_path_parts, all_files_with_stage_name_prefix
+            original_path_parts, all_files_with_stage_name_prefix
         )
 
         if not filtered_file_list:
-            raise ClickException(f"No files matched pattern '{stage_path}'")
+            raise ClickException(f"No files matched pattern '{original_stage_path}'")
 
         # sort filtered files in alphabetical order with directories at the end
         sorted_file_path_list = sorted(
             filtered_file_list, key=lambda f: (path.dirname(f), path.basename(f))
         )
 
+        if not requires_temporary_stage:
+            return self._execute_files(
+                sorted_file_path_list=sorted_file_path_list,
+                stage_path_parts=original_path_parts,
+                original_path_parts=original_path_parts,
+                stage_path=original_stage_path,
+                on_error=on_error,
+                variables=variables,
+                max_concurrency=max_concurrency,
+            )
+
+        files_to_copy = list(sorted_file_path_list)
+        if any(file.endswith(".py") for file in sorted_file_path_list):
+            files_to_copy.extend(
+                f
+                for f in all_files_with_stage_name_prefix
+                if path.basename(f) == "requirements.txt"
+            )
+        with self._temporary_copy_of_stage(
+            original_path_parts, files_to_copy
+        ) as stage_path_parts:
+            return self._execute_files(
+                sorted_file_path_list=sorted_file_path_list,
+                stage_path_parts=stage_path_parts,
+                original_path_parts=original_path_parts,
+                stage_path=StagePath.from_stage_str(
+                    stage_path_parts.get_standard_stage_path()
+                ),
+                on_error=on_error,
+                variables=variables,
+                max_concurrency=max_concurrency,
+            )
+
+    def _execute_files(
+        self,
+        sorted_file_path_list: List[str],
+        stage_path_parts: StagePathParts,
+        original_path_parts: StagePathParts,
+        stage_path: StagePath,
+        on_error: OnErrorType,
+        variables: Optional[List[str]],
+        max_concurrency: int,
+    ):
         parsed_variables = parse_key_value_variables(variables)
         sql_variables = self.parse_execute_variables(parsed_variables)
         python_variables = self._parse_python_variables(parsed_variables)
@@ -581,15 +792,44 @@ class StageManager(SqlExecutionMixin):
                 stage_path
             )
 
-        for file_path in sorted_file_path_list:
-            file_stage_path = stage_path_parts.add_stage_prefix(file_path)
-
+        def _paths(file_path: str) -> Tuple[str, str]:
             # For better reporting push down the information about original
             # path if execution happens from temporary stage
-            if requires_temporary_stage:
-                original_path = original_path_parts.add_stage_prefix(file_path)
-            else:
-                original_path = file_stage_path
+            return (
+                stage_path_parts.add_stage_prefix(file_path),
+                original_path_parts.add_stage_prefix(file_path),
+            )
+
+        if max_concurrency > 1:
+            # Consecutive SQL files from one directory run concurrently, everything else in order
+            for (_, is_python), group in itertools.groupby(
+                sorted_file_path_list,
+                key=lambda f: (path.dirname(f), f.endswith(".py")),
+            ):
+                if not is_python:
+                    results.extend(
+                        self._call_execute_immediate_async(
+                            files=[_paths(f) for f in group],
+                            variables=sql_variables,
+                            on_error=on_error,
+                            max_in_flight=max_concurrency,
+                        )
+                    )
+                    continue
+                for file_path in group:
+                    file_stage_path, original_path = _paths(file_path)
+                    results.append(
+                        self._execute_python(
+                            file_stage_path=file_stage_path,
+                            on_error=on_error,
+                            variables=python_variables,
+                            original_file=original_path,
+                        )
+                    )
+            return results
+
+        for file_path in sorted_file_path_list:
+            file_stage_path, original_path = _paths(file_path)
 
             if file_path.endswith(".py"):
                 result = self._execute_python(
@@ -609,34 +849,45 @@ class StageManager(SqlExecutionMixin):
 
         return results
 
-    def _create_temporary_copy_of_stage(
-        self, stage_path: str
-    ) -> tuple[StagePathParts, StagePathParts]:
+    @contextmanager
+    def _temporary_copy_of_stage(
+        self, original_path_parts: StagePathParts, files: List[str]
+    ) -> Generator[StagePathParts, None, None]:
+        """
+        Copies the given files (relative to the stage of original_path_parts) into a new
+        temporary stage, and yields the path parts rewritten to that stage. Git paths
+        become stage paths. The temporary stage is dropped on exit.
+        """
         sm = StageManager()
 
-        # Rewrite stage paths to temporary stage paths. Git paths become stage paths
-        original_path_parts = self.stage_path_parts_from_str(stage_path)  # noqa: SLF001
-
         tmp_stage_name = f"snowflake_cli_tmp_stage_{int(time.time())}"
         tmp_stage_fqn = FQN.from_stage(tmp_stage_name).using_connection(conn=self._conn)
         tmp_stage = tmp_stage_fqn.identifier
-        stage_path_parts = sm.stage_path_parts_from_str(  # noqa: SLF001
+        stage_path_parts = sm.stage_path_parts_from_str(
             tmp_stage + "/" + original_path_parts.directory
         )
 
-        # Create temporary stage, it will be dropped with end of session
         sm.create(tmp_stage_fqn, temporary=True)
-
-        # Copy the content
-        self.copy_files(
-            source_path=original_path_parts.get_full_stage_path(
+        try:
+            source_path = original_path_parts.get_full_stage_path(
                 original_path_parts.stage_name
-            ),
-            destination_path=stage_path_parts.get_full_stage_path(
+            )
+            destination_path = stage_path_parts.get_full_stage_path(
                 stage_path_parts.stage_name
-            ),
-        )
-        return stage_path_parts, original_path_parts
+            )
+            for i in range(0, len(files), COPY_FILES_MAX_FILES):
+                self.copy_files(
+                    source_path=source_path,
+                    destination_path=destination_path,
+                    files=files[i : i + COPY_FILES_MAX_FILES],
+                )
+            yield stage_path_parts
+        finally:
+            try:
+                sm.execute_query(f"drop stage if exists {tmp_stage_fqn.sql_identifier}")
+            except ProgrammingError as e:
+                # The stage is temporary, so it will be dropped with end of session anyway
+                log.debug("Could not drop temporary stage %s: %s", tmp_stage, e)
 
     def _get_files_list_from_stage(
         self, stage_path: StagePath, pattern: str | None = None
@@ -697,7 +948,7 @@ class StageManager(SqlExecutionMixin):
         return {"File": file, "Status": "SUCCESS", "Error": None}
 
     @staticmethod
-    def _error_result(file: str, msg: str):
+    def _error_result(file: str, msg: Optional[str]):
         cli_console.warning(f"FAILURE - {file}")
         return {"File": file, "Status": "FAILURE", "Error": msg}
 
@@ -715,15 +966,89 @@ class StageManager(SqlExecutionMixin):
     ) -> Dict:
         try:
             log.info("Executing SQL file: %s", file_stage_path)
-            query = f"execute immediate from {self.quote_stage_name(file_stage_path)}"
-            if variables:
-                query += variables
-            self.execute_query(query)
+            self.execute_query(
+                self._execute_immediate_query(file_stage_path, variables)
+            )
             return StageManager._success_result(file=original_file)
         except ProgrammingError as e:
             StageManager._handle_execution_exception(on_error=on_error, exception=e)
             return StageManager._error_result(file=original_file, msg=e.msg)
 
+    def _execute_immediate_query(
+        self, file_stage_path: str, variables: Optional[str]
+    ) -> str:
+        query = f"execute immediate from {self.quote_stage_name(file_stage_path)}"
+        if variables:
+            query += variables
+        return query
+
+    def _call_execute_immediate_async(
+        self,
+        files: List[Tuple[str, str]],
+        variables: Optional[str],
+        on_error: OnErrorType,
+        max_in_flight: int,
+    ) -> List[Dict]:
+        """
+        Submits EXECUTE IMMEDIATE FROM for every (file stage path, original file) pair
+        asynchronously, keeping at most max_in_flight of them running, and polls them until
+        all are finished. Results are returned in the order of files.
+        """
+        # Scripts may change the current role, warehouse, database or schema
+        self.invalidate_session_state()
+        results: Dict[int, Dict] = {}
+        pending: Deque[int] = deque(range(len(files)))
+        running: Dict[int, str] = {}
+
+        def _fail(index: int, error: ProgrammingError):
+            if on_error == OnErrorType.BREAK:
+                self._cancel_queries(running.values())
+            StageManager._handle_execution_exception(on_error=on_error, exception=error)
+            results[index] = StageManager._error_result(
+                file=files[index][1], msg=error.msg
+            )
+
+        while pending or running:
+            while pending and len(running) < max_in_flight:
+                index = pending.popleft()
+                file_stage_path, _ = files[index]
+                log.info("Executing SQL file: %s", file_stage_path)
+                cursor = self._conn.cursor()
+                try:
+                    cursor.execute_async(
+                        self._execute_immediate_query(file_stage_path, variables)
+                    )
+                except ProgrammingError as e:
+                    _fail(index, e)
+                    continue
+                running[index] = cursor.sfqid
+
+            for index, query_id in list(running.items()):
+                status = self._conn.get_query_status(query_id)
+                if self._conn.is_still_running(status):
+                    continue
+                del running[index]
+                try:
+                    self._conn.get_query_status_throw_if_error(query_id)
+                except ProgrammingError as e:
+                    _fail(index, e)
+                    continue
+                results[index] = StageManager._success_result(file=files[index][1])
+
+            if running:
+                time.sleep(EXECUTE_ASYNC_POLL_INTERVAL_SECONDS)
+
+        return [results[index] for index in range(len(files))]
+
+    def _cancel_queries(self, query_ids: Iterable[str]) -> None:
+        for query_id in query_ids:
+            try:
+                self.execute_query(
+                    f"select system$cancel_query({to_string_literal(query_id)})"
+                )
+            except ProgrammingError as e:
+                log.debug("Could not cancel query %s: %s", query_id, e)
+
     @staticmethod
     def stage_path_parts_from_str(stage_path: str) -> StagePathParts:
         """Create StagePathParts object from stage path string."""
@@ -778,7 +1103,14 @@ class StageManager(SqlExecutionMixin):
         return [req.package_name for req in requirements]
 
     def _bootstrap_snowpark_execution_environment(self, stage_path: StagePath):
-        """Prepares Snowpark session for executing Python code remotely."""
+        """
+        Prepares Snowpark session for executing Python code remotely.
+
+        If the cli.stage.python_execution_schema option is set, the procedure is created
+        as a permanent one in that schema, named after a hash of its packages and body,
+        so that later invocations call it without any other query.
+        Otherwise, a temporary procedure is registered.
+        """
         if sys.version_info >= PYTHON_3_12:
             raise ClickException(
                 f"Executing Python files is not supported in Python >= 3.12. Current version: {sys.version}"
@@ -786,16 +1118,16 @@ class StageManager(SqlExecutionMixin):
 
         from snowflake.snowpark.functions import sproc
 
-        self.snowpark_session.add_packages("snowflake-snowpark-python")
-        self.snowpark_session.add_packages("snowflake.core")
-        requirements = self._check_for_requirements_file(stage_path)
-        self.snowpark_session.add_packages(*requirements)
+        packages: List[Union[str, ModuleType]] = [
+            "snowflake-snowpark-python",
+            "snowflake.core",
+            *self._check_for_requirements_file(stage_path),
+        ]
 
-        @sproc(is_permanent=False, session=self.snowpark_session)
         def _python_execution_procedure(
             _: Session, file_path: str, variables: Dict | None = None
         ) -> None:
-            """Snowpark session-scoped stored procedure to execute content of provided Python file."""
+            """Snowpark stored procedure to execute content of provided Python file."""
             import json
 
             from snowflake.snowpark.files import SnowflakeFile
@@ -812,7 +1144,36 @@ class StageManager(SqlExecutionMixin):
 
             exec(wrapper + file_content)
 
-        return _python_execution_procedure
+        session = self.snowpark_session
+        schema = get_python_execution_schema()
+        if schema is None:
+            return sproc(
+                _python_execution_procedure,
+                is_permanent=False,
+                packages=packages,
+                session=session,
+            )
+
+        procedure_hash = _python_execution_procedure_hash(
+            packages, _python_execution_procedure
+        )
+        procedure_name = f"{schema}.{PYTHON_EXECUTION_PROCEDURE_PREFIX}{procedure_hash}"
+
+        def _create_procedure():
+            log.info("Creating Python execution procedure %s", procedure_name)
+            stage = FQN.from_string(f"{schema}.{PYTHON_EXECUTION_STAGE_NAME}")
+            self.create(stage)
+            sproc(
+                _python_execution_procedure,
+                name=procedure_name,
+                is_permanent=True,
+                stage_location=self.get_standard_stage_prefix(stage),
+                packages=packages,
+                if_not_exists=True,
+                session=session,
+            )
+
+        return _call_python_execution_procedure(procedure_name, _create_procedure)
 
     def _execute_python(
         self,
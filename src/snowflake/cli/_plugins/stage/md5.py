@@ -17,17 +17,21 @@ from __future__ import annotations
 import hashlib
 import logging
 import math
+import mmap
 import os.path
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from click.exceptions import ClickException
+from snowflake.cli._plugins.stage.md5_cache import Md5Cache
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
 from snowflake.connector.constants import S3_CHUNK_SIZE, S3_MAX_PARTS, S3_MIN_PART_SIZE
 
 ONE_MEGABYTE = 1024**2
 READ_BUFFER_BYTES = 64 * 1024
+LARGE_READ_BUFFER_BYTES = ONE_MEGABYTE
+MMAP_THRESHOLD_BYTES = 64 * ONE_MEGABYTE
 MD5SUM_REGEX = r"^[A-Fa-f0-9]{32}$"
 MULTIPART_MD5SUM_REGEX = r"^([A-Fa-f0-9]{32})-(\d+)$"
 
@@ -57,10 +61,81 @@ def parse_multipart_md5sum(checksum: str) -> Tuple[str, int] | None:
     return None
 
 
-def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
+class _ChunkedMd5:
     """
-    Returns a hexadecimal checksum for the file located at the given path.
-    If chunk_size is given, computes a multi-part md5sum.
+    Incrementally computes a simple md5sum (chunk_size=None) or a multi-part md5sum.
+    """
+
+    def __init__(self, chunk_size: int | None):
+        self.chunk_size = chunk_size
+        self._hasher = hashlib.md5()
+        self._remains_in_chunk = chunk_size or 0
+        self._digests: List[bytes] = []
+
+    def update(self, buf: memoryview) -> None:
+        if not self.chunk_size:
+            self._hasher.update(buf)
+            return
+
+        offset = 0
+        while offset < len(buf):
+            size = min(self._remains_in_chunk, len(buf) - offset)
+            self._hasher.update(buf[offset : offset + size])
+            offset += size
+            self._remains_in_chunk -= size
+            if self._remains_in_chunk == 0:
+                # push the hash of this chunk + reset
+                self._digests.append(self._hasher.digest())
+                self._hasher = hashlib.md5()
+                self._remains_in_chunk = self.chunk_size
+
+    def hexdigest(self) -> str:
+        if not self.chunk_size:
+            return self._hasher.hexdigest()
+
+        digests = self._digests
+        if self._remains_in_chunk != self.chunk_size:
+            # the last chunk was only partially filled
+            digests = digests + [self._hasher.digest()]
+
+        # multi-part hash (e.g. aws)
+        digests_md5 = hashlib.md5(b"".join(digests))
+        return f"{digests_md5.hexdigest()}-{len(digests)}"
+
+
+def _iter_file_buffers(f: BinaryIO, file_size: int) -> Iterator[memoryview]:
+    """
+    Yields consecutive buffers with the contents of the file. Large files are
+    memory-mapped and read in bigger slices to avoid extra copies.
+    """
+    if file_size >= MMAP_THRESHOLD_BYTES:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            log.debug("Could not memory-map file, falling back to buffered reads")
+        else:
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), LARGE_READ_BUFFER_BYTES):
+                    with view[offset : offset + LARGE_READ_BUFFER_BYTES] as buf:
+                        yield buf
+            return
+
+    buffer_size = (
+        LARGE_READ_BUFFER_BYTES
+        if file_size >= LARGE_READ_BUFFER_BYTES
+        else READ_BUFFER_BYTES
+    )
+    while data := f.read(buffer_size):
+        yield memoryview(data)
+
+
+def compute_md5sums(
+    file: Path, chunk_sizes: Sequence[int | None]
+) -> Dict[int | None, str]:
+    """
+    Returns hexadecimal checksums for the file located at the given path, one per
+    requested chunk size (None means a simple md5sum, otherwise a multi-part md5sum).
+    All checksums are computed in a single sequential read of the file.
     """
     if not file.is_file():
         raise ValueError(
@@ -74,45 +149,83 @@ def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
     file_size = os.path.getsize(file)
     if file_size == 0:
         # simple md5 with no content
-        return hashlib.md5().hexdigest()
+        return {chunk_size: hashlib.md5().hexdigest() for chunk_size in chunk_sizes}
 
+    hashers = [_ChunkedMd5(chunk_size) for chunk_size in dict.fromkeys(chunk_sizes)]
     with SecurePath(file).open("rb", read_file_limit_mb=UNLIMITED) as f:
-        md5s: List[hashlib._Hash] = []  # noqa: SLF001
-        hasher = hashlib.md5()
-
-        remains = file_size
-        remains_in_chunk: int = min(chunk_size, remains) if chunk_size else remains
-        while remains > 0:
-            sz = min(READ_BUFFER_BYTES, remains_in_chunk)
-            buf = f.read(sz)
-            hasher.update(buf)
-            remains_in_chunk -= sz
-            remains -= sz
-            if remains_in_chunk == 0:
-                if not chunk_size:
-                    # simple md5; only one chunk processed
-                    return hasher.hexdigest()
-                else:
-                    # push the hash of this chunk + reset
-                    md5s.append(hasher)
-                    hasher = hashlib.md5()
-                    remains_in_chunk = min(chunk_size, remains)
+        for buf in _iter_file_buffers(f, file_size):
+            for hasher in hashers:
+                hasher.update(buf)
 
-        # multi-part hash (e.g. aws)
-        digests = b"".join(m.digest() for m in md5s)
-        digests_md5 = hashlib.md5(digests)
-        return f"{digests_md5.hexdigest()}-{len(md5s)}"
+    return {hasher.chunk_size: hasher.hexdigest() for hasher in hashers}
 
 
-def file_matches_md5sum(local_file: Path, remote_md5: str | None) -> bool:
+def compute_md5sum(file: Path, chunk_size: int | None = None) -> str:
+    """
+    Returns a hexadecimal checksum for the file located at the given path.
+    If chunk_size is given, computes a multi-part md5sum.
+    """
+    return compute_md5sums(file, [chunk_size])[chunk_size]
+
+
+def _local_md5sums(
+    local_file: Path, chunk_sizes: Sequence[int | None], md5_cache: Optional[Md5Cache]
+) -> Dict[int | None, str]:
+    if md5_cache is not None:
+        return md5_cache.get_or_compute(local_file, chunk_sizes, compute_md5sums)
+    return compute_md5sums(local_file, chunk_sizes)
+
+
+def _multipart_chunk_size_candidates(file_size: int, num_chunks: int) -> List[int]:
+    """
+    Returns the chunk sizes a file with the given size may have been uploaded with,
+    most likely first, so that it ends up in exactly num_chunks parts.
+    """
+    candidates = []
+
+    # If this file uses the maximum number of parts supported by the cloud backend,
+    # the chunk size is likely not a clean multiple of a megabyte. Try reverse engineering
+    # from the file size first, then fall back to the usual detection method.
+    # At time of writing this logic would trigger for files >= 80GiB (python connector)
+    if num_chunks == S3_MAX_PARTS:
+        candidates.append(max(math.ceil(file_size / S3_MAX_PARTS), S3_MIN_PART_SIZE))
+
+    # Estimates the chunk size the multi-part file must have been uploaded with
+    # by trying chunk sizes that give the most evenly-sized chunks.
+    #
+    # First we'll try the chunk size that's a multiple of S3_CHUNK_SIZE (8mb) from
+    # the python connector that results in num_chunks, then we'll do the same with
+    # a smaller granularity (1mb) that is used by default in some AWS multi-part
+    # upload implementations.
+    #
+    # We're working backwards from num_chunks here because it's the only value we know.
+    for chunk_size_alignment in [S3_CHUNK_SIZE, ONE_MEGABYTE]:
+        # +1 because we need at least one chunk when file_size < num_chunks * chunk_size_alignment
+        # -1 because we don't want to add an extra chunk when file_size is an exact multiple of num_chunks * chunk_size_alignment
+        multiplier = 1 + ((file_size - 1) // (num_chunks * chunk_size_alignment))
+        candidates.append(multiplier * chunk_size_alignment)
+
+    # a chunk size that does not split the file into num_chunks parts can never match
+    return [
+        chunk_size
+        for chunk_size in dict.fromkeys(candidates)
+        if math.ceil(file_size / chunk_size) == num_chunks
+    ]
+
+
+def file_matches_md5sum(
+    local_file: Path, remote_md5: str | None, md5_cache: Optional[Md5Cache] = None
+) -> bool:
     """
     Try a few different md5sums to determine if a local file is identical
     to a file that has a given remote md5sum.
 
     Handles the multi-part md5sums generated by e.g. AWS S3, using values
     from the Python connector to make educated guesses on chunk size.
+    All candidate md5sums are computed in a single read of the local file.
 
-    Assumes that upload time would dominate local hashing time.
+    If md5_cache is given, previously computed md5sums of unchanged files are
+    reused instead of reading the file contents again.
     """
     if not remote_md5:
         # no hash available
@@ -120,37 +233,17 @@ def file_matches_md5sum(local_file: Path, remote_md5: str | None) -> bool:
 
     if is_md5sum(remote_md5):
         # regular hash
-        return compute_md5sum(local_file) == remote_md5
+        return _local_md5sums(local_file, [None], md5_cache)[None] == remote_md5
 
     if md5_and_chunks := parse_multipart_md5sum(remote_md5):
         # multi-part hash (e.g. aws)
         (_, num_chunks) = md5_and_chunks
         file_size = os.path.getsize(local_file)
 
-        # If this file uses the maximum number of parts supported by the cloud backend,
-        # the chunk size is likely not a clean multiple of a megabyte. Try reverse engineering
-        # from the file size first, then fall back to the usual detection method.
-        # At time of writing this logic would trigger for files >= 80GiB (python connector)
-        if num_chunks == S3_MAX_PARTS:
-            chunk_size = max(math.ceil(file_size / S3_MAX_PARTS), S3_MIN_PART_SIZE)
-            if compute_md5sum(local_file, chunk_size) == remote_md5:
-                return True
-
-        # Estimates the chunk size the multi-part file must have been uploaded with
-        # by trying chunk sizes that give the most evenly-sized chunks.
-        #
-        # First we'll try the chunk size that's a multiple of S3_CHUNK_SIZE (8mb) from
-        # the python connector that results in num_chunks, then we'll do the same with
-        # a smaller granularity (1mb) that is used by default in some AWS multi-part
-        # upload implementations.
-        #
-        # We're working backwards from num_chunks here because it's the only value we know.
-        for chunk_size_alignment in [S3_CHUNK_SIZE, ONE_MEGABYTE]:
-            # +1 because we need at least one chunk when file_size < num_chunks * chunk_size_alignment
-            # -1 because we don't want to add an extra chunk when file_size is an exact multiple of num_chunks * chunk_size_alignment
-            multiplier = 1 + ((file_size - 1) // (num_chunks * chunk_size_alignment))
-            chunk_size = multiplier * chunk_size_alignment
-            if compute_md5sum(local_file, chunk_size) == remote_md5:
+        chunk_sizes = _multipart_chunk_size_candidates(file_size, num_chunks)
+        if chunk_sizes:
+            md5s = _local_md5sums(local_file, chunk_sizes, md5_cache)
+            if remote_md5 in md5s.values():
                 return True
 
         # we were unable to figure out the chunk size, or the files are different
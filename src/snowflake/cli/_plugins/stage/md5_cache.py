@@ -0,0 +1,184 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from snowflake.cli.api.exceptions import FileTooLargeError
+from snowflake.cli.api.project.project_paths import ProjectPaths
+from snowflake.cli.api.secure_path import SecurePath
+
+log = logging.getLogger(__name__)
+
+MD5_CACHE_VERSION = 1
+MD5_CACHE_FILE_NAME = "md5_cache.json"
+MD5_CACHE_DEFAULT_MAX_ENTRIES = 200_000
+MD5_CACHE_FILE_SIZE_LIMIT_MB = 256
+
+# (size, mtime_ns, inode) of a local file at the time it was hashed
+FileStatKey = Tuple[int, int, int]
+
+
+def md5_cache_path(project_root: Path) -> Path:
+    """
+    Location of the md5 cache for a given project.
+    """
+    return ProjectPaths(project_root).cache_root / MD5_CACHE_FILE_NAME
+
+
+def file_stat_key(file: Path) -> FileStatKey:
+    stat = os.stat(file)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _chunk_key(chunk_size: int | None) -> str:
+    return str(chunk_size or 0)
+
+
+class Md5Cache:
+    """
+    On-disk cache of local file md5sums, keyed by resolved path and chunk size.
+    Entries are only valid as long as the file's size, mtime and inode are unchanged;
+    stale entries are dropped on lookup. The least recently used entries are evicted
+    once the cache holds more than max_entries files.
+
+    The cache is safe to use from multiple threads; call save() to persist it.
+    """
+
+    def __init__(
+        self, path: Path, max_entries: int = MD5_CACHE_DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self._path = SecurePath(path)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_root: Path, **kwargs) -> Md5Cache:
+        return cls(md5_cache_path(project_root), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(
+                self._path.read_text(file_size_limit_mb=MD5_CACHE_FILE_SIZE_LIMIT_MB)
+            )
+        except (OSError, ValueError, FileTooLargeError) as err:
+            log.debug("Ignoring unreadable md5 cache %s: %s", self._path, err)
+            return
+        if not isinstance(data, dict) or data.get("version") != MD5_CACHE_VERSION:
+            log.debug("Ignoring md5 cache %s with unknown version", self._path)
+            return
+        self._entries = OrderedDict(data.get("entries", {}))
+
+    def get(
+        self,
+        file: Path,
+        chunk_size: int | None = None,
+        fingerprint: FileStatKey | None = None,
+    ) -> Optional[str]:
+        """
+        Returns the cached md5sum for the file, or None if it is unknown or stale.
+        """
+        key = str(file.resolve())
+        fingerprint = fingerprint or file_stat_key(file)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if tuple(entry["stat"]) != fingerprint:
+                del self._entries[key]
+                self._dirty = True
+                return None
+            self._entries.move_to_end(key)
+            return entry["md5"].get(_chunk_key(chunk_size))
+
+    def put(
+        self,
+        file: Path,
+        md5s: Dict[int | None, str],
+        fingerprint: FileStatKey | None = None,
+    ) -> None:
+        """
+        Records md5sums (by chunk size) for the file's contents. The fingerprint should be
+        taken before the file was read, so that concurrent modifications invalidate the entry.
+        """
+        key = str(file.resolve())
+        fingerprint = fingerprint or file_stat_key(file)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or tuple(entry["stat"]) != fingerprint:
+                entry = {"stat": list(fingerprint), "md5": {}}
+                self._entries[key] = entry
+            entry["md5"].update({_chunk_key(c): md5 for c, md5 in md5s.items()})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get_or_compute(
+        self,
+        file: Path,
+        chunk_sizes: Sequence[int | None],
+        compute: Callable[[Path, Sequence[int | None]], Dict[int | None, str]],
+    ) -> Dict[int | None, str]:
+        """
+        Returns md5sums of the file for all requested chunk sizes, calling
+        compute(file, missing_chunk_sizes) only for the ones not in the cache.
+        """
+        fingerprint = file_stat_key(file)
+        md5s: Dict[int | None, str] = {}
+        missing: List[int | None] = []
+        for chunk_size in chunk_sizes:
+            md5 = self.get(file, chunk_size, fingerprint=fingerprint)
+            if md5 is None:
+                missing.append(chunk_size)
+            else:
+                md5s[chunk_size] = md5
+        if missing:
+            computed = compute(file, missing)
+            self.put(file, computed, fingerprint=fingerprint)
+            md5s.update(computed)
+        return md5s
+
+    def save(self) -> None:
+        """
+        Persists the cache if it was modified. Failures are logged and ignored,
+        as the cache is only an optimisation.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": MD5_CACHE_VERSION, "entries": self._entries}
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._path.parent / f".{self._path.name}.tmp"
+                tmp_path.write_text(json.dumps(data))
+                os.replace(tmp_path.path, self._path.path)
+                self._dirty = False
+            except OSError as err:
+                log.debug("Could not save md5 cache %s: %s", self._path, err)
@@ -0,0 +1,151 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from snowflake.cli.api.exceptions import FileTooLargeError
+from snowflake.cli.api.project.project_paths import ProjectPaths
+from snowflake.cli.api.secure_path import SecurePath
+
+from .md5_cache import FileStatKey, file_stat_key
+
+log = logging.getLogger(__name__)
+
+SYNC_MANIFEST_VERSION = 2
+SYNC_MANIFEST_FILE_NAME = "sync_manifest.json"
+SYNC_MANIFEST_FILE_SIZE_LIMIT_MB = 256
+
+
+def sync_manifest_path(project_root: Path) -> Path:
+    return ProjectPaths(project_root).cache_root / SYNC_MANIFEST_FILE_NAME
+
+
+@dataclass
+class SyncedFile:
+    md5: Optional[str]
+    "md5 reported by the stage, None if the file was uploaded since the stage was last listed"
+
+    local_fingerprint: Optional[FileStatKey] = None
+    "Fingerprint of the local file known to have the same contents as the stage file"
+
+    def to_dict(self) -> dict:
+        return {
+            "md5": self.md5,
+            "stat": list(self.local_fingerprint) if self.local_fingerprint else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SyncedFile:
+        stat = data.get("stat")
+        fingerprint: Optional[FileStatKey] = tuple(stat) if stat else None  # type: ignore[assignment]
+        return cls(md5=data.get("md5"), local_fingerprint=fingerprint)
+
+    def matches_local_file(self, local_file: Path) -> bool:
+        return (
+            self.local_fingerprint is not None
+            and file_stat_key(local_file) == self.local_fingerprint
+        )
+
+
+class SyncManifest:
+    """
+    Local record of the last known contents of stages synced from a project.
+
+    For every stage path, the manifest keeps the stage md5 of each file and the stat
+    fingerprint of the local file it was synced from. While no local file changed since
+    the last sync, the stage is assumed unchanged and does not need to be listed.
+    Changes made to the stage by other means are only noticed once it is listed again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = SecurePath(path)
+        self._stages: Dict[str, dict] = {}
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> SyncManifest:
+        return cls(sync_manifest_path(project_root))
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(
+                self._path.read_text(
+                    file_size_limit_mb=SYNC_MANIFEST_FILE_SIZE_LIMIT_MB
+                )
+            )
+        except (OSError, ValueError, FileTooLargeError) as err:
+            log.debug("Ignoring unreadable sync manifest %s: %s", self._path, err)
+            return
+        if not isinstance(data, dict) or data.get("version") != SYNC_MANIFEST_VERSION:
+            log.debug("Ignoring sync manifest %s with unknown version", self._path)
+            return
+        self._stages = data.get("stages", {})
+
+    def get_files(self, stage_path: str) -> Optional[Dict[str, SyncedFile]]:
+        """Returns the recorded files of the stage path, or None if nothing is recorded."""
+        stage = self._stages.get(stage_path)
+        if stage is None:
+            return None
+        return {
+            path: SyncedFile.from_dict(entry)
+            for path, entry in stage.get("files", {}).items()
+        }
+
+    def set_files(self, stage_path: str, files: Dict[str, SyncedFile]) -> None:
+        self._stages[stage_path] = {
+            "files": {path: file.to_dict() for path, file in files.items()},
+        }
+
+    def record_sync(
+        self,
+        stage_path: str,
+        deploy_root: Path,
+        uploaded: Iterable[str],
+        removed: Iterable[str],
+    ) -> None:
+        """
+        Applies the result of a sync to the recorded files of the stage path. Uploaded
+        files have no known stage md5, but are remembered by their local fingerprint.
+        """
+        stage = self._stages.setdefault(stage_path, {"files": {}})
+        files = stage["files"]
+        for path in removed:
+            files.pop(path, None)
+        for path in uploaded:
+            files[path] = SyncedFile(
+                md5=None, local_fingerprint=file_stat_key(deploy_root / path)
+            ).to_dict()
+
+    def save(self) -> None:
+        """
+        Persists the manifest. Failures are logged and ignored,
+        as the manifest is only an optimisation.
+        """
+        data = {"version": SYNC_MANIFEST_VERSION, "stages": self._stages}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.parent / f".{self._path.name}.tmp"
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path.path, self._path.path)
+        except OSError as err:
+            log.debug("Could not save sync manifest %s: %s", self._path, err)
@@ -129,7 +129,7 @@ def _default_file_callback(param_name: str):
     return _check_file_exists_if_not_default
 
 
-@app.command("deploy", requires_connection=True)
+@app.command("deploy", requires_connection=True, connect_early=True)
 @with_project_definition()
 @with_experimental_behaviour()
 def streamlit_deploy(
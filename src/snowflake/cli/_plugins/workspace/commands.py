@@ -84,7 +84,7 @@ def bundle(
     return MessageResult(f"Bundle generated at {bundle_map.deploy_root()}")
 
 
-@ws.command(requires_connection=True, hidden=True)
+@ws.command(requires_connection=True, hidden=True, connect_early=True)
 @with_project_definition()
 def deploy(
     entity_id: str = typer.Option(
@@ -21,7 +21,12 @@ from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterator, Optional
 
-from snowflake.cli.api.connections import ConnectionContext, OpenConnectionCache
+from snowflake.cli.api.connections import (
+    ConnectionContext,
+    ConnectionLease,
+    ConnectionPool,
+    OpenConnectionCache,
+)
 from snowflake.cli.api.exceptions import MissingConfigurationError
 from snowflake.cli.api.metrics import CLIMetrics
 from snowflake.cli.api.output.formats import OutputFormat
@@ -44,6 +49,7 @@ class _CliGlobalContextManager:
     )
 
     output_format: OutputFormat = OutputFormat.TABLE
+    output_file: Path | None = None
     silent: bool = False
     verbose: bool = False
     experimental: bool = False
@@ -112,8 +118,47 @@ class _CliGlobalContextManager:
         does not already exist, creates a new connection and caches it.
         """
         self.connection_context.validate_and_complete()
+        lease = self._connection_lease()
+        if lease:
+            return lease.connection
         return self.connection_cache[self.connection_context]
 
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """
+        Returns the pool of connections for our configured context, to be leased
+        by worker threads via use_pooled_connection.
+        """
+        self.connection_context.validate_and_complete()
+        return self.connection_cache.pool(self.connection_context)
+
+    def connect_in_background(self) -> None:
+        """
+        Starts opening the connection for our configured context on a background
+        thread. It is awaited when the connection property is first accessed.
+        """
+        self.connection_context.validate_and_complete()
+        self.connection_cache.connect_in_background(self.connection_context)
+
+    @property
+    def session_state(self) -> dict[str, str | None]:
+        """
+        Returns the last known session state of the connection for our configured
+        context, without opening the connection.
+        """
+        self.connection_context.validate_and_complete()
+        lease = self._connection_lease()
+        if lease:
+            return lease.session_state
+        return self.connection_cache.session_state(self.connection_context)
+
+    def _connection_lease(self) -> ConnectionLease | None:
+        lease = _CONNECTION_LEASE.get()
+        # forked contexts with a different connection do not use the lease
+        if lease and lease.pool.key == repr(self.connection_context):
+            return lease
+        return None
+
     def _definition_manager_or_raise(self) -> DefinitionManager:
         """
         (Re-)parses project definition based on project args (project_path_arg and
@@ -156,6 +201,10 @@ class _CliGlobalContextAccess:
     def connection_context(self) -> ConnectionContext:
         return self._manager.connection_context
 
+    @property
+    def session_state(self) -> dict[str, str | None]:
+        return self._manager.session_state
+
     @property
     def enable_tracebacks(self) -> bool:
         return self._manager.enable_tracebacks
@@ -168,6 +217,10 @@ class _CliGlobalContextAccess:
     def output_format(self) -> OutputFormat:
         return self._manager.output_format
 
+    @property
+    def output_file(self) -> Path | None:
+        return self._manager.output_file
+
     @property
     def verbose(self) -> bool:
         return self._manager.verbose
@@ -197,7 +250,7 @@ class _CliGlobalContextAccess:
     @property
     def _should_force_mute_intermediate_output(self) -> bool:
         """Computes whether cli_console output should be muted."""
-        return self._manager.output_format == OutputFormat.JSON
+        return self._manager.output_format != OutputFormat.TABLE
 
     @property
     def snow_api_root(
@@ -224,6 +277,11 @@ _CLI_CONTEXT_MANAGER: ContextVar[_CliGlobalContextManager | None] = ContextVar(
 )
 
 
+_CONNECTION_LEASE: ContextVar[ConnectionLease | None] = ContextVar(
+    "cli_connection_lease", default=None
+)
+
+
 def get_cli_context_manager() -> _CliGlobalContextManager:
     mgr = _CLI_CONTEXT_MANAGER.get()
     if not mgr:
@@ -256,6 +314,21 @@ def span(span_name: str):
     return decorator
 
 
+@contextmanager
+def use_pooled_connection(pool: ConnectionPool) -> Iterator[None]:
+    """
+    Makes the CLI context use a connection leased from the pool instead of the
+    cached connection while inside this context manager. The connection is leased
+    on first use and returned to the pool at exit.
+    """
+    with pool.lease() as lease:
+        token = _CONNECTION_LEASE.set(lease)
+        try:
+            yield
+        finally:
+            _CONNECTION_LEASE.reset(token)
+
+
 @contextmanager
 def fork_cli_context(
     connection_overrides: dict | None = None,
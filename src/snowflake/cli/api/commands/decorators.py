@@ -17,6 +17,7 @@ from __future__ import annotations
 import inspect
 from functools import wraps
 from inspect import Signature
+from pathlib import Path
 from typing import Callable, Dict, List, Optional, get_type_hints
 
 from snowflake.cli.api.cli_global_context import get_cli_context
@@ -42,6 +43,7 @@ from snowflake.cli.api.commands.flags import (
     OauthEnableSingleUseRefreshTokensOption,
     OauthRedirectUriOption,
     OauthScopeOption,
+    OutputFileOption,
     OutputFormatOption,
     PasswordOption,
     PortOption,
@@ -64,28 +66,39 @@ from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import CommandResult
 
 
-def global_options(func: Callable):
+def global_options(func: Callable, with_output_file: bool = False):
     """
     Decorator providing default flags for overriding global parameters. Values are
     updated in global SnowCLI state.
 
+    If with_output_file is set, --output-file is added next to --format.
+
     To use this decorator your command needs to accept **options as last argument.
     """
-    return _global_options_decorator_factory(func, GLOBAL_OPTIONS)
+    return _global_options_decorator_factory(func, _global_options(with_output_file))
 
 
-def global_options_with_connection(func: Callable):
+def global_options_with_connection(func: Callable, with_output_file: bool = False):
     """
     Decorator providing default flags including connection flags for overriding
     global parameters. Values are updated in global SnowCLI state.
 
+    If with_output_file is set, --output-file is added next to --format.
+
     To use this decorator your command needs to accept **options as last argument.
     """
     return _global_options_decorator_factory(
-        func, [*GLOBAL_CONNECTION_OPTIONS, *GLOBAL_OPTIONS]
+        func, [*GLOBAL_CONNECTION_OPTIONS, *_global_options(with_output_file)]
     )
 
 
+def _global_options(with_output_file: bool) -> List[inspect.Parameter]:
+    if not with_output_file:
+        return GLOBAL_OPTIONS
+    format_option, *other_options = GLOBAL_OPTIONS
+    return [format_option, OUTPUT_FILE_OPTION, *other_options]
+
+
 def with_project_definition(is_optional: bool = False):
     def _decorator(func: Callable):
         return _options_decorator_factory(
@@ -427,6 +440,13 @@ GLOBAL_OPTIONS = [
     ),
 ]
 
+OUTPUT_FILE_OPTION = inspect.Parameter(
+    "output_file",
+    inspect.Parameter.KEYWORD_ONLY,
+    annotation=Optional[Path],
+    default=OutputFileOption,
+)
+
 
 def with_output(func):
     from snowflake.cli._app.printing import print_result
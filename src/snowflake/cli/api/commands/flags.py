@@ -420,12 +420,23 @@ DiagAllowlistPathOption: Path = typer.Option(
 OutputFormatOption = typer.Option(
     OutputFormat.TABLE.value,
     "--format",
-    help="Specifies the output format.",
+    help="Specifies the output format: TABLE, JSON, CSV, NDJSON or PARQUET.",
+    metavar="FORMAT",
     case_sensitive=False,
     callback=_context_callback("output_format"),
     rich_help_panel=_CLI_BEHAVIOUR,
 )
 
+OutputFileOption = typer.Option(
+    None,
+    "--output-file",
+    help="Writes the command output to the given file instead of the standard output.",
+    callback=_context_callback("output_file"),
+    show_default=False,
+    dir_okay=False,
+    rich_help_panel=_CLI_BEHAVIOUR,
+)
+
 SilentOption = typer.Option(
     False,
     "--silent",
@@ -22,6 +22,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 import click
 import typer
 from click import ClickException
+from snowflake.cli.api.cli_global_context import get_cli_context_manager
 from snowflake.cli.api.commands.decorators import (
     global_options,
     global_options_with_connection,
@@ -92,12 +93,18 @@ class SnowTyper(typer.Typer):
         requires_connection: bool = False,
         is_enabled: Callable[[], bool] | None = None,
         require_warehouse: bool = False,
+        supports_output_file: bool = False,
+        connect_early: bool = False,
         **kwargs,
     ):
         """
         Custom implementation of Typer.command that adds ability to execute additional
         logic before and after execution as well as process the result and act on possible
         errors.
+
+        connect_early starts logging in on a background thread when a command requiring
+        connection is invoked. It is meant for commands doing local work, like bundling,
+        before their first query.
         """
         name = sanitize_for_terminal(name)
         self._sanitize_kwargs(kwargs)
@@ -110,18 +117,27 @@ class SnowTyper(typer.Typer):
             command_callable.__doc__ = sanitize_for_terminal(command_callable.__doc__)
 
             if requires_connection:
-                command_callable = global_options_with_connection(command_callable)
+                command_callable = global_options_with_connection(
+                    command_callable, with_output_file=supports_output_file
+                )
             elif requires_global_options:
-                command_callable = global_options(command_callable)
+                command_callable = global_options(
+                    command_callable, with_output_file=supports_output_file
+                )
 
             @wraps(command_callable)
             def command_callable_decorator(*args, **kw):
                 """Wrapper around command callable. This is what happens at "runtime"."""
+                from snowflake.cli._app.printing import keep_output_file_open
+
                 execution = ExecutionMetadata()
+                if requires_connection:
+                    self._prepare_connection(connect_early)
                 self.pre_execute(execution, require_warehouse=require_warehouse)
                 try:
-                    result = command_callable(*args, **kw)
-                    self.process_result(result)
+                    with keep_output_file_open():
+                        result = command_callable(*args, **kw)
+                        self.process_result(result)
                     execution.complete(ExecutionStatus.SUCCESS)
                 except BaseException as err:
                     execution.complete(ExecutionStatus.FAILURE)
@@ -152,6 +168,23 @@ class SnowTyper(typer.Typer):
                 "The command requires warehouse. No warehouse found in current connection."
             )
 
+    @staticmethod
+    def _prepare_connection(connect_early: bool):
+        """
+        Resolves the connection of the command, like the default connection name.
+        With connect_early, also starts logging in on a background thread, which lets
+        logging in overlap with the local work commands do before their first query,
+        like bundling. Errors are raised when the connection is first used.
+        """
+        cli_context_manager = get_cli_context_manager()
+        try:
+            if connect_early:
+                cli_context_manager.connect_in_background()
+            else:
+                cli_context_manager.connection_context.validate_and_complete()
+        except Exception as err:
+            log.debug("Could not prepare connection: %s", err)
+
     @staticmethod
     def process_result(result):
         """Command result processor"""
@@ -317,6 +317,25 @@ def get_config_bool_value(*path, key: str, default: Optional[bool]) -> Optional[
         )
 
 
+def get_config_positive_int_value(
+    *path, key: str, default: Optional[int]
+) -> Optional[int]:
+    value = get_config_value(*path, key=key, default=None)
+
+    if value is None:
+        return default
+
+    try:
+        int_value = int(value)
+    except (TypeError, ValueError):
+        int_value = 0
+    if int_value < 1:
+        raise ClickException(
+            f"Expected positive integer value for {'.'.join((*path, key))} option."
+        )
+    return int_value
+
+
 def _initialise_config(config_file: Path) -> None:
     config_file = SecurePath(config_file)
     config_file.parent.mkdir(parents=True, exist_ok=True)
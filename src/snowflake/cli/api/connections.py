@@ -17,13 +17,22 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import threading
+import time
 import warnings
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager, suppress
 from dataclasses import asdict, dataclass, field, fields, replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from snowflake.cli.api.config import get_connection_dict, get_default_connection_name
+from snowflake.cli.api.config import (
+    get_connection_dict,
+    get_default_connection_name,
+    get_env_value,
+)
 from snowflake.cli.api.exceptions import InvalidSchemaError
+from snowflake.cli.api.utils.concurrency import in_current_context
 from snowflake.connector import SnowflakeConnection
 from snowflake.connector.compat import IS_WINDOWS
 
@@ -31,6 +40,13 @@ logger = logging.getLogger(__name__)
 
 schema_pattern = re.compile(r".+\..+")
 
+# Authenticators which need user interaction, e.g. in a browser or the terminal
+INTERACTIVE_AUTHENTICATORS = {
+    "externalbrowser",
+    "oauth_authorization_code",
+    "username_password_mfa",
+}
+
 
 @dataclass
 class ConnectionContext:
@@ -139,6 +155,20 @@ class ConnectionContext:
         if not self.temporary_connection and not self.connection_name:
             self.connection_name = get_default_connection_name()
 
+    def requires_user_interaction(self) -> bool:
+        """
+        Whether logging in may need user interaction, judging by the authenticator
+        resolved the same way as in connect_to_snowflake.
+        """
+        authenticator = self.authenticator
+        if not authenticator and self.connection_name:
+            authenticator = get_connection_dict(self.connection_name).get(
+                "authenticator"
+            )
+        if not authenticator:
+            authenticator = get_env_value(key="authenticator")
+        return str(authenticator or "").lower() in INTERACTIVE_AUTHENTICATORS
+
     def build_connection(self):
         from snowflake.cli._app.snow_connector import connect_to_snowflake
 
@@ -154,23 +184,156 @@ class ConnectionContext:
         return connect_to_snowflake(**self.present_values_as_dict())
 
 
+class ConnectionPool:
+    """
+    A bounded pool of connections for a single ConnectionContext, which are leased
+    to worker threads so that they can run queries concurrently. Connections are
+    opened when no idle one is available, and idle connections are checked to be
+    alive before they are leased again. The pool is independent of the cached
+    connection of the context, so session changes (e.g. USE ROLE) made on one are
+    not visible on the others.
+    """
+
+    HEALTH_CHECK_AFTER_SEC: float = 60.0
+    """Connections idle for longer are validated with the server before being leased."""
+
+    def __init__(self, ctx: ConnectionContext, max_size: int):
+        self.key = repr(ctx)
+        self._ctx = ctx.clone()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: list[tuple[SnowflakeConnection, float]] = []
+        self._session_states: dict[int, dict[str, Optional[str]]] = {}
+        self._closed = False
+
+    @contextmanager
+    def lease(self) -> Iterator[ConnectionLease]:
+        """
+        Leases a connection until exit. The connection is taken from the pool when it
+        is first accessed, waiting for one to be returned if max_size are leased.
+        """
+        lease = ConnectionLease(self)
+        try:
+            yield lease
+        finally:
+            lease.release()
+
+    def acquire(self) -> SnowflakeConnection:
+        self._slots.acquire()
+        try:
+            return self._take_idle_connection() or self._ctx.build_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: SnowflakeConnection) -> None:
+        with self._lock:
+            keep = not self._closed and not connection.is_closed()
+            if keep:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self._session_states.pop(id(connection), None)
+        if not keep:
+            connection.close()
+        self._slots.release()
+
+    def session_state(
+        self, connection: SnowflakeConnection
+    ) -> dict[str, Optional[str]]:
+        with self._lock:
+            return self._session_states.setdefault(id(connection), {})
+
+    def close(self) -> None:
+        """Closes idle connections; leased ones are closed when they are returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def _take_idle_connection(self) -> Optional[SnowflakeConnection]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                connection, idle_since = self._idle.pop()
+            if self._is_healthy(connection, idle_since):
+                return connection
+            logger.debug(
+                "ConnectionPool: discarding broken connection for %s", self.key
+            )
+            self._discard(connection)
+
+    def _is_healthy(self, connection: SnowflakeConnection, idle_since: float) -> bool:
+        if connection.is_closed():
+            return False
+        if time.monotonic() - idle_since < self.HEALTH_CHECK_AFTER_SEC:
+            return True
+        return connection.is_valid()
+
+    def _discard(self, connection: SnowflakeConnection) -> None:
+        with self._lock:
+            self._session_states.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception as err:
+            logger.debug("ConnectionPool: failed to close connection: %s", err)
+
+
+class ConnectionLease:
+    """A connection of a ConnectionPool, taken from the pool on first access."""
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+        self._connection: Optional[SnowflakeConnection] = None
+
+    @property
+    def connection(self) -> SnowflakeConnection:
+        if self._connection is None:
+            self._connection = self.pool.acquire()
+        return self._connection
+
+    @property
+    def session_state(self) -> dict[str, Optional[str]]:
+        return self.pool.session_state(self.connection)
+
+    def release(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self.pool.release(connection)
+
+
 class OpenConnectionCache:
     """
     A connection cache that transparently manages SnowflakeConnection objects
     and is keyed by ConnectionContext objects, e.g. cache[ctx].execute_string(...).
     Connections are automatically closed after CONNECTION_CLEANUP_SEC, but
     are guaranteed to be open (if config is valid) when returned by the cache.
+    The cache also keeps the last known session state (current role, warehouse,
+    database and schema) of every connection, which is dropped with the connection.
+    Connections can be opened ahead of their first access on a background thread.
+    For concurrent work, the cache also keeps a ConnectionPool per context, which is
+    closed together with the cached connection.
     """
 
     connections: dict[str, SnowflakeConnection]
     cleanup_futures: dict[str, asyncio.TimerHandle]
+    session_states: dict[str, dict[str, Optional[str]]]
+    pending_connections: dict[str, Future]
+    pools: dict[str, ConnectionPool]
 
     CONNECTION_CLEANUP_SEC: float = 10.0 * 60
     """Connections are closed this many seconds after the last time they are accessed."""
 
+    CONNECTION_POOL_SIZE: int = 8
+    """At most this many connections per context are leased from its pool at once."""
+
     def __init__(self):
         self.connections = {}
         self.cleanup_futures = {}
+        self.session_states = {}
+        self.pending_connections = {}
+        self.pools = {}
 
     def __getitem__(self, ctx):
         if not isinstance(ctx, ConnectionContext):
@@ -179,13 +342,80 @@ class OpenConnectionCache:
             )
         key = repr(ctx)
         if not self._has_open_connection(key):
-            self._insert(key, ctx)
+            if key in self.pending_connections:
+                self._await_pending_connection(key)
+            else:
+                self._insert(key, ctx)
         self._touch(key)
         return self.connections[key]
 
+    def connect_in_background(self, ctx: ConnectionContext) -> None:
+        """
+        Starts opening the connection for the given context on a background thread,
+        so that logging in overlaps with local work of the command. The connection
+        is awaited when it is first accessed, and errors are raised then.
+        Logins which may need user interaction are left to the first access.
+        """
+        key = repr(ctx)
+        if self._has_open_connection(key) or key in self.pending_connections:
+            return
+        if ctx.requires_user_interaction():
+            return
+
+        future: Future = Future()
+        ctx = ctx.clone()
+
+        def connect():
+            try:
+                connection = ctx.build_connection()
+            except BaseException as err:
+                with suppress(InvalidStateError):
+                    future.set_exception(err)
+                return
+            try:
+                future.set_result(connection)
+            except InvalidStateError:
+                # the cache was cleared while logging in
+                connection.close()
+
+        self.pending_connections[key] = future
+        # connect_to_snowflake reads the CLI context and the click context
+        threading.Thread(
+            target=in_current_context(connect),
+            name=f"connect-{ctx.connection_name or 'temporary'}",
+            daemon=True,
+        ).start()
+
+    def pool(self, ctx: ConnectionContext) -> ConnectionPool:
+        """
+        Returns the connection pool for the given context, which lives as long as
+        the cached connection would. Does not open any connection.
+        """
+        key = repr(ctx)
+        if key not in self.pools:
+            self.pools[key] = ConnectionPool(ctx, max_size=self.CONNECTION_POOL_SIZE)
+        self._touch(key)
+        return self.pools[key]
+
+    def session_state(self, ctx: ConnectionContext) -> dict[str, Optional[str]]:
+        """
+        Returns the mutable session state of the connection for the given context.
+        Does not open the connection.
+        """
+        return self.session_states.setdefault(repr(ctx), {})
+
     def clear(self):
         """Closes all connections and resets the cache to its initial state."""
-        connection_keys = list(self.connections.keys())
+        # connections still being opened in the background are closed once open,
+        # so tearing down the cache does not wait for their login
+        for future in self.pending_connections.values():
+            if not future.done():
+                future.cancel()
+            elif future.exception() is None:
+                future.result().close()
+        self.pending_connections.clear()
+
+        connection_keys = set(self.connections) | set(self.pools)
         for key in connection_keys:
             self._cleanup(key)
 
@@ -193,6 +423,7 @@ class OpenConnectionCache:
         for future in self.cleanup_futures.values():
             future.cancel()
         self.cleanup_futures.clear()
+        self.session_states.clear()
 
     def _has_open_connection(self, key: str):
         return key in self.connections
@@ -211,6 +442,17 @@ class OpenConnectionCache:
             )
             raise
 
+    def _await_pending_connection(self, key: str):
+        future = self.pending_connections.pop(key)
+        try:
+            self.connections[key] = future.result()
+        except Exception:
+            logger.debug(
+                "ConnectionCache: failed to connect using %s in background; not caching.",
+                key,
+            )
+            raise
+
     def _cancel_cleanup_future_if_exists(self, key: str):
         if key in self.cleanup_futures:
             self.cleanup_futures.pop(key).cancel()
@@ -239,10 +481,13 @@ class OpenConnectionCache:
         )
 
     def _cleanup(self, key: str):
-        """Closes the cached connection at the given key."""
-        if key not in self.connections:
-            logger.debug("Cleaning up connection %s, but not found in cache!", key)
-
+        """Closes the cached connection and the pooled connections at the given key."""
         # doesn't cancel in-flight async queries
         self._cancel_cleanup_future_if_exists(key)
+        self.session_states.pop(key, None)
+        if key in self.pools:
+            self.pools.pop(key).close()
+        if key not in self.connections:
+            logger.debug("Cleaning up connection %s, but not found in cache!", key)
+            return
         self.connections.pop(key).close()
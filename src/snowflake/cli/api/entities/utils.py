@@ -1,4 +1,3 @@
-import os
 from enum import Enum
 from pathlib import Path
 from typing import Any, List, NoReturn, Optional
@@ -16,6 +15,7 @@ from snowflake.cli._plugins.stage.diff import (
     StagePathType,
     compute_stage_diff,
     preserve_from_diff,
+    record_sync_in_manifest,
     sync_local_diff_with_stage,
     to_stage_path,
 )
@@ -23,6 +23,8 @@ from snowflake.cli._plugins.stage.manager import (
     StageManager,
     StagePathParts,
 )
+from snowflake.cli._plugins.stage.md5_cache import Md5Cache
+from snowflake.cli._plugins.stage.sync_manifest import SyncManifest
 from snowflake.cli._plugins.stage.utils import print_diff_to_console
 from snowflake.cli.api.artifacts.bundle_map import BundleMap
 from snowflake.cli.api.cli_global_context import get_cli_context, span
@@ -36,6 +38,7 @@ from snowflake.cli.api.exceptions import (
     NoWarehouseSelectedInSessionError,
     SnowflakeSQLExecutionError,
 )
+from snowflake.cli.api.feature_flags import FeatureFlag
 from snowflake.cli.api.identifiers import FQN
 from snowflake.cli.api.metrics import CLICounterField
 from snowflake.cli.api.project.schemas.entities.common import PostDeployHook
@@ -44,7 +47,7 @@ from snowflake.cli.api.rendering.sql_templates import (
 )
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutor
-from snowflake.cli.api.utils.path_utils import resolve_without_follow
+from snowflake.cli.api.utils.path_utils import iter_files, resolve_without_follow
 from snowflake.connector import ProgrammingError
 
 
@@ -67,13 +70,13 @@ def _get_stage_paths_to_sync(
     Takes a list of paths (files and directories), returning a list of all files recursively relative to the deploy root.
     """
 
-    stage_paths = []
+    stage_paths: List[StagePathType] = []
     for path in local_paths_to_sync:
         if path.is_dir():
-            for current_dir, _dirs, files in os.walk(path):
-                for file in files:
-                    deploy_path = Path(current_dir, file).relative_to(deploy_root)
-                    stage_paths.append(to_stage_path(deploy_path))
+            stage_paths.extend(
+                to_stage_path(file.relative_to(deploy_root))
+                for file in iter_files(path, follow_symlinks=False)
+            )
         else:
             stage_paths.append(to_stage_path(path.relative_to(deploy_root)))
     return stage_paths
@@ -137,9 +140,15 @@ def sync_deploy_root_with_stage(
             f"Performing a diff between the Snowflake stage: {stage_path.path} and your local deploy_root: {deploy_root.resolve()}."
         )
 
+    project_root = get_cli_context().project_root
+    sync_manifest = None
+    if project_root and FeatureFlag.ENABLE_STAGE_SYNC_MANIFEST.is_enabled():
+        sync_manifest = SyncManifest.for_project(project_root)
     diff: DiffResult = compute_stage_diff(
         local_root=deploy_root,
         stage_path=stage_path,
+        md5_cache=Md5Cache.for_project(project_root) if project_root else None,
+        sync_manifest=sync_manifest,
     )
 
     if local_paths_to_sync:
@@ -203,6 +212,8 @@ def sync_deploy_root_with_stage(
             diff_result=diff,
             stage_full_path=stage_path.full_path,
         )
+    if sync_manifest is not None:
+        record_sync_in_manifest(sync_manifest, stage_path, deploy_root, diff)
     return diff
 
 
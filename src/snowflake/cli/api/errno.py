@@ -25,6 +25,8 @@ VIEW_EXPANSION_FAILED = 2037
 DOES_NOT_EXIST_OR_CANNOT_BE_PERFORMED = (
     2043  # OBJECT_DOES_NOT_EXIST_OR_CANNOT_PERFORM_OPERATION
 )
+UNKNOWN_FUNCTION = 2140
+UNKNOWN_USER_DEFINED_FUNCTION = 2141
 INSUFFICIENT_PRIVILEGES = 3001  # NOT_AUTHORIZED
 INVALID_OBJECT_TYPE_FOR_SPECIFIED_PRIVILEGE = 3008
 ROLE_NOT_ASSIGNED = 3013
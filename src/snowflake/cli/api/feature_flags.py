@@ -69,3 +69,4 @@ class FeatureFlag(FeatureFlagMixin):
     ENABLE_SNOWPARK_GLOB_SUPPORT = BooleanFlag("ENABLE_SNOWPARK_GLOB_SUPPORT", False)
     ENABLE_SPCS_SERVICE_EVENTS = BooleanFlag("ENABLE_SPCS_SERVICE_EVENTS", False)
     ENABLE_AUTH_KEYPAIR = BooleanFlag("ENABLE_AUTH_KEYPAIR", False)
+    ENABLE_STAGE_SYNC_MANIFEST = BooleanFlag("ENABLE_STAGE_SYNC_MANIFEST", False)
@@ -20,6 +20,8 @@ import typing as t
 from snowflake.connector import DictCursor
 from snowflake.connector.cursor import SnowflakeCursor
 
+ROW_BATCH_SIZE = 10_000
+
 
 class CommandResult:
     @property
@@ -67,16 +69,38 @@ class StreamResult(CommandResult):
 
 
 class QueryResult(CollectionResult):
+    # Whether elements of the result are the rows of the cursor,
+    # so they can be read with iter_row_batches instead
+    supports_row_batches = True
+
     def __init__(self, cursor: SnowflakeCursor | DictCursor):
-        self.column_names = [col.name for col in cursor.description]
+        # Metadata of the result columns, with their names and Snowflake types
+        self.description = list(cursor.description)
+        self.column_names = [col.name for col in self.description]
         super().__init__(elements=self._prepare_payload(cursor))
         self._query = cursor.query
+        self._cursor = cursor
 
     def _prepare_payload(self, cursor: SnowflakeCursor | DictCursor):
         if isinstance(cursor, DictCursor):
             return (k for k in cursor)
         return ({k: v for k, v in zip(self.column_names, row)} for row in cursor)
 
+    def iter_row_batches(self) -> t.Iterator[t.List[t.Tuple]]:
+        """
+        Yields rows of the result as tuples ordered like column_names, in batches.
+        Values have the same types as in result. Reads the same cursor as result,
+        so only one of them can be used.
+        """
+        cursor = self._cursor
+        if isinstance(cursor, DictCursor):
+            for batch in iter(lambda: cursor.fetchmany(ROW_BATCH_SIZE), []):
+                yield [tuple(t.cast(t.Dict, row).values()) for row in batch]
+            return
+
+        for batch in iter(lambda: cursor.fetchmany(ROW_BATCH_SIZE), []):
+            yield [tuple(row) for row in batch]
+
     @property
     def query(self):
         return self._query
@@ -94,6 +118,8 @@ class SingleQueryResult(ObjectResult):
 
 
 class QueryJsonValueResult(QueryResult):
+    supports_row_batches = False
+
     def __init__(self, cursor: SnowflakeCursor):
         super().__init__(cursor)
 
@@ -17,6 +17,14 @@ class ProjectPaths:
     def bundle_root(self) -> Path:
         return bundle_root(self.project_root)
 
+    @property
+    def cache_root(self) -> Path:
+        """
+        Directory for caches kept between bundle actions. It lives next to the bundle
+        root because the bundle root itself is wiped before every bundle action.
+        """
+        return self.project_root / "output" / ".cache"
+
     def remove_up_bundle_root(self) -> None:
         if self.bundle_root.exists():
             SecurePath(self.bundle_root).rmdir(recursive=True)
@@ -14,10 +14,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from click import ClickException
-from jinja2 import Environment, StrictUndefined, loaders, meta
+from jinja2 import Environment, StrictUndefined, Template, loaders, meta
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console.console import cli_console
 from snowflake.cli.api.exceptions import InvalidTemplateError
@@ -33,9 +34,12 @@ _SQL_TEMPLATE_START = "<%"
 _SQL_TEMPLATE_END = "%>"
 _OLD_SQL_TEMPLATE_START = "&{"
 _OLD_SQL_TEMPLATE_END = "}"
+_JINJA_COMMENT_START = "{#"
 RESERVED_KEYS = [CONTEXT_KEY, FUNCTION_KEY]
+SQL_TEMPLATE_CACHE_SIZE = 1024
 
 
+@lru_cache(maxsize=None)
 def _get_sql_jinja_env(template_start: str, template_end: str) -> Environment:
     _random_block = "___very___unique___block___to___disable___logic___blocks___"
     return env_bootstrap(
@@ -63,13 +67,42 @@ def has_sql_templates(template_content: str) -> bool:
     )
 
 
+def _requires_rendering(template_content: str) -> bool:
+    # Without templates or comments rendering returns the content unchanged
+    return (
+        has_sql_templates(template_content) or _JINJA_COMMENT_START in template_content
+    )
+
+
+@lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)
+def _detect_sql_template_syntax(template_content: str) -> Tuple[bool, bool]:
+    """Returns whether the content uses the old and the new SQL template syntax."""
+    has_old_syntax = (
+        _OLD_SQL_TEMPLATE_START in template_content
+        and _does_template_have_env_syntax(
+            _get_sql_jinja_env(_OLD_SQL_TEMPLATE_START, _OLD_SQL_TEMPLATE_END),
+            template_content,
+        )
+    )
+    has_new_syntax = (
+        _SQL_TEMPLATE_START in template_content
+        and _does_template_have_env_syntax(
+            _get_sql_jinja_env(_SQL_TEMPLATE_START, _SQL_TEMPLATE_END),
+            template_content,
+        )
+    )
+    return has_old_syntax, has_new_syntax
+
+
+@lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)
+def _compile_sql_template(env: Environment, template_content: str) -> Template:
+    return env.from_string(template_content)
+
+
 def choose_sql_jinja_env_based_on_template_syntax(
     template_content: str, reference_name: Optional[str] = None
 ) -> Environment:
-    old_syntax_env = _get_sql_jinja_env(_OLD_SQL_TEMPLATE_START, _OLD_SQL_TEMPLATE_END)
-    new_syntax_env = _get_sql_jinja_env(_SQL_TEMPLATE_START, _SQL_TEMPLATE_END)
-    has_old_syntax = _does_template_have_env_syntax(old_syntax_env, template_content)
-    has_new_syntax = _does_template_have_env_syntax(new_syntax_env, template_content)
+    has_old_syntax, has_new_syntax = _detect_sql_template_syntax(template_content)
     reference_name_str = f" in {reference_name}" if reference_name else ""
     if has_old_syntax and has_new_syntax:
         raise InvalidTemplateError(
@@ -82,8 +115,8 @@ def choose_sql_jinja_env_based_on_template_syntax(
             " is deprecated and will no longer be supported."
             f" Use {_SQL_TEMPLATE_START} ... {_SQL_TEMPLATE_END} syntax instead."
         )
-        return old_syntax_env
-    return new_syntax_env
+        return _get_sql_jinja_env(_OLD_SQL_TEMPLATE_START, _OLD_SQL_TEMPLATE_END)
+    return _get_sql_jinja_env(_SQL_TEMPLATE_START, _SQL_TEMPLATE_END)
 
 
 def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
@@ -95,12 +128,14 @@ def snowflake_sql_jinja_render(content: str, data: Dict | None = None) -> str:
                 f"{reserved_key} in user defined data. The `{reserved_key}` variable is reserved for CLI usage."
             )
 
-    context_data = get_cli_context().template_context
-    context_data.update(data)
-    env = choose_sql_jinja_env_based_on_template_syntax(content)
-
     get_cli_context().metrics.set_counter(
         CLICounterField.SQL_TEMPLATES, int(has_sql_templates(content))
     )
+    if not _requires_rendering(content):
+        return content
+
+    context_data = get_cli_context().template_context
+    context_data.update(data)
+    env = choose_sql_jinja_env_based_on_template_syntax(content)
 
-    return env.from_string(content).render(context_data)
+    return _compile_sql_template(env, content).render(context_data)
@@ -40,4 +40,7 @@ def sanitize_for_terminal(text: str) -> str | None:
     """
     if text is None:
         return None
+    if "\x1B" not in text:
+        # Every escape sequence starts with ESC, so most strings can skip the regex
+        return text
     return _ANSI_ESCAPE.sub("", text)
@@ -15,11 +15,13 @@
 from __future__ import annotations
 
 import logging
+import re
 from contextlib import contextmanager
 from functools import cached_property
 from io import StringIO
 from textwrap import dedent
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console import cli_console
@@ -34,6 +36,7 @@ from snowflake.cli.api.exceptions import (
 from snowflake.cli.api.identifiers import FQN
 from snowflake.cli.api.project.util import (
     identifier_to_show_like_pattern,
+    is_valid_identifier,
     unquote_identifier,
 )
 from snowflake.cli.api.utils.cursor import find_first_row
@@ -41,6 +44,70 @@ from snowflake.connector import SnowflakeConnection
 from snowflake.connector.cursor import DictCursor, SnowflakeCursor
 from snowflake.connector.errors import ProgrammingError
 
+# Objects of a session whose current values are tracked by BaseSqlExecutor
+SESSION_STATE_OBJECTS = ("role", "warehouse", "database", "schema")
+
+# Statements which never change the current role, warehouse, database or schema
+_SESSION_NEUTRAL_STATEMENTS = {
+    "copy",
+    "delete",
+    "desc",
+    "describe",
+    "explain",
+    "get",
+    "insert",
+    "list",
+    "ls",
+    "merge",
+    "put",
+    "remove",
+    "rm",
+    "select",
+    "show",
+    "update",
+    "with",
+}
+_FIRST_KEYWORD = re.compile(r"\s*([a-z]+)", re.IGNORECASE)
+_USE_STATEMENT = re.compile(
+    r"\s*use\s+(role|warehouse|database|schema)\s+(\S+?)\s*;?\s*",
+    re.IGNORECASE,
+)
+# DDL only changes the session state when it creates or drops a database, schema,
+# warehouse, role or application (which may also be the current database),
+# or when it renames or swaps an object which may be the current one.
+_DDL_STATEMENTS = {"create", "drop", "undrop"}
+_DDL_CHANGING_SESSION = re.compile(
+    r"\b(database|schema|warehouse|role|application)\b", re.IGNORECASE
+)
+_ALTER_CHANGING_SESSION = re.compile(r"\b(rename|swap)\b", re.IGNORECASE)
+
+# Last known session state of connections passed explicitly to executors. Session
+# state of connections from the CLI context is kept by the connection cache.
+_SESSION_STATES: WeakKeyDictionary[
+    SnowflakeConnection, Dict[str, Optional[str]]
+] = WeakKeyDictionary()
+
+
+def _parse_use_statement(sql_text: str) -> Optional[Tuple[str, str]]:
+    """
+    Returns (object type, name) for a single USE statement. For other statements
+    returns None, or raises ValueError if the statement may change the session state.
+    """
+    if match := _USE_STATEMENT.fullmatch(sql_text):
+        return match.group(1).lower(), match.group(2)
+    keyword = _FIRST_KEYWORD.match(sql_text)
+    if keyword and ";" not in sql_text.strip().rstrip(";"):
+        keyword_lower = keyword.group(1).lower()
+        if keyword_lower in _SESSION_NEUTRAL_STATEMENTS:
+            return None
+        if keyword_lower in _DDL_STATEMENTS and not _DDL_CHANGING_SESSION.search(
+            sql_text
+        ):
+            return None
+        if keyword_lower == "alter" and not _ALTER_CHANGING_SESSION.search(sql_text):
+            return None
+    raise ValueError("Statement may change the session state")
+
 
 class BaseSqlExecutor:
     """
@@ -79,12 +146,82 @@ class BaseSqlExecutor:
         access result of previous queries while evaluating next one. For example, we can print the results.
         """
         self._log.debug("Executing %s", sql_text)
+        self._forget_session_state_changed_by(sql_text)
         stream = StringIO(sql_text)
         stream_generator = self._conn.execute_stream(
             stream, remove_comments=remove_comments, cursor_class=cursor_class, **kwargs
         )
         return stream_generator if return_cursors else list()
 
+    @property
+    def _session_state(self) -> Dict[str, Optional[str]]:
+        """
+        Last known session state of the connection. A missing key means the value
+        is unknown, None means there is no current object of that type.
+        """
+        if self._connection:
+            return _SESSION_STATES.setdefault(self._connection, {})
+        return get_cli_context().session_state
+
+    def invalidate_session_state(self) -> None:
+        """Forgets the known session state, e.g. after executing arbitrary SQL."""
+        self._session_state.clear()
+
+    def _forget_session_state_changed_by(self, sql_text: str) -> None:
+        try:
+            use_statement = _parse_use_statement(sql_text)
+        except ValueError:
+            self.invalidate_session_state()
+            return
+        if use_statement is None:
+            return
+        object_type, name = use_statement
+        state = self._session_state
+        state.pop(object_type, None)
+        if object_type == "database" or not is_valid_identifier(name):
+            # use database also changes the schema, use schema db.schema also the database
+            state.pop("schema", None)
+            state.pop("database", None)
+
+    def record_session_object(self, object_type: str, name: str) -> None:
+        """
+        Records the current object of the session after a successful USE statement.
+        The name is recorded as returned by current_<object type>(): unquoted,
+        and uppercase if it was not quoted.
+        """
+        if object_type in SESSION_STATE_OBJECTS and is_valid_identifier(name):
+            self._session_state[object_type] = unquote_identifier(name)
+
+    def restore_session_object(self, object_type: str, name: str) -> None:
+        """
+        Records the current object of the session after switching back to a name
+        previously returned by current_object(), which is already normalized.
+        """
+        if object_type in SESSION_STATE_OBJECTS:
+            self._session_state[object_type] = name
+
+    def current_object(self, object_type: str) -> Optional[str]:
+        """
+        Returns the name of the current role, warehouse, database or schema of the session.
+        Values are cached per connection: the first lookup fetches all of them with a single
+        query, USE statements update them and other statements which may change the
+        session invalidate them.
+        """
+        state = self._session_state
+        if object_type not in state:
+            if not state:
+                row = self.execute_query(
+                    "select "
+                    + ", ".join(f"current_{o}()" for o in SESSION_STATE_OBJECTS)
+                ).fetchone()
+                if row is None:
+                    return None
+                state.update(zip(SESSION_STATE_OBJECTS, row))
+            else:
+                row = self.execute_query(f"select current_{object_type}()").fetchone()
+                state[object_type] = row[0] if row else None
+        return state[object_type]
+
     def execute_string(self, query: str, **kwargs) -> Iterable[SnowflakeCursor]:
         """Executes a single SQL query and returns the results"""
         return self._execute_string(query, **kwargs)
@@ -119,9 +256,13 @@ class SqlExecutor(BaseSqlExecutor):
         except ProgrammingError as err:
             # Rewrite the error to make the message more useful.
             raise CouldNotUseObjectError(object_type=object_type, name=name) from err
+        self.record_session_object(object_type.value.sf_name, name)
 
     def current_role(self) -> str:
-        return self.execute_query(f"select current_role()").fetchone()[0]
+        role = self.current_object("role")
+        if role is None:
+            raise SnowflakeSQLExecutionError("select current_role()")
+        return role
 
     @contextmanager
     def use_role(self, new_role: str):
@@ -134,15 +275,16 @@ class SqlExecutor(BaseSqlExecutor):
         if is_different_role:
             self._log.debug("Assuming different role: %s", new_role)
             self.execute_query(f"use role {new_role}")
+            self.record_session_object("role", new_role)
         try:
             yield
         finally:
             if is_different_role:
                 self.execute_query(f"use role {prev_role}")
+                self.restore_session_object("role", prev_role)
 
     def session_has_warehouse(self) -> bool:
-        result = self.execute_query("select current_warehouse() is not null").fetchone()
-        return bool(result[0])
+        return self.current_object("warehouse") is not None
 
     @contextmanager
     def use_warehouse(self, new_wh: str):
@@ -152,12 +294,8 @@ class SqlExecutor(BaseSqlExecutor):
         If there is no default warehouse in the account, it will throw an error.
         """
 
-        wh_result = self.execute_query(f"select current_warehouse()").fetchone()
         # If user has an assigned default warehouse, prev_wh will contain a value even if the warehouse is suspended.
-        try:
-            prev_wh = wh_result[0]
-        except:
-            prev_wh = None
+        prev_wh = self.current_object("warehouse")
 
         # new_wh is not None, and should already be a valid identifier, no additional check is performed here.
         is_different_wh = new_wh != prev_wh
@@ -170,6 +308,7 @@ class SqlExecutor(BaseSqlExecutor):
             if prev_wh and is_different_wh:
                 self._log.debug("Switching back to warehouse: %s", prev_wh)
                 self.use(object_type=ObjectType.WAREHOUSE, name=prev_wh)
+                self.restore_session_object("warehouse", prev_wh)
 
     def create_password_secret(
         self, name: FQN, username: str, password: str
@@ -0,0 +1,101 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from click import get_current_context
+from click.globals import pop_context, push_context
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def in_current_context(fn: Callable[..., R]) -> Callable[..., R]:
+    """
+    Wraps fn to run in a copy of the caller's context and with the caller's click
+    context, so that it sees the same CLI global context and command when it is
+    called on another thread. The wrapper can be called once at a time.
+    """
+    context = contextvars.copy_context()
+    click_ctx = get_current_context(silent=True)
+
+    def run_with_click_context(*args, **kwargs) -> R:
+        if not click_ctx:
+            return fn(*args, **kwargs)
+        push_context(click_ctx)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            pop_context()
+
+    def wrapper(*args, **kwargs) -> R:
+        return context.run(run_with_click_context, *args, **kwargs)
+
+    return wrapper
+
+
+def map_in_threads(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    thread_name_prefix: str = "",
+    lease_connections: bool = False,
+) -> Iterator[R]:
+    """
+    Calls fn for every item on a pool of at most max_workers threads and yields the
+    results in input order, as soon as they are available.
+
+    Every call runs in a copy of the caller's context, so workers see the same CLI
+    global context (connection, project definition, output format) as the caller.
+    With lease_connections, every call uses its own connection leased from the
+    connection pool instead of sharing the connection of the caller.
+    With max_workers == 1 the calls are made sequentially on the calling thread.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+
+    if max_workers == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    call = fn
+    if lease_connections:
+        from snowflake.cli.api.cli_global_context import (
+            get_cli_context_manager,
+            use_pooled_connection,
+        )
+
+        pool = get_cli_context_manager().connection_pool
+
+        def call_with_leased_connection(item: T) -> R:
+            with use_pooled_connection(pool):
+                return fn(item)
+
+        call = call_with_leased_connection
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=thread_name_prefix
+    ) as executor:
+        futures = [executor.submit(in_current_context(call), item) for item in items]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
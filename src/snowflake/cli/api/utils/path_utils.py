@@ -17,6 +17,7 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import Iterator
 
 from snowflake.cli.api.secure_path import SecurePath
 
@@ -58,3 +59,21 @@ def resolve_without_follow(path: Path) -> Path:
     symlinks like Path.resolve() does.
     """
     return Path(os.path.abspath(path))
+
+
+def iter_files(path: Path, follow_symlinks: bool = True) -> Iterator[Path]:
+    """
+    Lazily yields all files under a directory (recursively), depth-first and sorted by
+    name within each directory. Uses os.scandir, so file types come from the directory
+    listing and no extra stat calls are needed for most entries.
+    Symlinks to directories are descended into only if follow_symlinks is True;
+    otherwise they are skipped, like os.walk does.
+    """
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir():
+            if follow_symlinks or not entry.is_symlink():
+                yield from iter_files(Path(entry.path), follow_symlinks)
+        else:
+            yield Path(entry.path)
@@ -251,3 +251,26 @@ def test_snow_typer_with_keyboard_interrupt(cli):
 
     # ensure duration metric captured is greater than or equal to 0
     assert post_execute.call_args.args[0].get_duration() >= 0
+
+
+@mock.patch(
+    "snowflake.cli.api.cli_global_context._CliGlobalContextManager.connect_in_background"
+)
+@pytest.mark.parametrize("command, connects_early", [("early", True), ("late", False)])
+def test_snow_typer_connects_in_background_only_for_connect_early_commands(
+    mock_connect_in_background, cli, command, connects_early
+):
+    app = class_factory()(name="snow")
+
+    @app.command("early", requires_connection=True, connect_early=True)
+    def early(**options):
+        return MessageResult("done")
+
+    @app.command("late", requires_connection=True)
+    def late(**options):
+        return MessageResult("done")
+
+    result = cli(app)([command])
+
+    assert result.exit_code == 0, result.output
+    assert mock_connect_in_background.called == connects_early
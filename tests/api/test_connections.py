@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from dataclasses import asdict
 from unittest import mock
 
 import pytest
+from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.connections import ConnectionContext, OpenConnectionCache
+from snowflake.cli.api.utils.concurrency import map_in_threads
 
 
 @pytest.fixture
@@ -99,3 +102,230 @@ def test_connection_cache_caches(
         application_name="snowcli",
         using_session_keep_alive=True,
     )
+
+
+def test_connection_cache_keeps_session_state_per_context(local_connection_cache):
+    ctx = ConnectionContext(connection_name="default")
+    other_ctx = ConnectionContext(connection_name="other")
+
+    local_connection_cache.session_state(ctx)["role"] = "test_role"
+
+    assert local_connection_cache.session_state(ctx.clone()) == {"role": "test_role"}
+    assert local_connection_cache.session_state(other_ctx) == {}
+
+    local_connection_cache.clear()
+    assert local_connection_cache.session_state(ctx) == {}
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_cache_awaits_connection_opened_in_background(
+    mock_build_connection, local_connection_cache
+):
+    login_started = threading.Event()
+    finish_login = threading.Event()
+
+    def _build_connection():
+        login_started.set()
+        finish_login.wait(timeout=5)
+        return mock.MagicMock(name="connection")
+
+    mock_build_connection.side_effect = _build_connection
+    ctx = ConnectionContext(connection_name="default")
+
+    local_connection_cache.connect_in_background(ctx)
+    local_connection_cache.connect_in_background(ctx.clone())
+    assert login_started.wait(timeout=5)
+    finish_login.set()
+
+    connection = local_connection_cache[ctx]
+    assert local_connection_cache[ctx] is connection
+    mock_build_connection.assert_called_once_with()
+    assert local_connection_cache.pending_connections == {}
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_cache_raises_background_connection_error_on_access(
+    mock_build_connection, local_connection_cache
+):
+    mock_build_connection.side_effect = [ValueError("login failed"), mock.MagicMock()]
+    ctx = ConnectionContext(connection_name="default")
+
+    local_connection_cache.connect_in_background(ctx)
+    with pytest.raises(ValueError, match="login failed"):
+        local_connection_cache[ctx]
+
+    # failures are not cached, the next access connects again
+    assert local_connection_cache[ctx] is not None
+    assert mock_build_connection.call_count == 2
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_cache_does_not_log_in_interactively_in_background(
+    mock_build_connection, local_connection_cache
+):
+    ctx = ConnectionContext(connection_name="default", authenticator="externalbrowser")
+
+    local_connection_cache.connect_in_background(ctx)
+
+    assert local_connection_cache.pending_connections == {}
+    mock_build_connection.assert_not_called()
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_cache_closes_connection_opened_in_background_on_clear(
+    mock_build_connection, local_connection_cache
+):
+    ctx = ConnectionContext(connection_name="default")
+
+    local_connection_cache.connect_in_background(ctx)
+    local_connection_cache.pending_connections[repr(ctx)].result(timeout=5)
+    local_connection_cache.clear()
+
+    mock_build_connection.return_value.close.assert_called_once_with()
+    assert local_connection_cache.pending_connections == {}
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_cache_clear_does_not_wait_for_background_login(
+    mock_build_connection, local_connection_cache
+):
+    login_started = threading.Event()
+    finish_login = threading.Event()
+    connection = mock.MagicMock(name="connection")
+
+    def _build_connection():
+        login_started.set()
+        finish_login.wait(timeout=5)
+        return connection
+
+    mock_build_connection.side_effect = _build_connection
+    ctx = ConnectionContext(connection_name="default")
+
+    local_connection_cache.connect_in_background(ctx)
+    assert login_started.wait(timeout=5)
+    future = local_connection_cache.pending_connections[repr(ctx)]
+    local_connection_cache.clear()
+
+    assert local_connection_cache.pending_connections == {}
+    assert future.cancelled()
+    connection.close.assert_not_called()
+
+    # the connection is closed by the login thread once it is open
+    finish_login.set()
+    for thread in threading.enumerate():
+        if thread.name == "connect-default":
+            thread.join(timeout=5)
+    connection.close.assert_called_once_with()
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_pool_reuses_returned_connections(
+    mock_build_connection, local_connection_cache
+):
+    mock_build_connection.side_effect = lambda: mock.MagicMock(
+        **{"is_closed.return_value": False}
+    )
+    pool = local_connection_cache.pool(ConnectionContext(connection_name="default"))
+
+    with pool.lease() as first, pool.lease() as second:
+        assert first.connection is not second.connection
+        leased_connections = {first.connection, second.connection}
+    with pool.lease() as lease:
+        assert lease.connection in leased_connections
+
+    assert mock_build_connection.call_count == 2
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_pool_opens_connections_lazily(
+    mock_build_connection, local_connection_cache
+):
+    pool = local_connection_cache.pool(ConnectionContext(connection_name="default"))
+
+    with pool.lease():
+        pass
+
+    mock_build_connection.assert_not_called()
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_pool_is_bounded(mock_build_connection, local_connection_cache):
+    local_connection_cache.CONNECTION_POOL_SIZE = 1
+    mock_build_connection.return_value.is_closed.return_value = False
+    pool = local_connection_cache.pool(ConnectionContext(connection_name="default"))
+    second_lease_acquired = threading.Event()
+
+    def _lease_in_thread():
+        with pool.lease() as lease:
+            lease.connection
+            second_lease_acquired.set()
+
+    with pool.lease() as lease:
+        lease.connection
+        thread = threading.Thread(target=_lease_in_thread)
+        thread.start()
+        assert not second_lease_acquired.wait(timeout=0.2)
+
+    thread.join(timeout=5)
+    assert second_lease_acquired.is_set()
+    mock_build_connection.assert_called_once_with()
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_pool_replaces_broken_connections(
+    mock_build_connection, local_connection_cache
+):
+    broken, healthy = mock.MagicMock(), mock.MagicMock()
+    broken.is_closed.return_value = False
+    broken.is_valid.return_value = False
+    healthy.is_closed.return_value = False
+    mock_build_connection.side_effect = [broken, healthy]
+    pool = local_connection_cache.pool(ConnectionContext(connection_name="default"))
+    pool.HEALTH_CHECK_AFTER_SEC = 0
+
+    with pool.lease() as lease:
+        assert lease.connection is broken
+    with pool.lease() as lease:
+        assert lease.connection is healthy
+
+    broken.close.assert_called_once_with()
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_connection_pool_is_closed_with_cache(
+    mock_build_connection, local_connection_cache
+):
+    mock_build_connection.return_value.is_closed.return_value = False
+    pool = local_connection_cache.pool(ConnectionContext(connection_name="default"))
+    with pool.lease() as lease:
+        lease.connection
+
+    local_connection_cache.clear()
+
+    mock_build_connection.return_value.close.assert_called_once_with()
+    assert local_connection_cache.pools == {}
+
+
+@mock.patch.object(ConnectionContext, "build_connection")
+def test_workers_use_pooled_connections(mock_build_connection):
+    mock_build_connection.side_effect = lambda: mock.MagicMock(
+        **{"is_closed.return_value": False}
+    )
+    workers_ready = threading.Barrier(2, timeout=5)
+
+    def _worker_connection(_):
+        connection = get_cli_context().connection
+        # both connections are leased at the same time
+        workers_ready.wait()
+        return connection
+
+    main_connection = get_cli_context().connection
+    worker_connections = list(
+        map_in_threads(
+            _worker_connection, range(2), max_workers=2, lease_connections=True
+        )
+    )
+
+    assert main_connection not in worker_connections
+    assert worker_connections[0] is not worker_connections[1]
+    assert get_cli_context().connection is main_connection
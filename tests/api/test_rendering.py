@@ -22,6 +22,8 @@ from snowflake.cli.api.rendering.project_definition_templates import (
     has_client_side_templates,
 )
 from snowflake.cli.api.rendering.sql_templates import (
+    _compile_sql_template,
+    choose_sql_jinja_env_based_on_template_syntax,
     has_sql_templates,
     snowflake_sql_jinja_render,
 )
@@ -126,6 +128,28 @@ def test_contex_can_access_environment_variable(cli_context):
     )
 
 
+def test_statements_without_templates_are_not_rendered(cli_context):
+    with mock.patch(
+        "snowflake.cli.api.rendering.sql_templates._compile_sql_template"
+    ) as mock_compile:
+        assert snowflake_sql_jinja_render("select '{{ a }}';") == "select '{{ a }}';"
+    mock_compile.assert_not_called()
+
+
+def test_compiled_templates_are_reused(cli_context):
+    _compile_sql_template.cache_clear()
+    for value in ["bar", "baz"]:
+        assert (
+            snowflake_sql_jinja_render("select <% foo %>;", data={"foo": value})
+            == f"select {value};"
+        )
+    cache_info = _compile_sql_template.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+    assert choose_sql_jinja_env_based_on_template_syntax(
+        "<% foo %>"
+    ) is choose_sql_jinja_env_based_on_template_syntax("<% bar %>")
+
+
 def test_has_sql_templates():
     assert has_sql_templates("abc <% %> abc")
     assert has_sql_templates("abc <% abc")
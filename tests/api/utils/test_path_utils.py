@@ -19,6 +19,7 @@ from pathlib import Path
 import pytest
 from snowflake.cli.api.artifacts.common import NotInDeployRootError
 from snowflake.cli.api.artifacts.utils import symlink_or_copy
+from snowflake.cli.api.utils.path_utils import iter_files
 
 from tests.nativeapp.utils import assert_dir_snapshot, touch
 from tests.testing_utils.files_and_dirs import temp_local_dir
@@ -338,3 +339,42 @@ def test_symlink_or_copy_with_symlinks_in_project_root(os_agnostic_snapshot):
             )
 
             assert_dir_snapshot(Path("./output/deploy"), os_agnostic_snapshot)
+
+
+def test_iter_files_yields_sorted_files_depth_first():
+    test_dir_structure = {
+        "b.txt": "b",
+        "a/z.txt": "z",
+        "a/nested/y.txt": "y",
+        "a/empty": None,  # dir
+        "c/x.txt": "x",
+    }
+    with temp_local_dir(test_dir_structure) as root:
+        files = iter_files(root)
+        assert not isinstance(files, list)
+        assert [f.relative_to(root).as_posix() for f in files] == [
+            "a/nested/y.txt",
+            "a/z.txt",
+            "b.txt",
+            "c/x.txt",
+        ]
+
+
+@pytest.mark.skipif(
+    IS_WINDOWS, reason="Symlinks on Windows are restricted to Developer mode or admins"
+)
+def test_iter_files_symlinked_directories():
+    with temp_local_dir({"src/a.txt": "a", "root/b.txt": "b"}) as project_root:
+        root = project_root / "root"
+        os.symlink(project_root / "src", root / "linked")
+        os.symlink(project_root / "src" / "a.txt", root / "linked_file.txt")
+
+        assert [f.relative_to(root).as_posix() for f in iter_files(root)] == [
+            "b.txt",
+            "linked/a.txt",
+            "linked_file.txt",
+        ]
+        assert [
+            f.relative_to(root).as_posix()
+            for f in iter_files(root, follow_symlinks=False)
+        ] == ["b.txt", "linked_file.txt"]
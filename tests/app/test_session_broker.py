@@ -0,0 +1,196 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pytest
+from snowflake.cli._app.session_broker import (
+    SessionBroker,
+    can_be_brokered,
+    connection_identity,
+    lease_session,
+    serve,
+)
+from snowflake.connector.compat import IS_WINDOWS
+
+PARAMETERS = {"account": "test_account", "user": "test_user", "password": "pwd"}
+
+
+def _broker(log_in, idle_timeout=60):
+    return SessionBroker(
+        idle_timeout=idle_timeout,
+        resolve_connection_parameters={"dev": PARAMETERS}.__getitem__,
+        log_in=log_in,
+    )
+
+
+class FakeLogIn:
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self, connection_parameters):
+        connection = mock.MagicMock()
+        connection.rest.token = f"session_{len(self.connections)}"
+        connection.rest.master_token = f"master_{len(self.connections)}"
+        self.connections.append(connection)
+        return connection
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_broker_hands_over_prepared_session_and_prepares_next():
+    log_in = FakeLogIn()
+    broker = _broker(log_in)
+    broker.prepare("dev")
+    _wait_until(lambda: len(log_in.connections) == 1)
+
+    identity = connection_identity(PARAMETERS, broker.key)
+    assert broker.lease("dev", identity) == {
+        "session_token": "session_0",
+        "master_token": "master_0",
+    }
+    _wait_until(lambda: len(log_in.connections) == 2)
+    assert broker.lease("dev", identity)["session_token"] == "session_1"
+
+    # handed over sessions are not logged out by the broker
+    log_in.connections[0].rest.delete_session.assert_not_called()
+    log_in.connections[0].close.assert_called_once()
+
+
+def test_broker_logs_out_idle_sessions():
+    log_in = FakeLogIn()
+    broker = _broker(log_in, idle_timeout=0)
+    broker.prepare("dev")
+    _wait_until(lambda: len(log_in.connections) == 1)
+
+    broker.expire_idle_sessions()
+
+    log_in.connections[0].rest.delete_session.assert_called_once()
+    assert broker.is_idle()
+
+
+def test_broker_does_not_hand_over_session_of_different_parameters():
+    log_in = FakeLogIn()
+    broker = _broker(log_in)
+
+    with pytest.raises(ValueError, match="differ"):
+        broker.lease(
+            "dev", connection_identity({**PARAMETERS, "role": "other"}, broker.key)
+        )
+
+    assert not log_in.connections
+
+
+def test_connection_identity_is_keyed_by_broker():
+    broker, other_broker = _broker(FakeLogIn()), _broker(FakeLogIn())
+
+    assert broker.key != other_broker.key
+    assert connection_identity(PARAMETERS, broker.key) != connection_identity(
+        PARAMETERS, other_broker.key
+    )
+    with pytest.raises(ValueError, match="differ"):
+        broker.lease("dev", connection_identity(PARAMETERS, other_broker.key))
+
+
+@pytest.mark.parametrize(
+    "parameters,expected",
+    [
+        (PARAMETERS, True),
+        ({**PARAMETERS, "authenticator": "SNOWFLAKE_JWT"}, True),
+        ({**PARAMETERS, "authenticator": "externalbrowser"}, False),
+        ({**PARAMETERS, "authenticator": "USERNAME_PASSWORD_MFA"}, False),
+        ({**PARAMETERS, "session_token": "t", "master_token": "t"}, False),
+    ],
+)
+def test_interactive_authentication_is_not_brokered(parameters, expected):
+    assert can_be_brokered(parameters) == expected
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="Unix sockets are not supported on Windows")
+def test_lease_session_through_socket():
+    log_in = FakeLogIn()
+    broker = _broker(log_in)
+    with TemporaryDirectory() as tmp_dir:
+        socket_path = Path(tmp_dir) / "broker.sock"
+        server = threading.Thread(
+            target=serve, args=(socket_path, broker, 0.01), daemon=True
+        )
+        server.start()
+        _wait_until(socket_path.exists)
+        key_path = socket_path.with_suffix(".key")
+        assert key_path.read_bytes() == broker.key
+        assert key_path.stat().st_mode & 0o777 == 0o600
+
+        with mock.patch(
+            "snowflake.cli._app.session_broker.session_broker_socket_path",
+            return_value=socket_path,
+        ):
+            assert lease_session("dev", PARAMETERS) == {
+                "session_token": "session_0",
+                "master_token": "master_0",
+            }
+
+        broker._idle_timeout = 0  # noqa: SLF001
+        server.join(timeout=5)
+        assert not server.is_alive()
+        assert not socket_path.exists()
+        assert not key_path.exists()
+
+
+@mock.patch("snowflake.cli._app.session_broker._send_request")
+def test_lease_session_sends_only_connection_identity(mock_send_request):
+    mock_send_request.return_value = {"session_token": "s", "master_token": "m"}
+    key = b"k" * 32
+
+    with TemporaryDirectory() as tmp_dir:
+        socket_path = Path(tmp_dir) / "broker.sock"
+        socket_path.with_suffix(".key").write_bytes(key)
+        with mock.patch(
+            "snowflake.cli._app.session_broker.session_broker_socket_path",
+            return_value=socket_path,
+        ):
+            assert lease_session("dev", PARAMETERS) == {
+                "session_token": "s",
+                "master_token": "m",
+            }
+
+    mock_send_request.assert_called_once_with(
+        socket_path,
+        {"connection_name": "dev", "identity": connection_identity(PARAMETERS, key)},
+    )
+    assert "pwd" not in str(mock_send_request.call_args)
+
+
+@mock.patch("snowflake.cli._app.session_broker.subprocess.Popen")
+def test_lease_session_starts_broker_if_not_running(mock_popen):
+    with TemporaryDirectory() as tmp_dir:
+        with mock.patch(
+            "snowflake.cli._app.session_broker.session_broker_socket_path",
+            return_value=Path(tmp_dir) / "broker.sock",
+        ):
+            assert lease_session("dev", PARAMETERS) is None
+
+    mock_popen.assert_called_once()
+    assert mock_popen.call_args.kwargs["start_new_session"]
+    assert mock_popen.call_args.args[0][-1] == "dev"
+    assert "pwd" not in str(mock_popen.call_args)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import threading
 import uuid
 from unittest import mock
 
@@ -189,6 +190,30 @@ def test_failing_executing_command_sends_telemetry_data(
     )
 
 
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._plugins.connection.commands.ObjectManager")
+def test_command_logs_in_when_connection_is_first_used(_, mock_conn, runner):
+    login_threads = []
+
+    def _connect(**kwargs):
+        login_threads.append(threading.current_thread())
+        return mock.DEFAULT
+
+    mock_conn.side_effect = _connect
+    result = runner.invoke(["connection", "test"], catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+
+    # commands not declared with connect_early do not log in on a background thread
+    assert login_threads == [threading.main_thread()]
+    # usage is logged before the connection is open, and sent with the result
+    event_types = [
+        call.args[0].to_dict()["message"]["type"]
+        for call in mock_conn.return_value._telemetry.try_add_log_to_batch.call_args_list  # noqa: SLF001
+    ]
+    assert event_types == ["executing_command", "result_executing_command"]
+    mock_conn.return_value._telemetry.send_batch.assert_called_once_with()  # noqa: SLF001
+
+
 @pytest.mark.parametrize(
     "error,is_cli",
     [
@@ -32,6 +32,9 @@ import yaml
 from rich import box
 from snowflake.cli._app import loggers
 from snowflake.cli._app.cli_app import CliAppFactory
+from snowflake.cli._app.commands_registration.command_manifest import (
+    COMMAND_MANIFEST_FILE_NAME,
+)
 from snowflake.cli.api.cli_global_context import (
     fork_cli_context,
     get_cli_context_manager,
@@ -137,6 +140,18 @@ def isolate_snowflake_home(snowflake_home):
     yield snowflake_home
 
 
+# This automatically used fixture isolates the command manifest, as tests
+# register different sets of command plugins.
+@pytest.fixture(autouse=True)
+def isolate_command_manifest(tmp_path):
+    manifest_path = tmp_path / COMMAND_MANIFEST_FILE_NAME
+    with mock.patch(
+        "snowflake.cli._app.commands_registration.commands_registration_with_callbacks.command_manifest_path",
+        return_value=manifest_path,
+    ):
+        yield manifest_path
+
+
 @pytest.fixture(autouse=True, scope="session")
 def mocked_rich():
     from rich.panel import Panel
@@ -327,10 +342,16 @@ def mock_cursor():
         name: str
 
     class _MockCursor(SnowflakeCursor):
-        def __init__(self, rows: List[Union[tuple, dict]], columns: List[str]):
+        def __init__(
+            self,
+            rows: List[Union[tuple, dict]],
+            columns: List[str],
+            sfqid: Optional[str] = None,
+        ):
             super().__init__(mock.Mock())
             self._rows = rows
             self._columns = [MockResultMetadata(c) for c in columns]
+            self._sfqid = sfqid
             self.query = "SELECT A MOCK QUERY"
 
         def fetchone(self):
@@ -350,8 +371,8 @@ def mock_cursor():
             yield from self._columns
 
         @classmethod
-        def from_input(cls, rows, columns):
-            return cls(rows, columns)
+        def from_input(cls, rows, columns, sfqid=None):
+            return cls(rows, columns, sfqid)
 
     return _MockCursor.from_input
 
@@ -119,7 +119,7 @@ def test_fetch(mock_connector, runner, mock_ctx):
 
 
 @mock.patch("snowflake.connector.connect")
-@mock.patch.object(StageManager, "iter_stage")
+@mock.patch.object(StageManager, "_iter_stage_files")
 @mock.patch("snowflake.cli._plugins.git.commands.QueryResult")
 def test_copy_to_local_file_system(
     mock_result, mock_iter, mock_connector, runner, mock_ctx, temporary_directory
@@ -128,7 +128,7 @@ def test_copy_to_local_file_system(
     ctx = mock_ctx()
     mock_connector.return_value = ctx
     mock_iter.return_value = (
-        StagePath.from_git_str(x)
+        (x.lstrip("@"), StagePath.from_git_str(x))
         for x in [f"{repo_prefix}file.txt", f"{repo_prefix}dir/file_in_dir.txt"]
     )
     mock_iter.__len__.return_value = 2
@@ -592,9 +592,9 @@ def test_execute(
 ):
     mock_execute.return_value = mock_cursor(
         [
-            {"name": "/a/S3.sql"},
-            {"name": "/s1.sql"},
-            {"name": "/s2"},
+            {"name": "repo/branches/main/a/S3.sql"},
+            {"name": "repo/branches/main/s1.sql"},
+            {"name": "repo/branches/main/s2"},
         ],
         [],
     )
@@ -602,13 +602,16 @@ def test_execute(
     result = runner.invoke(["git", "execute", repository_path])
 
     assert result.exit_code == 0, result.output
-    create_call, copy_call, ls_call, *execute_calls = mock_execute.mock_calls
+    ls_call, create_call, copy_call, *execute_calls, drop_call = mock_execute.mock_calls
     stage = "FOO.BAR.snowflake_cli_tmp_stage_123"
     assert create_call == mock.call(
         f"create temporary stage if not exists IDENTIFIER('{stage}')"
     )
-    assert copy_call == mock.call(f"copy files into @{stage}/ from {expected_stage}/")
-    assert ls_call == mock.call(f"ls @{stage}", cursor_class=DictCursor)
+    assert ls_call == mock.call(f"ls {expected_stage}", cursor_class=DictCursor)
+    assert copy_call == mock.call(
+        f"copy files into @{stage}/ from {expected_stage}/ files = ({_files_literal(expected_files)})"
+    )
+    assert drop_call == mock.call(f"drop stage if exists IDENTIFIER('{stage}')")
     assert execute_calls == [
         mock.call(f"execute immediate from @{stage}{p}") for p in expected_files
     ]
@@ -661,9 +664,9 @@ def test_execute_new_git_repository_list_files(
 ):
     mock_execute.return_value = mock_cursor(
         [
-            {"name": "/s1.sql"},
-            {"name": "/S2.sql"},
-            {"name": "/a/s3.sql"},
+            {"name": "/branches/main/s1.sql"},
+            {"name": "/branches/main/S2.sql"},
+            {"name": "/branches/main/a/s3.sql"},
         ],
         [],
     )
@@ -671,13 +674,16 @@ def test_execute_new_git_repository_list_files(
     result = runner.invoke(["git", "execute", repository_path])
 
     assert result.exit_code == 0, result.output
-    create_call, copy_call, ls_call, *execute_calls = mock_execute.mock_calls
+    ls_call, create_call, copy_call, *execute_calls, drop_call = mock_execute.mock_calls
     stage = "FOO.BAR.snowflake_cli_tmp_stage_123"
     assert create_call == mock.call(
         f"create temporary stage if not exists IDENTIFIER('{stage}')"
     )
-    assert copy_call == mock.call(f"copy files into @{stage}/ from {expected_stage}/")
-    assert ls_call == mock.call(f"ls @{stage}", cursor_class=DictCursor)
+    assert ls_call == mock.call(f"ls {expected_stage}", cursor_class=DictCursor)
+    assert copy_call == mock.call(
+        f"copy files into @{stage}/ from {expected_stage}/ files = ({_files_literal(expected_files)})"
+    )
+    assert drop_call == mock.call(f"drop stage if exists IDENTIFIER('{stage}')")
     assert execute_calls == [
         mock.call(f"execute immediate from @{stage}{p}") for p in expected_files
     ]
@@ -735,9 +741,9 @@ def test_execute_slash_in_repository_name(
 ):
     mock_execute.return_value = mock_cursor(
         [
-            {"name": "/a/S3.sql"},
-            {"name": "/s1.sql"},
-            {"name": "/s2"},
+            {"name": '/branches/"feature/commit"/a/S3.sql'},
+            {"name": '/branches/"feature/commit"/s1.sql'},
+            {"name": '/branches/"feature/commit"/s2'},
         ],
         [],
     )
@@ -745,15 +751,16 @@ def test_execute_slash_in_repository_name(
     result = runner.invoke(["git", "execute", repository_path])
 
     assert result.exit_code == 0, result.output
-    create_call, copy_call, ls_call, *execute_calls = mock_execute.mock_calls
+    ls_call, create_call, copy_call, *execute_calls, drop_call = mock_execute.mock_calls
+    assert ls_call == mock.call(f"ls '{expected_stage}'", cursor_class=DictCursor)
     assert create_call == mock.call(
         "create temporary stage if not exists IDENTIFIER('FOO.BAR.snowflake_cli_tmp_stage_123')"
     )
     assert copy_call == mock.call(
-        f"copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from {expected_stage}/"
+        f"copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from {expected_stage}/ files = ({_files_literal(expected_files)})"
     )
-    assert ls_call == mock.call(
-        f"ls @FOO.BAR.snowflake_cli_tmp_stage_123", cursor_class=DictCursor
+    assert drop_call == mock.call(
+        "drop stage if exists IDENTIFIER('FOO.BAR.snowflake_cli_tmp_stage_123')"
     )
     assert execute_calls == [
         mock.call(f"execute immediate from @FOO.BAR.snowflake_cli_tmp_stage_123{p}")
@@ -766,7 +773,7 @@ def test_execute_slash_in_repository_name(
 @mock.patch(f"{STAGE_MANAGER}._conn", new=mock.MagicMock(database="FOO", schema="BAR"))
 @mock.patch(f"snowflake.cli._plugins.stage.manager.time.time", lambda: 123)
 def test_execute_with_variables(mock_execute, mock_cursor, runner):
-    mock_execute.return_value = mock_cursor([{"name": "/s1.sql"}], [])
+    mock_execute.return_value = mock_cursor([{"name": "/branches/main/s1.sql"}], [])
 
     result = runner.invoke(
         [
@@ -787,15 +794,13 @@ def test_execute_with_variables(mock_execute, mock_cursor, runner):
     )
 
     assert result.exit_code == 0
-    create_call, copy_call, ls_call, *execute_calls = mock_execute.mock_calls
+    ls_call, create_call, copy_call, *execute_calls, _ = mock_execute.mock_calls
+    assert ls_call == mock.call("ls @repo/branches/main", cursor_class=DictCursor)
     assert create_call == mock.call(
         "create temporary stage if not exists IDENTIFIER('FOO.BAR.snowflake_cli_tmp_stage_123')"
     )
     assert copy_call == mock.call(
-        "copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from @repo/branches/main/"
-    )
-    assert ls_call == mock.call(
-        f"ls @FOO.BAR.snowflake_cli_tmp_stage_123", cursor_class=DictCursor
+        "copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from @repo/branches/main/ files = ('s1.sql')"
     )
     assert execute_calls == [
         mock.call(
@@ -808,7 +813,9 @@ def test_execute_with_variables(mock_execute, mock_cursor, runner):
 @mock.patch(f"{STAGE_MANAGER}._conn", new=mock.MagicMock(database="FOO", schema="BAR"))
 @mock.patch(f"snowflake.cli._plugins.stage.manager.time.time", lambda: 123)
 def test_execute_file_with_space_in_name(mock_execute, mock_cursor, runner):
-    mock_execute.return_value = mock_cursor([{"name": "/Script 1.sql"}], [])
+    mock_execute.return_value = mock_cursor(
+        [{"name": "/branches/main/Script 1.sql"}], []
+    )
 
     result = runner.invoke(
         [
@@ -819,15 +826,73 @@ def test_execute_file_with_space_in_name(mock_execute, mock_cursor, runner):
     )
 
     assert result.exit_code == 0
-    _, __, *calls = mock_execute.mock_calls
+    _, __, copy_call, *calls = mock_execute.mock_calls
+    assert copy_call == mock.call(
+        "copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from @repo/branches/main/ files = ('Script 1.sql')"
+    )
     assert calls == [
-        mock.call("ls @FOO.BAR.snowflake_cli_tmp_stage_123", cursor_class=DictCursor),
         mock.call(
             f"execute immediate from '@FOO.BAR.snowflake_cli_tmp_stage_123/Script 1.sql'"
         ),
+        mock.call(
+            "drop stage if exists IDENTIFIER('FOO.BAR.snowflake_cli_tmp_stage_123')"
+        ),
     ]
 
 
+@mock.patch(f"{STAGE_MANAGER}._bootstrap_snowpark_execution_environment")
+@mock.patch(f"{STAGE_MANAGER}.snowpark_session", new=mock.MagicMock())
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new=mock.MagicMock(database="FOO", schema="BAR"))
+@mock.patch(f"snowflake.cli._plugins.stage.manager.time.time", lambda: 123)
+def test_execute_copies_only_matching_files(
+    mock_execute, mock_bootstrap, mock_cursor, runner
+):
+    mock_execute.return_value = mock_cursor(
+        [
+            {"name": "/branches/main/a/p1.py"},
+            {"name": "/branches/main/a/s1.sql"},
+            {"name": "/branches/main/b/s2.sql"},
+            {"name": "/branches/main/requirements.txt"},
+        ],
+        [],
+    )
+
+    result = runner.invoke(["git", "execute", "@repo/branches/main/a/*.py"])
+
+    assert result.exit_code == 0, result.output
+    assert mock_execute.mock_calls[2] == mock.call(
+        "copy files into @FOO.BAR.snowflake_cli_tmp_stage_123/ from @repo/branches/main/ files = ('a/p1.py', 'requirements.txt')"
+    )
+    assert mock_bootstrap.return_value.mock_calls == [
+        mock.call(
+            "@FOO.BAR.snowflake_cli_tmp_stage_123/a/p1.py",
+            {},
+            session=mock.ANY,
+        )
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}._conn", new=mock.MagicMock(database="FOO", schema="BAR"))
+@mock.patch(f"snowflake.cli._plugins.stage.manager.time.time", lambda: 123)
+def test_execute_drops_temporary_stage_on_error(mock_execute, mock_cursor, runner):
+    mock_execute.side_effect = [
+        mock_cursor([{"name": "/branches/main/s1.sql"}], []),
+        mock_cursor([], []),
+        mock_cursor([], []),
+        ProgrammingError("Error"),
+        mock_cursor([], []),
+    ]
+
+    result = runner.invoke(["git", "execute", "@repo/branches/main/"])
+
+    assert result.exit_code == 1
+    assert mock_execute.mock_calls[-1] == mock.call(
+        "drop stage if exists IDENTIFIER('FOO.BAR.snowflake_cli_tmp_stage_123')"
+    )
+
+
 def test_raise_error_for_invalid_quotes_number_in_path(runner):
     result = runner.invoke(
         [
@@ -866,6 +931,10 @@ def test_command_aliases(mock_connector, runner, mock_ctx, command, parameters):
     assert queries[0] == queries[1]
 
 
+def _files_literal(files):
+    return ", ".join(f"'{f.lstrip('/')}'" for f in files)
+
+
 def _assert_invalid_repo_path_error_message(output):
     assert "Error" in output
     assert (
@@ -59,6 +59,7 @@ from tests.nativeapp.utils import (
     SQL_FACADE_SHOW_VERSIONS,
     SQL_FACADE_UNSET_RELEASE_DIRECTIVE,
     mock_execute_helper,
+    mock_select_current_session_state,
 )
 
 
@@ -151,10 +152,7 @@ def test_deploy(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -174,10 +172,6 @@ def test_deploy(
                 ),
             ),
             (None, mock.call("use role old_role")),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -191,10 +185,6 @@ def test_deploy(
                 mock.call("describe application package pkg"),
             ),
             (None, mock.call("use role old_role")),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role app_role")),
             (None, mock.call("use role old_role")),
         ]
@@ -251,10 +241,7 @@ def test_deploy_w_stage_subdir(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -274,10 +261,6 @@ def test_deploy_w_stage_subdir(
                 ),
             ),
             (None, mock.call("use role old_role")),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -291,10 +274,6 @@ def test_deploy_w_stage_subdir(
                 mock.call("describe application package pkg"),
             ),
             (None, mock.call("use role old_role")),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role app_role")),
             (None, mock.call("use role old_role")),
         ]
@@ -66,6 +66,7 @@ from tests.nativeapp.utils import (
     SQL_FACADE_GRANT_PRIVILEGES_TO_ROLE,
     SQL_FACADE_UPGRADE_APPLICATION,
     mock_execute_helper,
+    mock_select_current_session_state,
     mock_side_effect_error_with_cause,
 )
 
@@ -253,10 +254,7 @@ def _setup_mocks_for_create_app(
     mock_get_existing_app_info.return_value = None
 
     calls = [
-        (
-            mock_cursor([("old_role",)], []),
-            mock.call("select current_role()"),
-        ),
+        mock_select_current_session_state(mock_cursor, role="old_role"),
         (None, mock.call("use role app_role")),
         (
             mock_cursor(
@@ -273,10 +271,6 @@ def _setup_mocks_for_create_app(
     if expected_shared_events is not None:
         calls.extend(
             [
-                (
-                    mock_cursor([("old_role",)], []),
-                    mock.call("select current_role()"),
-                ),
                 (None, mock.call("use role app_role")),
                 (
                     None,
@@ -365,10 +359,7 @@ def _setup_mocks_for_upgrade_app(
     mock_get_existing_app_info.return_value = mock_get_existing_app_info_result
 
     calls = [
-        (
-            mock_cursor([("old_role",)], []),
-            mock.call("select current_role()"),
-        ),
+        mock_select_current_session_state(mock_cursor, role="old_role"),
         (None, mock.call("use role app_role")),
         (
             mock_cursor(
@@ -385,10 +376,6 @@ def _setup_mocks_for_upgrade_app(
     if expected_shared_events is not None:
         calls.extend(
             [
-                (
-                    mock_cursor([("old_role",)], []),
-                    mock.call("select current_role()"),
-                ),
                 (None, mock.call("use role app_role")),
                 (
                     None,
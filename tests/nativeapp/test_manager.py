@@ -89,7 +89,9 @@ from tests.nativeapp.utils import (
     SQL_FACADE_GET_ACCOUNT_EVENT_TABLE,
     SQL_FACADE_GET_UI_PARAMETER,
     SQL_FACADE_STAGE_EXISTS,
+    SQL_SELECT_CURRENT_SESSION_STATE,
     mock_execute_helper,
+    mock_select_current_session_state,
     mock_snowflake_yml_file_v2,
     quoted_override_yml_file_v2,
     touch,
@@ -161,6 +163,8 @@ def test_sync_deploy_root_with_stage(
     mock_compute_stage_diff.assert_called_once_with(
         local_root=dm.project_root / pkg_model.deploy_root,
         stage_path=DefaultStagePathParts.from_fqn("app_pkg.app_src.stage"),
+        md5_cache=mock.ANY,
+        sync_manifest=None,
     )
     mock_local_diff_with_stage.assert_called_once_with(
         role="new_role",
@@ -225,6 +229,8 @@ def test_sync_deploy_root_with_stage_subdir(
     mock_compute_stage_diff.assert_called_once_with(
         local_root=dm.project_root / pkg_model.deploy_root,
         stage_path=DefaultStagePathParts.from_fqn(stage_fqn, "v1"),
+        md5_cache=mock.ANY,
+        sync_manifest=None,
     )
     mock_local_diff_with_stage.assert_called_once_with(
         role="new_role",
@@ -305,10 +311,7 @@ def test_get_app_pkg_distribution_in_snowflake(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor(
@@ -347,10 +350,7 @@ def test_get_app_pkg_distribution_in_snowflake_throws_programming_error(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 DoesNotExistOrUnauthorizedError(
@@ -386,10 +386,7 @@ def test_get_app_pkg_distribution_in_snowflake_throws_execution_error(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (mock_cursor([], []), mock.call("describe application package app_pkg")),
             (None, mock.call("use role old_role")),
@@ -420,10 +417,7 @@ def test_get_app_pkg_distribution_in_snowflake_throws_distribution_error(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([("name", "app_pkg"), ["owner", "package_role"]], []),
@@ -555,10 +549,7 @@ def test_get_existing_app_info_app_exists(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -601,10 +592,7 @@ def test_get_existing_app_info_app_does_not_exist(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor([], []),
@@ -636,10 +624,7 @@ def test_get_existing_app_pkg_info_app_pkg_exists(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor(
@@ -685,10 +670,7 @@ def test_get_existing_app_pkg_info_app_pkg_does_not_exist(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -766,10 +748,7 @@ def test_get_snowsight_url_with_pdf_warehouse(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([(warehouse,)], []),
-                mock.call("select current_warehouse()"),
-            ),
+            mock_select_current_session_state(mock_cursor, warehouse=warehouse),
             (None, mock.call("use warehouse app_warehouse")),
         ]
     )
@@ -798,7 +777,7 @@ def test_get_snowsight_url_with_pdf_warehouse(
         (
             "napp_project_2",
             "MockWarehouse",
-            [mock.call("select current_warehouse()")],
+            [mock.call(SQL_SELECT_CURRENT_SESSION_STATE)],
             [None],
         ),
     ],
@@ -825,7 +804,7 @@ def test_get_snowsight_url_without_pdf_warehouse(
     working_dir: Path = project_definition_files[0].parent
 
     mock_execute_query.side_effect = [
-        mock_cursor([(warehouse,)], [])
+        mock_cursor([(None, warehouse, None, None)], [])
     ] + fallback_side_effect
 
     dm = _get_dm(str(working_dir))
@@ -1414,10 +1393,7 @@ def test_validate_use_scratch_stage(
                     "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
                 ),
             ),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -1489,10 +1465,7 @@ def test_validate_failing_drops_scratch_stage(
                     "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
                 ),
             ),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
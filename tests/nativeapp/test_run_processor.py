@@ -90,6 +90,7 @@ from tests.nativeapp.utils import (
     SQL_FACADE_UPGRADE_APPLICATION,
     TYPER_CONFIRM,
     mock_execute_helper,
+    mock_select_current_session_state,
     mock_side_effect_error_with_cause,
     quoted_override_yml_file_v2,
 )
@@ -1026,10 +1027,7 @@ def test_create_dev_app_recreate_app_when_orphaned(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -1146,23 +1144,12 @@ def test_create_dev_app_recreate_app_when_orphaned_requires_cascade(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 ProgrammingError(errno=APPLICATION_OWNS_EXTERNAL_OBJECTS),
                 mock.call("drop application myapp"),
             ),
-            (
-                mock_cursor([("app_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (
-                mock_cursor([("app_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (
                 mock_cursor(
                     [
@@ -1288,23 +1275,12 @@ def test_create_dev_app_recreate_app_when_orphaned_requires_cascade_unknown_obje
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 ProgrammingError(errno=APPLICATION_OWNS_EXTERNAL_OBJECTS),
                 mock.call("drop application myapp"),
             ),
-            (
-                mock_cursor([("app_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (
-                mock_cursor([("app_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (
                 ProgrammingError(errno=APPLICATION_NO_LONGER_AVAILABLE),
                 mock.call("show objects owned by application myapp"),
@@ -1408,15 +1384,10 @@ def test_upgrade_app_warehouse_error(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
+            mock_select_current_session_state(
+                mock_cursor, role="old_role", warehouse="old_wh"
             ),
             (None, mock.call("use role app_role")),
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
             (
                 ProgrammingError(errno=DOES_NOT_EXIST_OR_CANNOT_BE_PERFORMED),
                 mock.call("use warehouse app_warehouse"),
@@ -1664,10 +1635,7 @@ def test_upgrade_app_fails_upgrade_restriction_error(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("use role old_role")),
         ]
@@ -1738,10 +1706,7 @@ def test_versioned_app_upgrade_to_unversioned(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -1855,10 +1820,7 @@ def test_upgrade_app_fails_drop_fails(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 ProgrammingError(
@@ -1939,10 +1901,7 @@ def test_upgrade_app_recreate_app(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -2113,10 +2072,7 @@ def test_upgrade_app_recreate_app_from_version(
     }
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -2250,10 +2206,7 @@ def test_run_app_from_release_directive_with_channel(
     mock_show_release_channels.return_value = [{"name": "MY_CHANNEL"}]
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -2624,6 +2577,7 @@ def test_run_app_from_release_directive_with_default_channel_when_release_channe
     }
     mock_show_release_channels.return_value = []
     mock_conn.return_value = MockConnectionCtx()
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     mock_sql_facade_upgrade_application.side_effect = (
         UpgradeApplicationRestrictionError(DEFAULT_USER_INPUT_ERROR_MESSAGE)
     )
@@ -2705,10 +2659,7 @@ def test_get_existing_version_info(
     version = "V1"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor(
@@ -84,8 +84,10 @@ from tests.nativeapp.utils import (
     SQL_EXECUTOR_EXECUTE,
     SQL_EXECUTOR_EXECUTE_QUERIES,
     SQL_FACADE_GET_UI_PARAMETER,
+    SQL_SELECT_CURRENT_SESSION_STATE,
     assert_programmingerror_cause_with_errno,
     mock_execute_helper,
+    mock_select_current_session_state,
 )
 
 sql_facade = SnowflakeSQLFacade()
@@ -244,20 +246,11 @@ def test_execute_with_role_wh_db(mock_execute_queries, mock_execute_query, mock_
     database = "mock_db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
+            mock_select_current_session_state(
+                mock_cursor, role="old_role", warehouse="old_wh", database="old_db"
             ),
             (None, mock.call("use role mock_role")),
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
             (None, mock.call("use warehouse mock_wh")),
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_database()"),
-            ),
             (None, mock.call("use database mock_db")),
             (None, mock.call("use database old_db")),
             (None, mock.call("use warehouse old_wh")),
@@ -271,11 +264,9 @@ def test_execute_with_role_wh_db(mock_execute_queries, mock_execute_query, mock_
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_role()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use role mock_role"),
-        mock.call.mock_execute_query("select current_warehouse()"),
         mock.call.mock_execute_query("use warehouse mock_wh"),
-        mock.call.mock_execute_query("select current_database()"),
         mock.call.mock_execute_query("use database mock_db"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use database old_db"),
@@ -308,15 +299,10 @@ def test_execute_no_db(mock_execute_queries, mock_execute_query, mock_cursor):
     wh = "mock_wh"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
+            mock_select_current_session_state(
+                mock_cursor, role="old_role", warehouse="old_wh"
             ),
             (None, mock.call("use role mock_role")),
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
             (None, mock.call("use warehouse mock_wh")),
             (None, mock.call("use warehouse old_wh")),
             (None, mock.call("use role old_role")),
@@ -329,9 +315,8 @@ def test_execute_no_db(mock_execute_queries, mock_execute_query, mock_cursor):
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_role()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use role mock_role"),
-        mock.call.mock_execute_query("select current_warehouse()"),
         mock.call.mock_execute_query("use warehouse mock_wh"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use warehouse old_wh"),
@@ -359,15 +344,10 @@ def test_execute_no_wh(mock_execute_queries, mock_execute_query, mock_cursor):
     database = "mock_db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
+            mock_select_current_session_state(
+                mock_cursor, role="old_role", database="old_db"
             ),
             (None, mock.call("use role mock_role")),
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_database()"),
-            ),
             (None, mock.call("use database mock_db")),
             (None, mock.call("use database old_db")),
             (None, mock.call("use role old_role")),
@@ -380,9 +360,8 @@ def test_execute_no_wh(mock_execute_queries, mock_execute_query, mock_cursor):
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_role()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use role mock_role"),
-        mock.call.mock_execute_query("select current_database()"),
         mock.call.mock_execute_query("use database mock_db"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use database old_db"),
@@ -410,15 +389,10 @@ def test_execute_no_role(mock_execute_queries, mock_execute_query, mock_cursor):
     database = "mock_db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
+            mock_select_current_session_state(
+                mock_cursor, warehouse="old_wh", database="old_db"
             ),
             (None, mock.call("use warehouse mock_wh")),
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_database()"),
-            ),
             (None, mock.call("use database mock_db")),
             (None, mock.call("use database old_db")),
             (None, mock.call("use warehouse old_wh")),
@@ -431,9 +405,8 @@ def test_execute_no_role(mock_execute_queries, mock_execute_query, mock_cursor):
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_warehouse()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use warehouse mock_wh"),
-        mock.call.mock_execute_query("select current_database()"),
         mock.call.mock_execute_query("use database mock_db"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use database old_db"),
@@ -463,10 +436,7 @@ def test_execute_no_wh_no_db(mock_execute_queries, mock_execute_query, mock_curs
     role = "mock_role"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role mock_role")),
             (None, mock.call("use role old_role")),
         ]
@@ -478,7 +448,7 @@ def test_execute_no_wh_no_db(mock_execute_queries, mock_execute_query, mock_curs
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_role()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use role mock_role"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use role old_role"),
@@ -504,10 +474,7 @@ def test_execute_no_role_no_wh(mock_execute_queries, mock_execute_query, mock_cu
     database = "mock_db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_database()"),
-            ),
+            mock_select_current_session_state(mock_cursor, database="old_db"),
             (None, mock.call("use database mock_db")),
             (None, mock.call("use database old_db")),
         ]
@@ -519,7 +486,7 @@ def test_execute_no_role_no_wh(mock_execute_queries, mock_execute_query, mock_cu
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_database()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use database mock_db"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use database old_db"),
@@ -545,10 +512,7 @@ def test_execute_no_role_no_db(mock_execute_queries, mock_execute_query, mock_cu
     wh = "mock_wh"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
+            mock_select_current_session_state(mock_cursor, warehouse="old_wh"),
             (None, mock.call("use warehouse mock_wh")),
             (None, mock.call("use warehouse old_wh")),
         ]
@@ -560,7 +524,7 @@ def test_execute_no_role_no_db(mock_execute_queries, mock_execute_query, mock_cu
     mock_parent.attach_mock(mock_execute_queries, "mock_execute_queries")
 
     all_execute_calls = [
-        mock.call.mock_execute_query("select current_warehouse()"),
+        mock.call.mock_execute_query(SQL_SELECT_CURRENT_SESSION_STATE),
         mock.call.mock_execute_query("use warehouse mock_wh"),
         mock.call.mock_execute_queries(mock_script),
         mock.call.mock_execute_query("use warehouse old_wh"),
@@ -747,10 +711,7 @@ def test_use_warehouse_single_quoted_id(mock_execute_query, mock_cursor):
     single_quoted_name = "test warehouse"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
+            mock_select_current_session_state(mock_cursor, warehouse="old_wh"),
             (None, mock.call('use warehouse "test warehouse"')),
             (None, mock.call(f"use warehouse old_wh")),
         ]
@@ -766,12 +727,7 @@ def test_use_warehouse_single_quoted_id(mock_execute_query, mock_cursor):
 def test_use_warehouse_same_id_single_quotes(mock_execute_query, mock_cursor):
     single_quoted_name = "test warehouse"
     side_effects, expected = mock_execute_helper(
-        [
-            (
-                mock_cursor([('"test warehouse"',)], []),
-                mock.call("select current_warehouse()"),
-            )
-        ]
+        [mock_select_current_session_state(mock_cursor, warehouse='"test warehouse"')]
     )
     mock_execute_query.side_effect = side_effects
 
@@ -785,10 +741,7 @@ def test_use_role_single_quoted_id(mock_execute_query, mock_cursor):
     single_quoted_name = "test role"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call('use role "test role"')),
             (None, mock.call(f"use role old_role")),
         ]
@@ -804,12 +757,7 @@ def test_use_role_single_quoted_id(mock_execute_query, mock_cursor):
 def test_use_role_same_id_single_quotes(mock_execute_query, mock_cursor):
     single_quoted_name = "test role"
     side_effects, expected = mock_execute_helper(
-        [
-            (
-                mock_cursor([('"test role"',)], []),
-                mock.call("select current_role()"),
-            )
-        ]
+        [mock_select_current_session_state(mock_cursor, role='"test role"')]
     )
     mock_execute_query.side_effect = side_effects
 
@@ -823,10 +771,7 @@ def test_use_db_single_quoted_id(mock_execute_query, mock_cursor):
     single_quoted_name = "test db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_database()"),
-            ),
+            mock_select_current_session_state(mock_cursor, database="old_db"),
             (None, mock.call('use database "test db"')),
             (None, mock.call(f"use database old_db")),
         ]
@@ -843,10 +788,7 @@ def test_use_db_same_id_single_quotes(mock_execute_query, mock_cursor):
     single_quoted_name = "test db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([('"test db"',)], []),
-                mock.call("select current_database()"),
-            ),
+            mock_select_current_session_state(mock_cursor, database='"test db"'),
         ]
     )
     mock_execute_query.side_effect = side_effects
@@ -898,10 +840,7 @@ def test_use_warehouse_bubbles_errors(
     name = "test_warehouse"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_wh",)], []),
-                mock.call("select current_warehouse()"),
-            ),
+            mock_select_current_session_state(mock_cursor, warehouse="old_wh"),
             (error_raised, mock.call("use warehouse test_warehouse")),
         ]
     )
@@ -955,10 +894,7 @@ def test_use_role_bubbles_errors(
     name = "test_role"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (error_raised, mock.call("use role test_role")),
         ]
     )
@@ -1012,10 +948,7 @@ def test_use_db_bubbles_errors(
     name = "test_db"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_db",)], []),
-                mock.call("select current_warehouse()"),
-            ),
+            mock_select_current_session_state(mock_cursor, warehouse="old_db"),
             (error_raised, mock.call("use database test_db")),
         ]
     )
@@ -1130,10 +1063,7 @@ def test_get_event_definitions_with_role(mock_execute_query, mock_cursor):
     ]
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call(f"use role {role_name}")),
             (
                 mock_cursor(events_definitions, []),
@@ -1229,10 +1159,7 @@ def test_get_app_properties_with_role(mock_execute_query, mock_cursor):
     ]
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call(f"use role {role_name}")),
             (
                 mock_cursor(expected_result, []),
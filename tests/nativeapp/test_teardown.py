@@ -60,6 +60,7 @@ from tests.nativeapp.utils import (
     TYPER_CONFIRM,
     TYPER_PROMPT,
     mock_execute_helper,
+    mock_select_current_session_state,
     mock_snowflake_yml_file_v2,
     quoted_override_yml_file_v2,
 )
@@ -124,10 +125,7 @@ def _teardown(
 def test_drop_generic_object_success(mock_execute, temporary_directory, mock_cursor):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (None, mock.call("drop application myapp")),
             (None, mock.call("use role old_role")),
@@ -160,10 +158,7 @@ def test_drop_generic_object_failure_w_exception(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 ProgrammingError(
@@ -319,10 +314,7 @@ def test_drop_application_has_special_comment_and_quoted_name(
     side_effects, expected = mock_execute_helper(
         [
             # Show apps
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor(
@@ -342,10 +334,6 @@ def test_drop_application_has_special_comment_and_quoted_name(
             ),
             (None, mock.call("use role old_role")),
             # Drop app
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role app_role")),
             (None, mock.call('drop application "My Application"')),
             (None, mock.call("use role old_role")),
@@ -546,10 +534,7 @@ def test_drop_package_current_role_is_not_owner(
 
     side_effects_for_execute, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -588,10 +573,7 @@ def test_show_versions_failure_w_exception(
     }
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role app_role")),
             (
                 mock_cursor([("row1"), ("row2")], []),
@@ -639,10 +621,7 @@ def test_drop_package_no_mismatch_no_drop(
     }
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -704,10 +683,7 @@ def test_drop_package_variable_mismatch_allowed_user_allows_drop(
     }
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -776,10 +752,7 @@ def test_drop_package_variable_mistmatch_w_special_comment_auto_drop(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -834,10 +807,7 @@ def test_drop_package_variable_mistmatch_w_special_comment_quoted_name_auto_drop
     side_effects, expected = mock_execute_helper(
         [
             # Show app pkg
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor(
@@ -857,10 +827,6 @@ def test_drop_package_variable_mistmatch_w_special_comment_quoted_name_auto_drop
             ),
             (None, mock.call("use role old_role")),
             # Show versions
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -871,10 +837,6 @@ def test_drop_package_variable_mistmatch_w_special_comment_quoted_name_auto_drop
             ),
             (None, mock.call("use role old_role")),
             # Drop app pkg
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
             (None, mock.call("use role package_role")),
             (None, mock.call('drop application package "My Package"')),
             (None, mock.call("use role old_role")),
@@ -929,10 +891,7 @@ def test_drop_package_variable_mistmatch_no_special_comment_user_prohibits_drop(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -1000,10 +959,7 @@ def test_drop_package_variable_mistmatch_no_special_comment_user_allows_drop(
 
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -1052,10 +1008,7 @@ def test_drop_package_idempotent(
     mock_get_app_pkg_distribution.return_value = "internal"
     side_effects_for_execute, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
@@ -49,6 +49,7 @@ from tests.nativeapp.utils import (
     SQL_FACADE_CREATE_VERSION,
     SQL_FACADE_SHOW_RELEASE_DIRECTIVES,
     mock_execute_helper,
+    mock_select_current_session_state,
     mock_snowflake_yml_file_v2,
 )
 from tests.testing_utils.files_and_dirs import create_named_file
@@ -98,10 +99,7 @@ def test_get_existing_release_direction_info(
     version = "V1"
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor(
@@ -189,10 +187,7 @@ def test_add_new_patch_auto(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([{"version": version, "patch": 12}], []),
@@ -245,10 +240,7 @@ def test_add_new_patch_custom(
 ):
     side_effects, expected = mock_execute_helper(
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
+            mock_select_current_session_state(mock_cursor, role="old_role"),
             (None, mock.call("use role package_role")),
             (
                 mock_cursor([{"version": version, "patch": 12}], []),
@@ -18,6 +18,7 @@ import os
 from pathlib import Path
 from textwrap import dedent
 from typing import List, Set
+from unittest import mock
 
 import pytest
 from snowflake.connector import ProgrammingError
@@ -118,6 +119,10 @@ SQL_FACADE_REMOVE_VERSION_FROM_RELEASE_CHANNEL = (
     f"{SQL_FACADE}.remove_version_from_release_channel"
 )
 
+SQL_SELECT_CURRENT_SESSION_STATE = (
+    "select current_role(), current_warehouse(), current_database(), current_schema()"
+)
+
 mock_snowflake_yml_file = dedent(
     """\
         definition_version: 1
@@ -207,6 +212,16 @@ def mock_execute_helper(mock_input: list):
     return side_effects, expected
 
 
+def mock_select_current_session_state(
+    mock_cursor, role=None, warehouse=None, database=None, schema=None
+):
+    """(side effect, expected call) pair of the query fetching the session state."""
+    return (
+        mock_cursor([(role, warehouse, database, schema)], []),
+        mock.call(SQL_SELECT_CURRENT_SESSION_STATE),
+    )
+
+
 # TODO: move to shared utils between integration tests and unit tests once available
 def touch(path: str):
     file = Path(path)
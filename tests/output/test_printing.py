@@ -13,12 +13,21 @@
 # limitations under the License.
 
 import json
-from datetime import datetime
+import os
+import sys
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
 from textwrap import dedent
 from typing import NamedTuple
+from unittest import mock
 
 import pytest
-from snowflake.cli._app.printing import print_result
+from rich import get_console
+from snowflake.cli._app import printing
+from snowflake.cli._app.printing import CustomJSONEncoder, print_result
+from snowflake.cli.api.cli_global_context import get_cli_context_manager
+from snowflake.cli.api.exceptions import CliError
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
     CollectionResult,
@@ -29,6 +38,7 @@ from snowflake.cli.api.output.types import (
     SingleQueryResult,
     StreamResult,
 )
+from snowflake.connector.cursor import ResultMetadata
 
 from tests.testing_utils.conversion import get_output, get_output_as_json
 
@@ -151,6 +161,88 @@ def test_print_multi_results_table(capsys, _create_mock_cursor):
     )
 
 
+def test_print_multi_results_table_in_terminal(capsys, _create_mock_cursor):
+    output_data = MultipleResults(
+        [
+            QueryResult(_create_mock_cursor()),
+            QueryResult(_create_mock_cursor()),
+        ],
+    )
+    console = get_console()
+
+    with mock.patch.object(console, "_force_terminal", True), mock.patch.object(
+        console, "_color_system", None
+    ):
+        print_result(output_data, output_format=OutputFormat.TABLE)
+
+    table = dedent(
+        """\
+    +---------------------------------------------------------------------+
+    | string | number | array     | object          | date                |
+    |--------+--------+-----------+-----------------+---------------------|
+    | string | 42     | ['array'] | {'k': 'object'} | 2022-03-21 00:00:00 |
+    | string | 43     | ['array'] | {'k': 'object'} | 2022-03-21 00:00:00 |
+    +---------------------------------------------------------------------+
+    """
+    )
+    assert get_output(capsys) == f"{table}\n{table}\n"
+
+
+@mock.patch("snowflake.cli._app.printing.TABLE_SAMPLE_ROWS", 1)
+def test_print_streamed_table_matches_table_layout(capsys, _create_mock_cursor):
+    print_result(QueryResult(_create_mock_cursor()), output_format=OutputFormat.TABLE)
+
+    assert get_output(capsys) == dedent(
+        """\
+    +---------------------------------------------------------------------+
+    | string | number | array     | object          | date                |
+    |--------+--------+-----------+-----------------+---------------------|
+    | string | 42     | ['array'] | {'k': 'object'} | 2022-03-21 00:00:00 |
+    | string | 43     | ['array'] | {'k': 'object'} | 2022-03-21 00:00:00 |
+    +---------------------------------------------------------------------+
+    """
+    )
+
+
+@mock.patch("snowflake.cli._app.printing.TABLE_SAMPLE_ROWS", 2)
+def test_print_streamed_table_folds_values_wider_than_sample(capsys, mock_cursor):
+    cursor = mock_cursor(
+        columns=["ID", "NAME"], rows=[(1, "abc"), (2, "abcd"), (3, "abcdefghij")]
+    )
+
+    print_result(QueryResult(cursor), output_format=OutputFormat.TABLE)
+
+    assert get_output(capsys) == dedent(
+        """\
+    +-----------+
+    | ID | NAME |
+    |----+------|
+    | 1  | abc  |
+    | 2  | abcd |
+    | 3  | abcd |
+    |    | efgh |
+    |    | ij   |
+    +-----------+
+    """
+    )
+
+
+@mock.patch("snowflake.cli._app.printing.TABLE_SAMPLE_ROWS", 2)
+@pytest.mark.parametrize("max_rows", ["1", "3"])
+def test_print_table_with_max_rows(capsys, mock_cursor, max_rows):
+    cursor = mock_cursor(columns=["ID"], rows=[(i,) for i in range(5)])
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_OUTPUT_TABLE_MAX_ROWS": max_rows}):
+        print_result(QueryResult(cursor), output_format=OutputFormat.TABLE)
+
+    output = get_output(capsys).splitlines()
+    assert output[3:-2] == [f"| {i}  |" for i in range(int(max_rows))]
+    assert output[-1] == (
+        f"Output truncated to {max_rows} rows. "
+        "Use cli.output.table_max_rows option to change the limit."
+    )
+
+
 def test_print_different_multi_results_table(capsys, mock_cursor):
     output_data = MultipleResults(
         [
@@ -314,6 +406,325 @@ def test_print_different_data_sources_json(capsys, _create_mock_cursor):
     ]
 
 
+def test_print_query_result_json_matches_dict_payload(capsys, _create_mock_cursor):
+    print_result(QueryResult(_create_mock_cursor()), output_format=OutputFormat.JSON)
+
+    expected_rows = [
+        {k: v for k, v in zip(["string", "number", "array", "object", "date"], row)}
+        for row in _create_mock_cursor().fetchall()
+    ]
+    assert get_output(capsys) == (
+        json.dumps(expected_rows, cls=CustomJSONEncoder, indent=4) + "\n"
+    )
+
+
+def test_print_query_result_json_with_duplicated_columns(capsys, mock_cursor):
+    cursor = mock_cursor(columns=["A", "B", "A"], rows=[(1, 2, 3)])
+    print_result(QueryResult(cursor), output_format=OutputFormat.JSON)
+
+    assert get_output_as_json(capsys) == [{"A": 3, "B": 2}]
+
+
+@pytest.mark.parametrize(
+    "output_format", [OutputFormat.JSON, OutputFormat.CSV, OutputFormat.NDJSON]
+)
+@pytest.mark.parametrize("compact", ["true", "false"])
+@mock.patch("snowflake.connector.cursor.SnowflakeCursor.fetch_arrow_batches")
+def test_print_query_result_row_batches_match_dict_payload(
+    mock_fetch_arrow_batches, capsys, mock_cursor, output_format, compact
+):
+    def _query_result():
+        return QueryResult(
+            mock_cursor(
+                columns=["AMOUNT", "CREATED"],
+                rows=[
+                    (Decimal("1.50"), datetime(2022, 3, 21, 12, 30)),
+                    (Decimal("123.45"), datetime(2022, 3, 22, 0, 0, 1)),
+                ],
+            )
+        )
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT": compact}):
+        print_result(_query_result(), output_format=output_format)
+        from_row_batches = get_output(capsys)
+        with mock.patch.object(QueryResult, "supports_row_batches", False):
+            print_result(_query_result(), output_format=output_format)
+        from_dict_payload = get_output(capsys)
+
+    assert from_row_batches == from_dict_payload
+    assert "123.45" in from_row_batches
+    mock_fetch_arrow_batches.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "output_format", [OutputFormat.JSON, OutputFormat.CSV, OutputFormat.NDJSON]
+)
+@pytest.mark.parametrize("compact", ["true", "false"])
+@pytest.mark.parametrize("wrapper", [None, MultipleResults])
+def test_print_query_result_does_not_build_dict_payload(
+    capsys, _create_mock_cursor, output_format, compact, wrapper
+):
+    def _dict_payload(self, cursor):
+        raise AssertionError("rows should be read with iter_row_batches")
+        yield  # pragma: no cover
+
+    with mock.patch.object(QueryResult, "_prepare_payload", _dict_payload):
+        output_data = QueryResult(_create_mock_cursor())
+        if wrapper is not None:
+            output_data = wrapper([output_data])
+        with mock.patch.dict(
+            os.environ, {"SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT": compact}
+        ):
+            print_result(output_data, output_format=output_format)
+
+    assert "43" in get_output(capsys)
+
+
+def test_print_query_result_csv(capsys, _create_mock_cursor):
+    print_result(QueryResult(_create_mock_cursor()), output_format=OutputFormat.CSV)
+
+    assert get_output(capsys) == dedent(
+        """\
+        string,number,array,object,date
+        string,42,"[""array""]","{""k"": ""object""}",2022-03-21T00:00:00
+        string,43,"[""array""]","{""k"": ""object""}",2022-03-21T00:00:00
+        """
+    )
+
+
+def test_print_multiple_results_csv(capsys, mock_cursor):
+    output_data = MultipleResults(
+        [
+            QueryResult(mock_cursor(columns=["A"], rows=[(1,), (None,)])),
+            MessageResult("Command done"),
+        ]
+    )
+
+    print_result(output_data, output_format=OutputFormat.CSV)
+
+    assert get_output(capsys) == 'A\n1\n""\n\nmessage\nCommand done\n'
+
+
+def test_print_multiple_results_ndjson(capsys, _create_mock_cursor):
+    output_data = MultipleResults(
+        [
+            QueryResult(_create_mock_cursor()),
+            CollectionResult(({"key": f"value_{i}"} for i in range(2))),
+        ]
+    )
+
+    print_result(output_data, output_format=OutputFormat.NDJSON)
+
+    assert get_output(capsys).splitlines() == [
+        '{"string":"string","number":42,"array":["array"],"object":{"k":"object"},"date":"2022-03-21T00:00:00"}',
+        '{"string":"string","number":43,"array":["array"],"object":{"k":"object"},"date":"2022-03-21T00:00:00"}',
+        '{"key":"value_0"}',
+        '{"key":"value_1"}',
+    ]
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.JSON, OutputFormat.CSV])
+def test_print_result_to_output_file(
+    capsys, _create_mock_cursor, temporary_directory, output_format
+):
+    output_file = Path(temporary_directory) / "result.out"
+    get_cli_context_manager().output_file = output_file
+
+    print_result(QueryResult(_create_mock_cursor()), output_format=output_format)
+
+    assert get_output(capsys) == ""
+    get_cli_context_manager().output_file = None
+    print_result(QueryResult(_create_mock_cursor()), output_format=output_format)
+    assert output_file.read_text() == get_output(capsys) != ""
+
+
+@mock.patch.dict(sys.modules, {"pyarrow": None})
+def test_print_parquet_without_pyarrow(_create_mock_cursor):
+    with pytest.raises(CliError, match="requires pyarrow"):
+        print_result(
+            QueryResult(_create_mock_cursor()), output_format=OutputFormat.PARQUET
+        )
+
+
+@mock.patch("snowflake.cli.api.output.types.ROW_BATCH_SIZE", 2)
+def test_print_parquet_with_null_column_in_first_batch(
+    mock_cursor, temporary_directory
+):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_file = Path(temporary_directory) / "result.parquet"
+    get_cli_context_manager().output_file = output_file
+    cursor = mock_cursor(
+        columns=["ID", "COMMENT"],
+        rows=[(1, None), (2, None), (3, "late"), (4, None), (5, "value")],
+    )
+
+    print_result(QueryResult(cursor), output_format=OutputFormat.PARQUET)
+
+    table = pq.read_table(output_file)
+    assert str(table.schema.field("COMMENT").type) == "string"
+    assert table.to_pydict() == {
+        "ID": [1, 2, 3, 4, 5],
+        "COMMENT": [None, None, "late", None, "value"],
+    }
+
+
+@pytest.mark.parametrize("with_column_types", [True, False])
+@mock.patch("snowflake.cli.api.output.types.ROW_BATCH_SIZE", 1)
+def test_print_parquet_with_types_widening_in_later_batches(
+    mock_cursor, temporary_directory, with_column_types
+):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_file = Path(temporary_directory) / "result.parquet"
+    get_cli_context_manager().output_file = output_file
+    cursor = mock_cursor(
+        columns=["AMOUNT", "RATIO"],
+        rows=[(Decimal("1.50"), 1), (Decimal("123.45"), 1.5), (None, None)],
+    )
+    if with_column_types:
+        cursor._columns = [  # noqa: SLF001
+            ResultMetadata("AMOUNT", 0, None, None, 10, 2, True),
+            ResultMetadata("RATIO", 1, None, None, None, None, True),
+        ]
+
+    print_result(QueryResult(cursor), output_format=OutputFormat.PARQUET)
+
+    table = pq.read_table(output_file)
+    assert str(table.schema.field("RATIO").type) == "double"
+    if with_column_types:
+        assert str(table.schema.field("AMOUNT").type) == "decimal128(10, 2)"
+    assert table.to_pydict() == {
+        "AMOUNT": [Decimal("1.50"), Decimal("123.45"), None],
+        "RATIO": [1.0, 1.5, None],
+    }
+
+
+def test_print_parquet_to_terminal_is_refused(_create_mock_cursor):
+    with mock.patch.object(sys.stdout, "isatty", return_value=True):
+        with pytest.raises(CliError, match="cannot be printed to a terminal"):
+            print_result(
+                QueryResult(_create_mock_cursor()), output_format=OutputFormat.PARQUET
+            )
+
+
+def test_print_json_of_non_standard_types(capsys, mock_cursor):
+    cursor = mock_cursor(
+        columns=["DECIMAL", "INTEGER", "TIME", "PATH"],
+        rows=[(Decimal("1.50"), Decimal("12"), time(12, 30), Path("a") / "b")],
+    )
+
+    print_result(QueryResult(cursor), output_format=OutputFormat.JSON)
+
+    assert json.loads(get_output(capsys)) == [
+        {"DECIMAL": 1.5, "INTEGER": 12, "TIME": "12:30:00", "PATH": "a/b"}
+    ]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_custom_json_encoder_matches_json_module(indent):
+    value = {
+        "b": [1, -2.5, float("nan"), "żółw\n", None, True, (), {}],
+        "a": {"nested": [{"x": 2**70}], 3: False, 1.5: "float key"},
+        "": [[[]]],
+    }
+
+    assert json.dumps(value, cls=CustomJSONEncoder, indent=indent) == json.dumps(
+        value, indent=indent
+    )
+
+
+def test_custom_json_encoder_converts_non_standard_types():
+    value = {
+        "decimals": [
+            Decimal("1.50"),
+            Decimal("-0.000"),
+            Decimal(2**70),
+            Decimal("NaN"),
+        ],
+        "binary": [b"\x00\xff", bytearray(b"ab")],
+        "date": date(2024, 1, 31),
+    }
+
+    assert json.dumps(value, cls=CustomJSONEncoder) == (
+        '{"decimals": [1.5, 0, ' + str(2**70) + ", NaN], "
+        '"binary": ["00ff", "6162"], "date": "2024-01-31"}'
+    )
+
+
+_USE_ORJSON_PARAMS = [
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(
+            printing.orjson is None, reason="orjson is not installed"
+        ),
+    ),
+    False,
+]
+
+
+@pytest.mark.parametrize("use_orjson", _USE_ORJSON_PARAMS)
+def test_print_compact_json(capsys, _create_mock_cursor, use_orjson):
+    output_data = MultipleResults(
+        [QueryResult(_create_mock_cursor()), MessageResult("Command done")]
+    )
+    orjson = printing.orjson if use_orjson else None
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT": "true"}):
+        with mock.patch.object(printing, "orjson", orjson):
+            print_result(output_data, output_format=OutputFormat.JSON)
+
+    row = '"string":"string","number":{},"array":["array"],"object":{{"k":"object"}},"date":"2022-03-21T00:00:00"'
+    assert get_output(capsys) == (
+        "[[{"
+        + row.format(42)
+        + "},{"
+        + row.format(43)
+        + '}],{"message":"Command done"}]\n'
+    )
+
+
+@pytest.mark.parametrize("use_orjson", _USE_ORJSON_PARAMS)
+def test_print_compact_json_of_non_standard_values(capsys, mock_cursor, use_orjson):
+    cursor = mock_cursor(
+        columns=["DECIMAL", "RATIO", "NAN", "SMALL", "LARGE", "TEXT"],
+        rows=[
+            (
+                Decimal("12345678901234567890"),
+                Decimal("1.25"),
+                float("nan"),
+                1.5e-5,
+                1e16,
+                "zażółć",
+            )
+        ],
+    )
+    orjson = printing.orjson if use_orjson else None
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT": "true"}):
+        with mock.patch.object(printing, "orjson", orjson):
+            print_result(QueryResult(cursor), output_format=OutputFormat.JSON)
+
+    # orjson and the json module write non-finite and exponent floats differently
+    expected_floats = (
+        '"NAN":null,"SMALL":0.000015,"LARGE":1e16'
+        if use_orjson
+        else '"NAN":NaN,"SMALL":1.5e-05,"LARGE":1e+16'
+    )
+    assert get_output(capsys) == (
+        '[{"DECIMAL":12345678901234567890,"RATIO":1.25,'
+        + expected_floats
+        + ',"TEXT":"zażółć"}]\n'
+    )
+
+
+def test_print_compact_json_with_integer_over_64_bits(capsys, mock_cursor):
+    cursor = mock_cursor(columns=["N"], rows=[(2**70,)])
+
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_OUTPUT_JSON_COMPACT": "true"}):
+        print_result(QueryResult(cursor), output_format=OutputFormat.JSON)
+
+    assert get_output(capsys) == f'[{{"N":{2**70}}}]\n'
+
+
 def test_print_with_no_data_table(capsys):
     print_result(None)
     assert get_output(capsys) == "Done\n"
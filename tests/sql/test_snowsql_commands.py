@@ -7,6 +7,7 @@ from snowflake.cli._plugins.sql.snowsql_commands import (
     QueriesCommand,
     ResultCommand,
     SnowSQLCommand,
+    WaitCommand,
     compile_snowsql_command,
 )
 
@@ -241,6 +242,12 @@ def test_queries_execute_help(mock_print, mock_ctx):
         ("!abort", [_FAKE_QID], AbortCommand(_FAKE_QID)),
         ("!queries", ["amount=3", "user=jdoe"], QueriesCommand(amount=3, user="jdoe")),
         ("!QuERies", ["session"], QueriesCommand(from_current_session=True)),
+        ("!wait", [], WaitCommand()),
+        (
+            "!wait",
+            ["now"],
+            "'wait' command does not accept arguments. Usage: `!wait`",
+        ),
         (
             "!ResUlT",
             [],
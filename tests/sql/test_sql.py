@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import sys
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import mock
 
 import pytest
+from snowflake.cli._plugins.sql.manager import SqlManager
 from snowflake.cli._plugins.sql.snowsql_templating import transpile_snowsql_templates
 from snowflake.cli.api.constants import ObjectType
 from snowflake.cli.api.exceptions import (
@@ -84,6 +86,224 @@ def test_sql_execute_from_stdin(mock_execute, runner, mock_cursor):
     mock_execute.assert_called_once_with(query, cursor_class=VerboseCursor)
 
 
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_execute_query_to_output_file(
+    mock_execute, runner, mock_cursor, temporary_directory
+):
+    mock_execute.return_value = (
+        mock_cursor([("a", 1)], ["name", "value"]) for _ in range(1)
+    )
+    output_file = Path(temporary_directory) / "result.csv"
+
+    result = runner.invoke(
+        ["sql", "-q", "query", "--format", "csv", "--output-file", str(output_file)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert output_file.read_text().splitlines() == ["name,value", "a,1"]
+
+
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_execute_async_query_to_output_file(
+    mock_execute, mock_conn, runner, mock_cursor, temporary_directory
+):
+    mock_execute.side_effect = lambda query, **_: iter(
+        [mock_cursor([(query[-2],)], ["value"])]
+    )
+    mock_conn.return_value.cursor.return_value = mock.MagicMock(sfqid="abc")
+    output_file = Path(temporary_directory) / "result.ndjson"
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "select 1; select 2;> select 3;",
+            "--format",
+            "ndjson",
+            "--output-file",
+            str(output_file),
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert output_file.read_text().splitlines() == [
+        '{"value":"1"}',
+        '{"scheduled query ID":"abc"}',
+        '{"value":"3"}',
+    ]
+
+
+def test_output_file_is_not_available_for_commands_without_query_output(runner):
+    result = runner.invoke(["connection", "set-default", "x", "--output-file", "f"])
+
+    assert_that_result_is_usage_error(result, "No such option: --output-file")
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_execute_file_with_stream(
+    mock_execute, runner, mock_cursor, named_temporary_file
+):
+    mock_execute.side_effect = lambda query, **_: iter(
+        [mock_cursor([(query,)], ["QUERY"])]
+    )
+
+    with named_temporary_file() as tmp_file:
+        tmp_file.write_text("select 1;\nselect 2;\n")
+        result = runner.invoke(["sql", "-f", tmp_file, "--stream", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert mock_execute.mock_calls == [
+        mock.call("select 1;", cursor_class=VerboseCursor),
+        mock.call("select 2;", cursor_class=VerboseCursor),
+    ]
+    assert json.loads(result.output) == [
+        [{"QUERY": "select 1;"}],
+        [{"QUERY": "select 2;"}],
+    ]
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_execute_file_with_stream_stops_at_rendering_error(
+    mock_execute, runner, mock_cursor, named_temporary_file
+):
+    mock_execute.side_effect = lambda query, **_: iter([mock_cursor(["row"], [])])
+
+    with named_temporary_file() as tmp_file:
+        tmp_file.write_text("select 1;\nselect &{ foo };\nselect 2;\n")
+        result = runner.invoke(["sql", "-f", tmp_file, "--stream", "-D", "bar=1"])
+
+    assert result.exit_code == 1
+    assert "SQL template rendering error: 'foo' is undefined" in result.output
+    assert mock_execute.mock_calls == [
+        mock.call("select 1;", cursor_class=VerboseCursor)
+    ]
+
+
+def _async_connection(events):
+    def _cursor(**_):
+        cursor = mock.MagicMock(sfqid=None)
+
+        def _execute_async(query):
+            cursor.sfqid = query
+            events.append(("submit", query))
+
+        cursor.execute_async.side_effect = _execute_async
+        cursor.execute.side_effect = lambda query: events.append(("execute", query))
+        cursor.get_results_from_sfqid.side_effect = lambda qid: events.append(
+            ("result", qid)
+        )
+        return cursor
+
+    def _execute_stream(stream, **_):
+        events.append(("execute", stream.read()))
+        return iter([mock.MagicMock()])
+
+    return mock.MagicMock(
+        cursor=mock.MagicMock(side_effect=_cursor),
+        execute_stream=mock.MagicMock(side_effect=_execute_stream),
+    )
+
+
+@pytest.mark.parametrize(
+    "query, expected_events",
+    [
+        (
+            "select 1; select 2; select 3;",
+            [
+                ("submit", "select 1;"),
+                ("submit", "select 2;"),
+                ("result", "select 1;"),
+                ("submit", "select 3;"),
+                ("result", "select 2;"),
+                ("result", "select 3;"),
+            ],
+        ),
+        (
+            "select 1; !wait; select 2; select 3;",
+            [
+                ("submit", "select 1;"),
+                ("result", "select 1;"),
+                ("submit", "select 2;"),
+                ("submit", "select 3;"),
+                ("result", "select 2;"),
+                ("result", "select 3;"),
+            ],
+        ),
+        (
+            "select 1; use schema x; select 2 from t;",
+            [
+                ("submit", "select 1;"),
+                ("result", "select 1;"),
+                ("execute", "use schema x;"),
+                ("submit", "select 2 from t;"),
+                ("result", "select 2 from t;"),
+            ],
+        ),
+        (
+            "select 1; put file://data.csv @stage; select 2;",
+            [
+                ("submit", "select 1;"),
+                ("result", "select 1;"),
+                ("execute", "put file://data.csv @stage;"),
+                ("submit", "select 2;"),
+                ("result", "select 2;"),
+            ],
+        ),
+        (
+            "create temporary table t(a int); select 1 from t; select 2;",
+            [
+                ("execute", "create temporary table t(a int);"),
+                ("submit", "select 1 from t;"),
+                ("submit", "select 2;"),
+                ("result", "select 1 from t;"),
+                ("result", "select 2;"),
+            ],
+        ),
+    ],
+)
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_sql_execute_in_parallel(mock_conn, query, expected_events):
+    events = []
+    mock_conn.return_value = _async_connection(events)
+
+    expected_results_cnt, cursors = SqlManager().execute(query, None, False, parallel=2)
+
+    assert expected_results_cnt == 3
+    assert len(list(cursors)) == 3
+    assert events == expected_events
+
+
+@mock.patch(
+    "snowflake.cli._plugins.sql.manager.SqlManager._conn",
+    new_callable=mock.PropertyMock,
+)
+def test_sql_execute_in_parallel_cancels_running_queries_when_interrupted(mock_conn):
+    events = []
+    mock_conn.return_value = _async_connection(events)
+
+    _, cursors = SqlManager().execute(
+        "select 1; select 2; select 3;", None, False, parallel=2
+    )
+    next(iter(cursors))
+    cursors.close()
+
+    assert events == [
+        ("submit", "select 1;"),
+        ("submit", "select 2;"),
+        ("result", "select 1;"),
+        ("execute", "select system$cancel_query('select 2;')"),
+    ]
+
+
 @mock.patch("snowflake.cli._plugins.sql.repl.PromptSession")
 @mock.patch("snowflake.cli._plugins.sql.repl.Repl._execute")
 def test_sql_repl_if_no_query_file_or_stdin(
@@ -523,3 +743,111 @@ def test_comments_are_handled_correctly_from_query(
         mock.call(exp_query, cursor_class=VerboseCursor) for exp_query in expected
     ]
     assert mock_execute.mock_calls == expected_calls
+
+
+@mock.patch("snowflake.cli._plugins.sql.manager.SqlExecutionMixin.execute_query")
+def test_session_state_is_fetched_once(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor([("old_role", "old_wh", "db", None)], [])
+    executor = SqlExecutionMixin()
+
+    assert executor.current_role() == "old_role"
+    assert executor.session_has_warehouse()
+    with executor.use_role("new_role"):
+        assert executor.current_role() == "NEW_ROLE"
+    assert executor.current_role() == "old_role"
+
+    assert mock_execute.mock_calls == [
+        mock.call(
+            "select current_role(), current_warehouse(), current_database(), current_schema()"
+        ),
+        mock.call("use role new_role"),
+        mock.call("use role old_role"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "statement,invalidates",
+    [
+        ("select 1", False),
+        ("show databases", False),
+        ("alter application myapp set comment = 'database'", False),
+        ("create stage my_stage", False),
+        ("create database my_db", True),
+        ("drop schema my_schema", True),
+        ("alter warehouse my_wh rename to other_wh", True),
+        ("call my_procedure()", True),
+        ("grant role my_role to user my_user", True),
+        ("revoke role my_role from user my_user", True),
+        ("select 1; use role other_role", True),
+    ],
+)
+def test_session_state_is_invalidated_by_statements_which_may_change_it(
+    mock_cursor, statement, invalidates
+):
+    connection = mock.MagicMock()
+    connection.execute_stream.side_effect = lambda *args, **kwargs: iter(
+        [mock_cursor([("role", "wh", "db", "schema")], [])]
+    )
+    executor = SqlExecutionMixin(connection=connection)
+    executor.current_object("role")
+
+    executor.execute_query(statement)
+    executor.current_object("role")
+
+    executed = [c.args[0].getvalue() for c in connection.execute_stream.mock_calls]
+    select_session_state = "select current_role(), current_warehouse(), current_database(), current_schema()"
+    assert executed.count(select_session_state) == (2 if invalidates else 1)
+
+
+def test_session_state_is_updated_by_use_statements(mock_cursor):
+    connection = mock.MagicMock()
+    connection.execute_stream.side_effect = lambda *args, **kwargs: iter(
+        [mock_cursor([("role", "wh", "db", "schema")], [])]
+    )
+    executor = SqlExecutionMixin(connection=connection)
+    executor.current_object("role")
+
+    executor.use(ObjectType.WAREHOUSE, "other_wh")
+    assert executor.current_object("warehouse") == "OTHER_WH"
+    executor.execute_query("use database other_db")
+    executor.current_object("schema")
+
+    executed = [c.args[0].getvalue() for c in connection.execute_stream.mock_calls]
+    assert executed[1:] == [
+        "use warehouse other_wh",
+        "use database other_db",
+        "select current_schema()",
+    ]
+
+
+@pytest.mark.parametrize(
+    "role, expected_current_role",
+    [("sysadmin", "SYSADMIN"), ('"MixedCase"', "MixedCase"), ('"a""b"', 'a"b')],
+)
+def test_session_state_records_names_as_returned_by_snowflake(
+    mock_cursor, role, expected_current_role
+):
+    connection = mock.MagicMock()
+    connection.execute_stream.side_effect = lambda *args, **kwargs: iter(
+        [mock_cursor([("role", "wh", "db", "schema")], [])]
+    )
+    executor = SqlExecutionMixin(connection=connection)
+    executor.current_object("role")
+
+    executor.use(ObjectType.ROLE, role)
+
+    assert executor.current_role() == expected_current_role
+    assert connection.execute_stream.call_count == 2
+
+
+def test_session_state_is_not_cached_without_result(mock_cursor):
+    connection = mock.MagicMock()
+    connection.execute_stream.side_effect = lambda *args, **kwargs: iter(
+        [mock_cursor([], [])]
+    )
+    executor = SqlExecutionMixin(connection=connection)
+
+    assert executor.current_object("role") is None
+    assert executor.current_object("role") is None
+
+    assert connection.execute_stream.call_count == 2
@@ -15,19 +15,23 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import typing
 from pathlib import Path
 from typing import Dict, List, Union
 from unittest import mock
 
 import pytest
+from click import ClickException
 from snowflake.cli._plugins.stage.diff import (
     DiffResult,
     StagePathType,
     build_md5_map,
     compute_stage_diff,
+    copy_files_on_stage,
     delete_only_on_stage_files,
     enumerate_files,
+    get_md5_max_workers,
     get_stage_subpath,
     preserve_from_diff,
     put_files_on_stage,
@@ -204,6 +208,54 @@ def test_unmodified_file_no_remote_md5sum(mock_list, mock_cursor):
         assert len(diff_result.only_local) == 0
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_diff_is_deterministic_with_parallel_hashing(
+    mock_list, mock_cursor, max_workers
+):
+    local_files = {f"dir{i % 3}/file{i}.txt": f"contents {i}" for i in range(30)}
+    remote_files = {
+        **local_files,
+        "dir0/file3.txt": "modified on stage",
+        "dir1/file10.txt": "modified on stage",
+    }
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents(remote_files),
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(local_files) as local_path:
+        diff_result = compute_stage_diff(
+            local_path, DefaultStagePathParts("a.b.stage"), max_workers=max_workers
+        )
+        expected_local_order = [
+            StagePathType(*p.relative_to(local_path).parts)
+            for p in enumerate_files(local_path)
+        ]
+
+    assert diff_result.different == as_stage_paths(
+        ["dir0/file3.txt", "dir1/file10.txt"]
+    )
+    assert diff_result.identical == [
+        p for p in expected_local_order if p not in diff_result.different
+    ]
+    assert len(diff_result.only_local) == 0
+    assert len(diff_result.only_on_stage) == 0
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(None, None), ("1", 1), ("16", 16), ("0", None), ("x", None)]
+)
+def test_get_md5_max_workers(value, expected):
+    env = {"SNOWFLAKE_CLI_STAGE_MD5_MAX_WORKERS": value} if value else {}
+    with mock.patch.dict(os.environ, env):
+        if value is not None and expected is None:
+            with pytest.raises(ClickException):
+                get_md5_max_workers()
+        else:
+            assert get_md5_max_workers() == expected
+
+
 def test_get_stage_path_from_file():
     expected = [
         "",
@@ -240,6 +292,52 @@ def test_delete_only_on_stage_files(mock_remove):
     )
 
 
+@mock.patch(f"{STAGE_MANAGER}.remove")
+def test_delete_only_on_stage_files_batches_removes(mock_remove, mock_cursor):
+    stage_name = "db.schema.stage/v1"
+    mock_remove.side_effect = lambda **kwargs: mock_cursor(
+        rows=[("stage/v1/a.txt", "removed"), ("stage/v1/dir/b[1].py", "removed")]
+        if "pattern" in kwargs
+        else [],
+        columns=["name", "result"],
+    )
+
+    delete_only_on_stage_files(
+        StageManager(),
+        stage_name,
+        as_stage_paths(["a.txt", "dir/b[1].py", "dir/c.sql"]),
+        "some_role",
+    )
+
+    assert mock_remove.mock_calls == [
+        mock.call(
+            stage_name=stage_name,
+            path="",
+            role="some_role",
+            pattern=r"stage/v1/(a\.txt|dir/b\[1\]\.py|dir/c\.sql)",
+        ),
+        # not reported as removed by the batched statement
+        mock.call(stage_name=stage_name, path="dir/c.sql", role="some_role"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.remove")
+@mock.patch("snowflake.cli._plugins.stage.diff.REMOVE_PATTERN_MAX_LENGTH", 12)
+def test_delete_only_on_stage_files_chunks_patterns(mock_remove, mock_cursor):
+    files = ["file_1.txt", "file_2.txt", "file_3.txt"]
+    mock_remove.return_value = mock_cursor(
+        rows=[(f"stage/{f}", "removed") for f in files], columns=["name", "result"]
+    )
+
+    delete_only_on_stage_files(StageManager(), "stage", as_stage_paths(files))
+
+    assert [c.kwargs["pattern"] for c in mock_remove.mock_calls] == [
+        r"stage/(file_1\.txt)",
+        r"stage/(file_2\.txt)",
+        r"stage/(file_3\.txt)",
+    ]
+
+
 @mock.patch(f"{STAGE_MANAGER}.put")
 @pytest.mark.parametrize("overwrite_param", [True, False])
 def test_put_files_on_stage(mock_put, overwrite_param):
@@ -275,6 +373,64 @@ def test_put_files_on_stage(mock_put, overwrite_param):
         assert mock_put.mock_calls == expected
 
 
+@mock.patch(f"{STAGE_MANAGER}.put")
+def test_put_files_on_stage_groups_files_by_directory(mock_put):
+    stage_name = "some_stage_name"
+    uploaded = {}
+
+    def _record_put(local_path, stage_path, **kwargs):
+        local_path = Path(local_path)
+        if local_path.is_dir():
+            files = {f.name: f.read_text() for f in sorted(local_path.iterdir())}
+        else:
+            files = {local_path.name: local_path.read_text()}
+        uploaded.setdefault(stage_path, []).append(files)
+
+    mock_put.side_effect = _record_put
+    with temp_local_dir(
+        {
+            "ui/a.py": "a",
+            "ui/b.py": "b",
+            "ui/nested/c.py": "c",
+            "README.md": "readme",
+            "LICENSE": "license",
+            ".env": "env",
+            "not_changed.txt": "not changed",
+        }
+    ) as local_path:
+        put_files_on_stage(
+            stage_manager=StageManager(),
+            stage_root=stage_name,
+            deploy_root_path=local_path,
+            stage_paths=as_stage_paths(
+                [
+                    "ui/a.py",
+                    "README.md",
+                    "ui/nested/c.py",
+                    ".env",
+                    "ui/b.py",
+                    "LICENSE",
+                ]
+            ),
+            role="some_role",
+            overwrite=True,
+        )
+
+    assert mock_put.call_count == 4
+    assert uploaded == {
+        f"{stage_name}/ui": [{"a.py": "a", "b.py": "b"}],
+        # hidden files would not be matched by the "<dir>/*" glob of a batched PUT
+        f"{stage_name}": [
+            {".env": "env"},
+            {"LICENSE": "license", "README.md": "readme"},
+        ],
+        f"{stage_name}/ui/nested": [{"c.py": "c"}],
+    }
+    for call in mock_put.mock_calls:
+        assert call.kwargs["role"] == "some_role"
+        assert call.kwargs["overwrite"] is True
+
+
 def test_build_md5_map(mock_cursor):
     actual = build_md5_map(
         mock_cursor(
@@ -311,6 +467,107 @@ def test_sync_local_diff_with_stage(mock_remove, temporary_directory):
         )
 
 
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_moved_file_is_copied_on_stage(mock_list, mock_cursor):
+    stage_name = "a.b.stage"
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents({"old/my.jar": FILE_CONTENTS["my.jar"]}),
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        diff = compute_stage_diff(local_path, DefaultStagePathParts(stage_name))
+        assert diff.only_on_stage == [StagePathType("old/my.jar")]
+
+        with mock.patch(f"{STAGE_MANAGER}.copy_files") as mock_copy, mock.patch(
+            f"{STAGE_MANAGER}.remove"
+        ) as mock_remove, mock.patch(f"{STAGE_MANAGER}.put") as mock_put:
+            mock_remove.side_effect = lambda **kwargs: mock_copy.assert_called()
+            sync_local_diff_with_stage(
+                role=None,
+                deploy_root_path=local_path,
+                diff_result=diff,
+                stage_full_path=stage_name,
+            )
+
+    mock_copy.assert_called_once_with(
+        source_path=f"{stage_name}/old/",
+        destination_path=f"{stage_name}/",
+        files=["my.jar"],
+    )
+    mock_remove.assert_called_once_with(
+        stage_name=stage_name, path="old/my.jar", role=None
+    )
+    uploaded = sorted(
+        path.name
+        for call in mock_put.mock_calls
+        for path in (
+            call.kwargs["local_path"].iterdir()
+            if call.kwargs["local_path"].is_dir()
+            else [call.kwargs["local_path"]]
+        )
+    )
+    assert "my.jar" not in uploaded
+
+
+@mock.patch(f"{STAGE_MANAGER}.copy_files")
+def test_copy_files_on_stage_requires_same_name_and_contents(
+    mock_copy, temporary_directory
+):
+    local_files = {"a/data.csv": "1,2,3", "b/other.csv": "1,2,3", "c/data.csv": "4"}
+    diff = DiffResult(
+        only_local=as_stage_paths(local_files.keys()),
+        stage_md5s={
+            StagePathType("old/data.csv"): md5_of("1,2,3"),
+            StagePathType("old/other.csv"): md5_of("changed"),
+            StagePathType("multipart/c.csv"): "0d0e5f8fc6e4a59a5ba8bdfcf3db7c46-2",
+        },
+    )
+    with temp_local_dir(local_files) as local_path:
+        copied = copy_files_on_stage(
+            StageManager(), "stage", local_path, diff, role=None
+        )
+
+    assert copied == [StagePathType("a/data.csv")]
+    mock_copy.assert_called_once_with(
+        source_path="stage/old/", destination_path="stage/a", files=["data.csv"]
+    )
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_files_on_stage_does_not_copy_files_sharing_the_prefix(
+    mock_execute, temporary_directory
+):
+    diff = DiffResult(
+        only_local=as_stage_paths(["new/a.txt"]),
+        stage_md5s={
+            StagePathType("a.txt"): md5_of("contents"),
+            StagePathType("a.txt.bak"): md5_of("backup"),
+            StagePathType("a.txt2/b.txt"): md5_of("other"),
+        },
+    )
+    with temp_local_dir({"new/a.txt": "contents"}) as local_path:
+        copied = copy_files_on_stage(
+            StageManager(), "@db.schema.stage", local_path, diff, role=None
+        )
+
+    assert copied == [StagePathType("new/a.txt")]
+    mock_execute.assert_called_once_with(
+        "copy files into @db.schema.stage/new/ from @db.schema.stage/ files = ('a.txt')"
+    )
+
+
+@mock.patch(f"{STAGE_MANAGER}.copy_files")
+def test_copy_files_on_stage_skips_user_stage(mock_copy, temporary_directory):
+    diff = DiffResult(
+        only_local=as_stage_paths(["data.csv"]),
+        stage_md5s={StagePathType("old/data.csv"): md5_of("1,2,3")},
+    )
+    with temp_local_dir({"data.csv": "1,2,3"}) as local_path:
+        assert copy_files_on_stage(StageManager(), "@~/dir", local_path, diff) == []
+    mock_copy.assert_not_called()
+
+
 def test_filter_from_diff():
     diff = DiffResult()
     diff.different = as_stage_paths(
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
 from pathlib import Path
 from typing import List, Tuple
@@ -24,6 +25,7 @@ from snowflake.cli._plugins.stage.md5 import (
     ONE_MEGABYTE,
     UnknownMD5FormatError,
     compute_md5sum,
+    compute_md5sums,
     file_matches_md5sum,
 )
 from snowflake.connector.constants import S3_CHUNK_SIZE, S3_MAX_PARTS, S3_MIN_PART_SIZE
@@ -91,21 +93,24 @@ def test_multipart_md5sum():
             False,
         ),
         # multi-part md5sum w/ default chunk size
-        # we check the default S3 chunk size first
+        # both the default S3 chunk size and the 1mb-aligned chunk size are
+        # computed in a single pass
         (
             "00001111222233334444555566667777-2",
             math.ceil(S3_CHUNK_SIZE * 1.4),
-            [(S3_CHUNK_SIZE, "00001111222233334444555566667777-2")],
+            [
+                (S3_CHUNK_SIZE, "00001111222233334444555566667777-2"),
+                (6 * ONE_MEGABYTE, "badmd5-2"),
+            ],
             True,
         ),
         # multi-part md5sum w/ 2mb chunk size
-        # we check the default S3 chunk size first,
-        # then fall back to 1mb-aligned chunk size
+        # the default S3 chunk size cannot produce 6 parts, so only the
+        # 1mb-aligned chunk size is computed
         (
             "00001111222233334444555566667777-6",
             math.ceil(S3_CHUNK_SIZE * 1.4),
             [
-                (S3_CHUNK_SIZE, "badmd5-2"),
                 (2 * ONE_MEGABYTE, "00001111222233334444555566667777-6"),
             ],
             True,
@@ -124,21 +129,27 @@ def test_multipart_md5sum():
         ),
         # multi-part, but incorrect md5sum
         (
-            f"00001111222233334444555566667777-{S3_MAX_PARTS}",
-            S3_MAX_PARTS * 50,
+            "00001111222233334444555566667777-2",
+            math.ceil(S3_CHUNK_SIZE * 1.4),
             [
-                (max(50, S3_MIN_PART_SIZE), f"badmd5-{S3_MAX_PARTS}"),
-                (S3_CHUNK_SIZE, f"badmd5-50"),
-                (ONE_MEGABYTE, f"badmd5-400"),
+                (S3_CHUNK_SIZE, "badmd5-2"),
+                (6 * ONE_MEGABYTE, "badmd5-2"),
             ],
             False,
         ),
+        # multi-part, but no chunk size can produce that many parts
+        (
+            f"00001111222233334444555566667777-{S3_MAX_PARTS}",
+            S3_MAX_PARTS * 50,
+            None,
+            False,
+        ),
     ],
 )
 @mock.patch("os.path.getsize")
-@mock.patch("snowflake.cli._plugins.stage.md5.compute_md5sum")
+@mock.patch("snowflake.cli._plugins.stage.md5.compute_md5sums")
 def test_file_matches_md5sum(
-    compute_md5sum: mock.NonCallableMock,
+    compute_md5sums: mock.NonCallableMock,
     getsize: mock.NonCallableMock,
     remote_md5: str | None,
     file_size: int | None,  # None if we don't expect it to be called
@@ -148,21 +159,15 @@ def test_file_matches_md5sum(
     local_file = mock.Mock(spec=Path)
     getsize.return_value = file_size
 
-    def get_md5_for_chunk(_, requested_chunk_size: int | None = None):
-        """Returns the test-configured md5 for a given chunk size"""
-        if chunk_size_and_md5:
-            for (chunk_size, md5) in chunk_size_and_md5:
-                if chunk_size == requested_chunk_size:
-                    return md5
-            # passed in a chunk size we didn't expect
-            assert requested_chunk_size in [
-                chunk_size for (chunk_size, _) in chunk_size_and_md5
-            ]
-        else:
-            # didn't expect any calls to compute_md5sum
-            assert False
-
-    compute_md5sum.side_effect = get_md5_for_chunk
+    def get_md5_for_chunks(_, requested_chunk_sizes: List[int | None]):
+        """Returns the test-configured md5s for the requested chunk sizes"""
+        # didn't expect any calls to compute_md5sums
+        assert chunk_size_and_md5 is not None
+        md5s = dict(chunk_size_and_md5)
+        assert set(requested_chunk_sizes) <= set(md5s)
+        return {chunk_size: md5s[chunk_size] for chunk_size in requested_chunk_sizes}
+
+    compute_md5sums.side_effect = get_md5_for_chunks
 
     # actual test
     if isinstance(expected, bool):
@@ -172,13 +177,34 @@ def test_file_matches_md5sum(
             file_matches_md5sum(local_file, remote_md5)
 
     if chunk_size_and_md5 is None:
-        compute_md5sum.assert_not_called()
+        compute_md5sums.assert_not_called()
     else:
-        compute_md5sum.assert_has_calls(
-            [
-                mock.call(local_file, chunk_size)
-                if chunk_size is not None
-                else mock.call(local_file)
-                for (chunk_size, _) in chunk_size_and_md5
-            ]
+        # every candidate is computed in a single pass over the file
+        compute_md5sums.assert_called_once_with(
+            local_file, [chunk_size for (chunk_size, _) in chunk_size_and_md5]
+        )
+
+
+def test_compute_md5sums_single_pass():
+    contents = "This is a test. This is a test. This is a test."
+    with temp_local_dir({"README.md": contents}) as root:
+        md5s = compute_md5sums(root / "README.md", [None, 8, 16, 8])
+
+        assert md5s == {
+            None: compute_md5sum(root / "README.md"),
+            8: "47754cc91d4369081c0153ef0cb86675-6",
+            16: compute_md5sum(root / "README.md", 16),
+        }
+        assert md5s[None] == hashlib.md5(contents.encode()).hexdigest()
+
+
+@mock.patch("snowflake.cli._plugins.stage.md5.MMAP_THRESHOLD_BYTES", 1)
+@mock.patch("snowflake.cli._plugins.stage.md5.LARGE_READ_BUFFER_BYTES", 5)
+def test_compute_md5sums_memory_mapped():
+    with temp_local_dir(
+        {"README.md": "This is a test. This is a test. This is a test."}
+    ) as root:
+        assert (
+            compute_md5sums(root / "README.md", [8])[8]
+            == "47754cc91d4369081c0153ef0cb86675-6"
         )
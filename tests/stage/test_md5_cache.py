@@ -0,0 +1,93 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from snowflake.cli._plugins.stage.md5 import compute_md5sums, file_matches_md5sum
+from snowflake.cli._plugins.stage.md5_cache import Md5Cache, md5_cache_path
+
+from tests.testing_utils.files_and_dirs import temp_local_dir
+
+README_MD5 = "9b650974f65cc49be96a5ed34ac6d1fd"
+
+
+def test_cache_is_persisted_and_reused(temporary_directory):
+    cache_file = Path(temporary_directory) / "cache.json"
+    with temp_local_dir({"README.md": "This is a README\n"}) as local_path:
+        readme = local_path / "README.md"
+
+        cache = Md5Cache(cache_file)
+        assert file_matches_md5sum(readme, README_MD5, cache)
+        cache.save()
+        assert cache_file.exists()
+
+        reloaded = Md5Cache(cache_file)
+        assert reloaded.get(readme) == README_MD5
+        with mock.patch(
+            "snowflake.cli._plugins.stage.md5.compute_md5sums"
+        ) as mock_compute:
+            assert file_matches_md5sum(readme, README_MD5, reloaded)
+            mock_compute.assert_not_called()
+
+
+def test_cache_entry_is_invalidated_by_file_change(temporary_directory):
+    cache_file = Path(temporary_directory) / "cache.json"
+    with temp_local_dir({"README.md": "This is a README\n"}) as local_path:
+        readme = local_path / "README.md"
+        cache = Md5Cache(cache_file)
+        cache.get_or_compute(readme, [None], compute_md5sums)
+
+        readme.write_text("This is a modified README\n")
+        stat = readme.stat()
+        os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get(readme) is None
+        assert len(cache) == 0
+        assert not file_matches_md5sum(readme, README_MD5, cache)
+
+
+def test_cache_keys_by_chunk_size(temporary_directory):
+    with temp_local_dir({"README.md": "This is a README\n"}) as local_path:
+        readme = local_path / "README.md"
+        cache = Md5Cache(Path(temporary_directory) / "cache.json")
+        cache.put(readme, {None: "full", 4: "chunked-5"})
+
+        assert cache.get(readme) == "full"
+        assert cache.get(readme, 4) == "chunked-5"
+        assert cache.get(readme, 8) is None
+
+
+def test_cache_evicts_least_recently_used(temporary_directory):
+    files = {f"file{i}.txt": f"contents {i}" for i in range(3)}
+    with temp_local_dir(files) as local_path:
+        cache = Md5Cache(Path(temporary_directory) / "cache.json", max_entries=2)
+        cache.put(local_path / "file0.txt", {None: "md5-0"})
+        cache.put(local_path / "file1.txt", {None: "md5-1"})
+        assert cache.get(local_path / "file0.txt") == "md5-0"
+        cache.put(local_path / "file2.txt", {None: "md5-2"})
+
+        assert len(cache) == 2
+        assert cache.get(local_path / "file1.txt") is None
+        assert cache.get(local_path / "file0.txt") == "md5-0"
+
+
+def test_cache_ignores_corrupted_file(temporary_directory):
+    cache_file = md5_cache_path(Path(temporary_directory))
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("{not json")
+
+    cache = Md5Cache.for_project(Path(temporary_directory))
+    assert len(cache) == 0
@@ -11,7 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import os
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
@@ -31,6 +35,9 @@ if IS_WINDOWS:
 
 
 STAGE_MANAGER = "snowflake.cli._plugins.stage.manager.StageManager"
+SELECT_CURRENT_SESSION_STATE = (
+    "select current_role(), current_warehouse(), current_database(), current_schema()"
+)
 
 skip_python_3_12 = pytest.mark.skipif(
     sys.version_info >= (3, 12), reason="Snowpark is not supported in Python >= 3.12"
@@ -510,6 +517,77 @@ def test_copy_get_recursive_from_user_stage(
     ]
 
 
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_get_recursive_batches_files_by_directory(
+    mock_execute, mock_cursor, temporary_directory
+):
+    mock_execute.return_value = mock_cursor(
+        [{"name": f"exe/{file}"} for file in ["a/s1.sql", "a/s2.sql", "s3.sql"]], []
+    )
+
+    StageManager().get_recursive("@exe", Path(temporary_directory))
+
+    assert mock_execute.mock_calls == [
+        mock.call("ls @exe", cursor_class=DictCursor),
+        mock.call(
+            f"get @exe/a/ file://{temporary_directory}/a/ parallel=4 pattern = 'exe/a/[^/]+'"
+        ),
+        mock.call(f"get @exe/s3.sql file://{temporary_directory}/ parallel=4"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_get_recursive_falls_back_to_single_files(
+    mock_execute, mock_cursor, temporary_directory
+):
+    mock_execute.side_effect = [
+        mock_cursor([{"name": "exe/s1.sql"}, {"name": "exe/s2.sql"}], []),
+        mock_cursor([("s1.sql",)], ["file"]),
+        mock_cursor([("s1.sql",)], ["file"]),
+        mock_cursor([("s2.sql",)], ["file"]),
+    ]
+
+    cursors = StageManager().get_recursive("@exe", Path(temporary_directory))
+
+    assert [c.fetchall() for c in cursors] == [[("s1.sql",)], [("s2.sql",)]]
+    assert mock_execute.mock_calls[1:] == [
+        mock.call(
+            f"get @exe/ file://{temporary_directory}/ parallel=4 pattern = 'exe/[^/]+'"
+        ),
+        mock.call(f"get @exe/s1.sql file://{temporary_directory}/ parallel=4"),
+        mock.call(f"get @exe/s2.sql file://{temporary_directory}/ parallel=4"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_copy_get_recursive_with_max_concurrency(
+    mock_execute, mock_cursor, temporary_directory
+):
+    files = ["a/s1.sql", "a/s2.sql", "b/s3.sql", "c/d/s4.sql", "s5.sql"]
+    mock_execute.return_value = mock_cursor(
+        [{"name": f"exe/{file}"} for file in files], []
+    )
+
+    StageManager().get_recursive("@exe", Path(temporary_directory), max_concurrency=3)
+
+    ls_call, *copy_calls = mock_execute.mock_calls
+    assert ls_call == mock.call("ls @exe", cursor_class=DictCursor)
+    assert sorted(copy_calls) == sorted(
+        [
+            mock.call(
+                f"get @exe/a/ file://{temporary_directory}/a/ parallel=4 pattern = 'exe/a/[^/]+'"
+            ),
+            mock.call(f"get @exe/b/s3.sql file://{temporary_directory}/b/ parallel=4"),
+            mock.call(
+                f"get @exe/c/d/s4.sql file://{temporary_directory}/c/d/ parallel=4"
+            ),
+            mock.call(f"get @exe/s5.sql file://{temporary_directory}/ parallel=4"),
+        ]
+    )
+    for directory in ["a", "b", "c/d"]:
+        assert (Path(temporary_directory) / directory).is_dir()
+
+
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_create(mock_execute, runner, mock_cursor):
     mock_execute.return_value = mock_cursor(["row"], [])
@@ -638,9 +716,14 @@ def test_stage_print_result_for_get_all_files_from_stage_recursive(
             ],
             [],
         ),
-        mock_cursor([("file1.txt", 10, "DOWNLOADED", "")], columns),
-        mock_cursor([("file2.txt", 10, "DOWNLOADED", "")], columns),
-        mock_cursor([("file3.txt", 10, "DOWNLOADED", "")], columns),
+        mock_cursor(
+            [
+                ("file1.txt", 10, "DOWNLOADED", ""),
+                ("file2.txt", 10, "DOWNLOADED", ""),
+                ("file3.txt", 10, "DOWNLOADED", ""),
+            ],
+            columns,
+        ),
     ]
 
     with TemporaryDirectory() as tmp_dir:
@@ -652,11 +735,11 @@ def test_stage_print_result_for_get_all_files_from_stage_recursive(
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_internal_remove(mock_execute, mock_cursor):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     sm = StageManager()
     sm.remove("stageName", "my/file/foo.csv", "new_role")
     expected = [
-        mock.call("select current_role()"),
+        mock.call(SELECT_CURRENT_SESSION_STATE),
         mock.call("use role new_role"),
         mock.call("remove @stageName/my/file/foo.csv"),
         mock.call("use role old_role"),
@@ -666,11 +749,11 @@ def test_stage_internal_remove(mock_execute, mock_cursor):
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_internal_remove_quoted(mock_execute, mock_cursor):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     sm = StageManager()
     sm.remove('"stage name"', "my/file/foo.csv", "new_role")
     expected = [
-        mock.call("select current_role()"),
+        mock.call(SELECT_CURRENT_SESSION_STATE),
         mock.call("use role new_role"),
         mock.call("remove '@\"stage name\"/my/file/foo.csv'"),
         mock.call("use role old_role"),
@@ -680,11 +763,11 @@ def test_stage_internal_remove_quoted(mock_execute, mock_cursor):
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_internal_remove_no_role_change(mock_execute, mock_cursor):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     sm = StageManager()
     sm.remove("stageName", "my/file/foo.csv", "old_role")
     expected = [
-        mock.call("select current_role()"),
+        mock.call(SELECT_CURRENT_SESSION_STATE),
         mock.call("remove @stageName/my/file/foo.csv"),
     ]
     assert mock_execute.mock_calls == expected
@@ -692,12 +775,12 @@ def test_stage_internal_remove_no_role_change(mock_execute, mock_cursor):
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_internal_put(mock_execute, mock_cursor):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     with TemporaryDirectory() as tmp_dir:
         sm = StageManager()
         sm.put(Path(tmp_dir).resolve(), "stageName", role="new_role")
         expected = [
-            mock.call("select current_role()"),
+            mock.call(SELECT_CURRENT_SESSION_STATE),
             mock.call("use role new_role"),
             mock.call(
                 f"put file://{Path(tmp_dir).resolve()}/* @stageName auto_compress=false parallel=4 overwrite=False",
@@ -710,12 +793,12 @@ def test_stage_internal_put(mock_execute, mock_cursor):
 
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_internal_put_quoted_stage(mock_execute, mock_cursor):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     with TemporaryDirectory() as tmp_dir:
         sm = StageManager()
         sm.put(Path(tmp_dir).resolve(), '"stage name"', role="new_role")
         expected = [
-            mock.call("select current_role()"),
+            mock.call(SELECT_CURRENT_SESSION_STATE),
             mock.call("use role new_role"),
             mock.call(
                 f"put file://{Path(tmp_dir).resolve()}/* '@\"stage name\"' auto_compress=false parallel=4 overwrite=False",
@@ -745,7 +828,7 @@ def test_stage_internal_put_quoted_stage(mock_execute, mock_cursor):
 def test_stage_internal_put_quoted_path(
     mock_execute, mock_cursor, raw_path, expected_uri
 ):
-    mock_execute.return_value = mock_cursor([("old_role",)], [])
+    mock_execute.return_value = mock_cursor([("old_role", None, None, None)], [])
     with TemporaryDirectory() as tmp_dir:
         sm = StageManager()
         tmp_dir = Path(tmp_dir).resolve()
@@ -753,7 +836,7 @@ def test_stage_internal_put_quoted_path(
         src_uri = expected_uri.replace("{}", str(tmp_dir))
         sm.put(src_path, "stageName", role="new_role")
         expected = [
-            mock.call("select current_role()"),
+            mock.call(SELECT_CURRENT_SESSION_STATE),
             mock.call("use role new_role"),
             mock.call(
                 f"put {src_uri} @stageName auto_compress=false parallel=4 overwrite=False",
@@ -1107,6 +1190,250 @@ def test_execute_continue_on_error(
     ]
 
 
+class AsyncExecutionConnection:
+    """Fake connection recording asynchronously executed queries."""
+
+    def __init__(self, failing_files=()):
+        self.submitted: list[str] = []
+        self.running: set[str] = set()
+        self.max_running = 0
+        self._failing_files = failing_files
+        self._polls: dict[str, int] = {}
+
+    def cursor(self):
+        connection = self
+
+        class _Cursor:
+            sfqid = None
+
+            def execute_async(self, query):
+                self.sfqid = query
+                connection.submitted.append(query)
+                connection.running.add(query)
+                connection.max_running = max(
+                    connection.max_running, len(connection.running)
+                )
+
+        return _Cursor()
+
+    def get_query_status(self, query_id):
+        self._polls[query_id] = self._polls.get(query_id, 0) + 1
+        return self._polls[query_id]
+
+    def is_still_running(self, status):
+        return status < 2
+
+    def get_query_status_throw_if_error(self, query_id):
+        self.running.discard(query_id)
+        if any(query_id.endswith(f) for f in self._failing_files):
+            raise ProgrammingError("Error")
+
+
+@mock.patch(f"{STAGE_MANAGER}.invalidate_session_state")
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(
+    "snowflake.cli._plugins.stage.manager.EXECUTE_ASYNC_POLL_INTERVAL_SECONDS", 0
+)
+def test_execute_with_max_concurrency(
+    mock_execute, mock_conn, mock_invalidate, mock_cursor, runner
+):
+    connection = AsyncExecutionConnection(failing_files=["s2.sql"])
+    mock_conn.return_value = connection
+    mock_execute.return_value = mock_cursor(
+        [
+            {"name": "exe/a/s4.sql"},
+            {"name": "exe/a/s5.sql"},
+            {"name": "exe/s1.sql"},
+            {"name": "exe/s2.sql"},
+            {"name": "exe/s3.sql"},
+        ],
+        [],
+    )
+
+    result = runner.invoke(
+        [
+            "stage",
+            "execute",
+            "exe",
+            "--max-concurrency",
+            "2",
+            "--on-error",
+            "continue",
+            "--format",
+            "json",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert connection.submitted == [
+        f"execute immediate from @exe/{f}"
+        for f in ["s1.sql", "s2.sql", "s3.sql", "a/s4.sql", "a/s5.sql"]
+    ]
+    assert connection.max_running == 2
+    assert json.loads(result.output) == [
+        {"File": "@exe/s1.sql", "Status": "SUCCESS", "Error": None},
+        {"File": "@exe/s2.sql", "Status": "FAILURE", "Error": "Error"},
+        {"File": "@exe/s3.sql", "Status": "SUCCESS", "Error": None},
+        {"File": "@exe/a/s4.sql", "Status": "SUCCESS", "Error": None},
+        {"File": "@exe/a/s5.sql", "Status": "SUCCESS", "Error": None},
+    ]
+    # scripts may have changed the session, e.g. with USE statements
+    mock_invalidate.assert_called()
+
+
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(
+    "snowflake.cli._plugins.stage.manager.EXECUTE_ASYNC_POLL_INTERVAL_SECONDS", 0
+)
+def test_execute_with_max_concurrency_stops_on_error(
+    mock_execute, mock_conn, mock_cursor, runner
+):
+    connection = AsyncExecutionConnection(failing_files=["s1.sql"])
+    mock_conn.return_value = connection
+    mock_execute.return_value = mock_cursor(
+        [{"name": "exe/a/s4.sql"}, {"name": "exe/s1.sql"}, {"name": "exe/s2.sql"}],
+        [],
+    )
+
+    result = runner.invoke(["stage", "execute", "exe", "--max-concurrency", "4"])
+
+    assert result.exit_code == 1
+    assert "Error" in result.output
+    assert connection.submitted == [
+        "execute immediate from @exe/s1.sql",
+        "execute immediate from @exe/s2.sql",
+    ]
+    assert mock_execute.mock_calls[1:] == [
+        mock.call("select system$cancel_query('execute immediate from @exe/s2.sql')")
+    ]
+
+
+@mock.patch("snowflake.snowpark.functions.sproc")
+@mock.patch(f"{STAGE_MANAGER}._check_for_requirements_file", return_value=["pandas"])
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}.snowpark_session")
+@skip_python_3_12
+def test_python_execution_uses_temporary_procedure(
+    mock_snowpark_session,
+    mock_execute,
+    _mock_requirements,
+    mock_sproc,
+    mock_cursor,
+    runner,
+):
+    mock_execute.return_value = mock_cursor(
+        [{"name": "exe/p1.py"}, {"name": "exe/p2.py"}], []
+    )
+
+    result = runner.invoke(["stage", "execute", "exe/"])
+
+    assert result.exit_code == 0, result.output
+    mock_sproc.assert_called_once()
+    assert mock_sproc.call_args.kwargs["is_permanent"] is False
+    assert mock_sproc.call_args.kwargs["packages"] == [
+        "snowflake-snowpark-python",
+        "snowflake.core",
+        "pandas",
+    ]
+    assert mock_sproc.return_value.mock_calls == [
+        mock.call("@exe/p1.py", {}, session=mock_snowpark_session),
+        mock.call("@exe/p2.py", {}, session=mock_snowpark_session),
+    ]
+    assert mock_execute.mock_calls == [mock.call("ls @exe", cursor_class=DictCursor)]
+
+
+@mock.patch("snowflake.snowpark.functions.sproc")
+@mock.patch(f"{STAGE_MANAGER}._check_for_requirements_file", return_value=[])
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}.snowpark_session")
+@mock.patch.dict(
+    os.environ, {"SNOWFLAKE_CLI_STAGE_PYTHON_EXECUTION_SCHEMA": "db.cli_tools"}
+)
+@pytest.mark.parametrize("exists", [True, False])
+@skip_python_3_12
+def test_python_execution_procedure_in_configured_schema(
+    mock_snowpark_session,
+    mock_execute,
+    _mock_requirements,
+    mock_sproc,
+    mock_cursor,
+    runner,
+    exists,
+):
+    from snowflake.snowpark.exceptions import SnowparkSQLException
+
+    mock_execute.side_effect = lambda query, **kwargs: mock_cursor(
+        [{"name": "exe/p1.py"}] if query.startswith("ls ") else [], []
+    )
+    if not exists:
+        mock_snowpark_session.call.side_effect = [
+            SnowparkSQLException("Unknown user-defined function", sql_error_code=2141),
+            None,
+        ]
+
+    result = runner.invoke(["stage", "execute", "exe/p1.py"])
+
+    assert result.exit_code == 0, result.output
+    procedure_name = mock_snowpark_session.call.call_args.args[0]
+    assert procedure_name.startswith("db.cli_tools.snowflake_cli_python_execution_")
+    procedure_call = mock.call(procedure_name, "@exe/p1.py", {})
+    list_query = mock.call("ls @exe", cursor_class=DictCursor)
+    if exists:
+        assert mock_snowpark_session.call.mock_calls == [procedure_call]
+        assert mock_execute.mock_calls == [list_query]
+        mock_sproc.assert_not_called()
+    else:
+        assert mock_snowpark_session.call.mock_calls == [
+            procedure_call,
+            procedure_call,
+        ]
+        assert mock_execute.mock_calls == [
+            list_query,
+            mock.call(
+                "create stage if not exists IDENTIFIER('db.cli_tools.snowflake_cli_python_execution')"
+            ),
+        ]
+        mock_sproc.assert_called_once()
+        assert mock_sproc.call_args.kwargs["name"] == procedure_name
+        assert mock_sproc.call_args.kwargs["is_permanent"] is True
+        assert (
+            mock_sproc.call_args.kwargs["stage_location"]
+            == "@db.cli_tools.snowflake_cli_python_execution"
+        )
+
+
+@mock.patch("snowflake.snowpark.functions.sproc")
+@mock.patch(f"{STAGE_MANAGER}._check_for_requirements_file", return_value=[])
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+@mock.patch(f"{STAGE_MANAGER}.snowpark_session")
+@mock.patch.dict(
+    os.environ, {"SNOWFLAKE_CLI_STAGE_PYTHON_EXECUTION_SCHEMA": "db.cli_tools"}
+)
+@skip_python_3_12
+def test_python_execution_error_does_not_create_procedure(
+    mock_snowpark_session,
+    mock_execute,
+    _mock_requirements,
+    mock_sproc,
+    mock_cursor,
+    runner,
+):
+    from snowflake.snowpark.exceptions import SnowparkSQLException
+
+    mock_execute.return_value = mock_cursor([{"name": "exe/p1.py"}], [])
+    mock_snowpark_session.call.side_effect = SnowparkSQLException(
+        "Python Interpreter Error", sql_error_code=100357
+    )
+
+    with pytest.raises(SnowparkSQLException):
+        runner.invoke(["stage", "execute", "exe/p1.py"])
+
+    mock_snowpark_session.call.assert_called_once()
+    mock_sproc.assert_not_called()
+
+
 @mock.patch("snowflake.connector.connect")
 @pytest.mark.parametrize(
     "command, parameters",
@@ -1201,7 +1528,7 @@ class RecursiveUploadTester:
 
         create_structure(self.tmp_dir, structure)
 
-    def execute(self, local_path):
+    def execute(self, local_path, **kwargs):
         calls = self.calls
 
         class MockPut(MagicMock):
@@ -1209,28 +1536,19 @@ class RecursiveUploadTester:
                 if kwargs:
                     calls.append(
                         {
-                            "local_path": kwargs["local_path"],
+                            "files": sorted(
+                                p.name for p in Path(kwargs["local_path"]).iterdir()
+                            ),
                             "stage_path": kwargs["stage_path"],
                         }
                     )
                 return super().__call__(*args, **kwargs)
 
-        class MockTemporaryDirectory(TemporaryDirectory):
-            current_name: str
-
-            def __enter__(self):
-                MockTemporaryDirectory.current_name = self.name
-                return super().__enter__()
-
         with mock.patch(f"{STAGE_MANAGER}.put", new_callable=MockPut):
-            with mock.patch(
-                "snowflake.cli._plugins.stage.manager.TemporaryDirectory",
-                MockTemporaryDirectory,
-            ):
-                generator = StageManager().put_recursive(Path(local_path), "stageName")
-                list(generator)
-
-        return Path(MockTemporaryDirectory.current_name)
+            generator = StageManager().put_recursive(
+                Path(local_path), "stageName", **kwargs
+            )
+            list(generator)
 
 
 NESTED_STRUCTURE = {
@@ -1263,45 +1581,127 @@ NESTED_STRUCTURE = {
 }
 
 
+NESTED_STRUCTURE_UPLOADS = [
+    dict(
+        files=["file4.foo"],
+        stage_path=StagePath.from_stage_str("@stageName"),
+    ),
+    dict(
+        files=["file1.py", "file1.txt"],
+        stage_path=StagePath.from_stage_str("@stageName/dir1"),
+    ),
+    dict(
+        files=["file121.py", "file122.md"],
+        stage_path=StagePath.from_stage_str("@stageName/dir1/dir12"),
+    ),
+    dict(
+        files=["file21"],
+        stage_path=StagePath.from_stage_str("@stageName/dir2"),
+    ),
+    dict(
+        files=["file21111.py"],
+        stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
+    ),
+    dict(
+        files=["file31"],
+        stage_path=StagePath.from_stage_str("@stageName/dir3"),
+    ),
+    dict(
+        files=["file321"],
+        stage_path=StagePath.from_stage_str("@stageName/dir3/dir32"),
+    ),
+]
+
+
 @pytest.mark.parametrize("pattern", ["", "**/*", "**"])
 def test_recursive_upload(temporary_directory, pattern):
     tester = RecursiveUploadTester(temporary_directory)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=temporary_directory + "/" + pattern)
+    tester.execute(local_path=temporary_directory + "/" + pattern)
 
-    assert tester.calls == [
-        # Leaves
-        dict(
-            local_path=tmp_created_by_copy / "dir2/dir21/dir211/dir2111",
-            stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
-        ),
-        dict(
-            local_path=tmp_created_by_copy / "dir1/dir12/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1/dir12"),
-        ),
-        dict(
-            local_path=tmp_created_by_copy / "dir3/dir32/",
-            stage_path=StagePath.from_stage_str("@stageName/dir3/dir32"),
-        ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy / "dir1/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1"),
-        ),
-        dict(
-            local_path=tmp_created_by_copy / "dir3/",
-            stage_path=StagePath.from_stage_str("@stageName/dir3"),
-        ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy / "dir2",
-            stage_path=StagePath.from_stage_str("@stageName/dir2"),
-        ),
-        # Next level
-        dict(
-            local_path=tmp_created_by_copy,
-            stage_path=StagePath.from_stage_str("@stageName"),
-        ),
+    assert tester.calls == NESTED_STRUCTURE_UPLOADS
+
+
+def test_recursive_upload_with_max_concurrency(temporary_directory):
+    tester = RecursiveUploadTester(temporary_directory)
+    tester.prepare(structure=NESTED_STRUCTURE)
+    tester.execute(local_path=temporary_directory, max_concurrency=4)
+
+    assert sorted(tester.calls, key=lambda c: str(c["stage_path"])) == sorted(
+        NESTED_STRUCTURE_UPLOADS, key=lambda c: str(c["stage_path"])
+    )
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
+def test_recursive_upload_switches_role_once(mock_use_role, temporary_directory):
+    tester = RecursiveUploadTester(temporary_directory)
+    tester.prepare(structure=NESTED_STRUCTURE)
+    tester.execute(local_path=temporary_directory, role="my_role")
+
+    mock_use_role.assert_called_once_with("my_role")
+    assert len(tester.calls) == len(NESTED_STRUCTURE_UPLOADS)
+
+
+@mock.patch("snowflake.cli.api.cli_global_context.use_pooled_connection")
+def test_recursive_upload_with_max_concurrency_uses_leased_connections(
+    mock_use_pooled_connection, temporary_directory
+):
+    leased = []
+
+    @contextmanager
+    def _use_pooled_connection(pool):
+        leased.append(threading.current_thread().name)
+        yield
+
+    mock_use_pooled_connection.side_effect = _use_pooled_connection
+    roles = []
+
+    def _put(local_path, stage_path, role, **kwargs):
+        roles.append(role)
+        return MagicMock()
+
+    tester = RecursiveUploadTester(temporary_directory)
+    tester.prepare(structure=NESTED_STRUCTURE)
+    with mock.patch(f"{STAGE_MANAGER}.put", side_effect=_put), mock.patch(
+        f"{STAGE_MANAGER}.use_role"
+    ) as mock_use_role:
+        list(
+            StageManager().put_recursive(
+                Path(temporary_directory),
+                "stageName",
+                role="my_role",
+                max_concurrency=2,
+            )
+        )
+
+    assert len(leased) == len(NESTED_STRUCTURE_UPLOADS)
+    assert all(name.startswith("stage-put") for name in leased)
+    # every leased connection switches the role for its own upload
+    assert roles == ["my_role"] * len(NESTED_STRUCTURE_UPLOADS)
+    mock_use_role.assert_not_called()
+
+
+def test_recursive_upload_rewrites_result_paths(temporary_directory):
+    tester = RecursiveUploadTester(temporary_directory)
+    tester.prepare(structure={"file1": "content1", "dir1": {"file2": "content2"}})
+
+    def _put(local_path, stage_path, **kwargs):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            {"source": p.name, "target": p.name} for p in Path(local_path).iterdir()
+        ]
+        return cursor
+
+    with mock.patch(f"{STAGE_MANAGER}.put", side_effect=_put):
+        results = list(
+            StageManager().put_recursive(
+                Path(temporary_directory), "stageName", max_concurrency=2
+            )
+        )
+
+    assert results == [
+        {"source": Path("file1"), "target": "@stageName/file1"},
+        {"source": Path("dir1/file2"), "target": "@stageName/dir1/file2"},
     ]
 
 
@@ -1310,7 +1710,7 @@ def test_recursive_upload_with_empty_dir(temporary_directory):
 
     tester = RecursiveUploadTester(temporary_directory)
     tester.prepare(structure=structure)
-    _ = tester.execute(local_path=temporary_directory)
+    tester.execute(local_path=temporary_directory)
 
     assert tester.calls == []
 
@@ -1318,22 +1718,20 @@ def test_recursive_upload_with_empty_dir(temporary_directory):
 def test_recursive_upload_glob_file_pattern(temporary_directory):
     tester = RecursiveUploadTester(temporary_directory)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=f"{temporary_directory}/**/*.py")
+    tester.execute(local_path=f"{temporary_directory}/**/*.py")
 
     assert tester.calls == [
-        # Leaves
         dict(
-            local_path=tmp_created_by_copy / "dir2/dir21/dir211/dir2111/",
-            stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
+            files=["file1.py"],
+            stage_path=StagePath.from_stage_str("@stageName/dir1"),
         ),
         dict(
-            local_path=tmp_created_by_copy / "dir1/dir12/",
+            files=["file121.py"],
             stage_path=StagePath.from_stage_str("@stageName/dir1/dir12"),
         ),
-        # Next level
         dict(
-            local_path=tmp_created_by_copy / "dir1/",
-            stage_path=StagePath.from_stage_str("@stageName/dir1"),
+            files=["file21111.py"],
+            stage_path=StagePath.from_stage_str("@stageName/dir2/dir21/dir211/dir2111"),
         ),
     ]
 
@@ -1341,11 +1739,11 @@ def test_recursive_upload_glob_file_pattern(temporary_directory):
 def test_recursive_upload_no_recursive_glob_pattern(temporary_directory):
     tester = RecursiveUploadTester(temporary_directory)
     tester.prepare(structure=NESTED_STRUCTURE)
-    tmp_created_by_copy = tester.execute(local_path=f"{temporary_directory}/*.foo")
+    tester.execute(local_path=f"{temporary_directory}/*.foo")
 
     assert tester.calls == [
         dict(
-            local_path=tmp_created_by_copy,
+            files=["file4.foo"],
             stage_path=StagePath.from_stage_str("@stageName"),
         ),
     ]
@@ -1376,3 +1774,14 @@ def test_recursive_unbalanced_tree(temporary_directory):
     tester = RecursiveUploadTester(temporary_directory)
     tester.prepare(structure=NESTED_UNBALANCED_STRUCTURE)
     tester.execute(local_path=temporary_directory + "/")
+
+    assert tester.calls == [
+        dict(
+            files=["file2.py"],
+            stage_path=StagePath.from_stage_str("@stageName/dir1/dir2"),
+        ),
+        dict(
+            files=["file5.py"],
+            stage_path=StagePath.from_stage_str("@stageName/dir1/dir3/dir4/dir5"),
+        ),
+    ]
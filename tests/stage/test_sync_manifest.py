@@ -0,0 +1,193 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from pathlib import Path
+from unittest import mock
+
+from snowflake.cli._plugins.stage.diff import (
+    StagePathType,
+    compute_stage_diff,
+    record_sync_in_manifest,
+)
+from snowflake.cli._plugins.stage.manager import DefaultStagePathParts
+from snowflake.cli._plugins.stage.sync_manifest import SyncManifest
+
+from tests.testing_utils.files_and_dirs import temp_local_dir
+
+STAGE_MANAGER = "snowflake.cli._plugins.stage.manager.StageManager"
+STAGE_LS_COLUMNS = ["name", "size", "md5", "last_modified"]
+
+FILE_CONTENTS = {
+    "README.md": "This is a README\n",
+    "ui/streamlit.py": "# this is a streamlit\n",
+}
+
+
+def _stage_contents(files):
+    return [
+        {
+            "name": f"stage/{relpath}",
+            "size": len(contents),
+            "md5": hashlib.md5(contents.encode()).hexdigest(),
+            "last_modified": "Tue, 5 Sep 2023 17:59:21 GMT",
+        }
+        for relpath, contents in files.items()
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_manifest_skips_listing_and_hashing_of_unchanged_files(
+    mock_list, mock_cursor, temporary_directory
+):
+    stage_path = DefaultStagePathParts("a.b.stage")
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    mock_list.return_value = mock_cursor(
+        rows=_stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        manifest = SyncManifest(manifest_file)
+        diff = compute_stage_diff(local_path, stage_path, sync_manifest=manifest)
+        assert len(diff.identical) == 2
+        record_sync_in_manifest(manifest, stage_path, local_path, diff)
+
+        with mock.patch(
+            "snowflake.cli._plugins.stage.diff.file_matches_md5sum"
+        ) as mock_md5:
+            diff = compute_stage_diff(
+                local_path, stage_path, sync_manifest=SyncManifest(manifest_file)
+            )
+            mock_md5.assert_not_called()
+
+    mock_list.assert_called_once()
+    assert sorted(diff.identical) == [
+        StagePathType("README.md"),
+        StagePathType("ui/streamlit.py"),
+    ]
+    assert not diff.has_changes()
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_stage_is_listed_when_local_file_is_added(
+    mock_list, mock_cursor, temporary_directory
+):
+    stage_path = DefaultStagePathParts("a.b.stage")
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    mock_list.side_effect = lambda *_: mock_cursor(
+        rows=_stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        manifest = SyncManifest(manifest_file)
+        diff = compute_stage_diff(local_path, stage_path, sync_manifest=manifest)
+        record_sync_in_manifest(manifest, stage_path, local_path, diff)
+
+        (local_path / "new.txt").write_text("new")
+        diff = compute_stage_diff(
+            local_path, stage_path, sync_manifest=SyncManifest(manifest_file)
+        )
+
+    assert mock_list.call_count == 2
+    assert diff.only_local == [StagePathType("new.txt")]
+    assert len(diff.identical) == 2
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_manifest_remembers_uploaded_and_removed_files(
+    mock_list, mock_cursor, temporary_directory
+):
+    stage_path = DefaultStagePathParts("a.b.stage")
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    mock_list.return_value = mock_cursor(
+        rows=_stage_contents({"old.txt": "old"}), columns=STAGE_LS_COLUMNS
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        manifest = SyncManifest(manifest_file)
+        diff = compute_stage_diff(local_path, stage_path, sync_manifest=manifest)
+        assert diff.only_on_stage == [StagePathType("old.txt")]
+        record_sync_in_manifest(manifest, stage_path, local_path, diff)
+
+        diff = compute_stage_diff(
+            local_path, stage_path, sync_manifest=SyncManifest(manifest_file)
+        )
+        assert mock_list.call_count == 1
+        assert sorted(diff.identical) == [
+            StagePathType("README.md"),
+            StagePathType("ui/streamlit.py"),
+        ]
+        assert not diff.has_changes()
+
+        (local_path / "README.md").write_text("This is a modified README\n")
+        mock_list.return_value = mock_cursor(
+            rows=_stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+        )
+        diff = compute_stage_diff(
+            local_path, stage_path, sync_manifest=SyncManifest(manifest_file)
+        )
+
+    assert mock_list.call_count == 2
+    assert diff.different == [StagePathType("README.md")]
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_manifest_remembers_files_kept_only_on_stage(
+    mock_list, mock_cursor, temporary_directory
+):
+    stage_path = DefaultStagePathParts("a.b.stage")
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    mock_list.return_value = mock_cursor(
+        rows=_stage_contents({**FILE_CONTENTS, "old.txt": "old"}),
+        columns=STAGE_LS_COLUMNS,
+    )
+
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        manifest = SyncManifest(manifest_file)
+        diff = compute_stage_diff(local_path, stage_path, sync_manifest=manifest)
+        # not pruned
+        diff.only_on_stage = []
+        record_sync_in_manifest(manifest, stage_path, local_path, diff)
+
+        diff = compute_stage_diff(
+            local_path, stage_path, sync_manifest=SyncManifest(manifest_file)
+        )
+
+    mock_list.assert_called_once()
+    assert diff.only_on_stage == [StagePathType("old.txt")]
+    assert len(diff.identical) == 2
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_stage_without_record_is_listed(mock_list, mock_cursor, temporary_directory):
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    mock_list.return_value = mock_cursor(
+        rows=_stage_contents({"old.txt": "old"}), columns=STAGE_LS_COLUMNS
+    )
+
+    with temp_local_dir({}) as local_path:
+        diff = compute_stage_diff(
+            local_path,
+            DefaultStagePathParts("a.b.stage"),
+            sync_manifest=SyncManifest(manifest_file),
+        )
+
+    assert diff.only_on_stage == [StagePathType("old.txt")]
+
+
+def test_corrupted_manifest_is_ignored(temporary_directory):
+    manifest_file = Path(temporary_directory) / "manifest.json"
+    manifest_file.write_text("{not json")
+
+    assert SyncManifest(manifest_file).get_files("@a.b.stage") is None
@@ -141,6 +141,7 @@ def test_deploy_with_artifacts(
         )
     )
     mock_conn.return_value = ctx
+    put_calls = _record_put_calls(mock_sm_put)
 
     streamlit_files = [
         "streamlit_app.py",
@@ -164,7 +165,6 @@ def test_deploy_with_artifacts(
         )
         assert result.exit_code == 0, result.output
 
-        put_calls = _extract_put_calls(mock_sm_put)
         # Windows needs absolute paths.
         if IS_WINDOWS:
             tmp_path = tmp.absolute()
@@ -311,6 +311,7 @@ def test_deploy_with_artifacts_from_other_directory(
         )
     )
     mock_conn.return_value = ctx
+    put_calls = _record_put_calls(mock_sm_put)
 
     streamlit_files = [
         "streamlit_app.py",
@@ -329,7 +330,6 @@ def test_deploy_with_artifacts_from_other_directory(
         result = runner.invoke(["streamlit", "deploy", "-p", tmp, "--replace"])
         assert result.exit_code == 0, result.output
 
-        put_calls = _extract_put_calls(mock_sm_put)
         for path in paths:
             assert {
                 "local_path": tmp / path["local"],
@@ -339,13 +339,25 @@ def test_deploy_with_artifacts_from_other_directory(
         assert not (tmp / "output").exists()
 
 
-def _extract_put_calls(mock_sm_put):
-    # Extract the put calls from the mock for better visibility in test logs
-    return [
-        {
-            "local_path": call.kwargs.get("local_path"),
-            "stage_path": call.kwargs.get("stage_path"),
-        }
-        for call in mock_sm_put.mock_calls
-        if call.kwargs.get("local_path")
-    ]
+def _record_put_calls(mock_sm_put):
+    # Record the put calls from the mock for better visibility in test logs.
+    # Files uploaded together from a staging directory are recorded one by one.
+    put_calls = []
+
+    def _put(*args, **kwargs):
+        local_path = kwargs.get("local_path")
+        if local_path:
+            local_path = Path(local_path)
+            sources = (
+                [f.readlink() for f in sorted(local_path.iterdir())]
+                if local_path.is_dir()
+                else [local_path]
+            )
+            put_calls.extend(
+                {"local_path": source, "stage_path": kwargs.get("stage_path")}
+                for source in sources
+            )
+        return mock.DEFAULT
+
+    mock_sm_put.side_effect = _put
+    return put_calls
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import re
 import shutil
 from pathlib import Path
 from textwrap import dedent
@@ -62,6 +63,27 @@ def _put_query(project_root: Path, source: str, dest: str):
     )
 
 
+class _PutBatchQuery:
+    """
+    Matches a PUT of several files at once, uploaded from a temporary staging directory.
+    """
+
+    def __init__(self, dest: str):
+        self._pattern = re.compile(
+            rf"put file://\S+/\* {re.escape(dest)} auto_compress=false parallel=4 overwrite=False"
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, str) and self._pattern.fullmatch(other) is not None
+
+    def __repr__(self):
+        return self._pattern.pattern
+
+
+def _put_batch_query(dest: str):
+    return _PutBatchQuery(dest)
+
+
 @mock.patch("snowflake.cli._plugins.connection.util.get_account")
 @mock.patch("snowflake.cli._plugins.streamlit.commands.typer")
 @mock.patch("snowflake.connector.connect")
@@ -218,16 +240,7 @@ def test_deploy_with_empty_pages(
     assert result.exit_code == 0, result.output
     assert ctx.get_queries() == [
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit')",
-        _put_query(
-            tmp_dir,
-            "environment.yml",
-            "@MockDatabase.MockSchema.streamlit/test_streamlit",
-        ),
-        _put_query(
-            tmp_dir,
-            "streamlit_app.py",
-            "@MockDatabase.MockSchema.streamlit/test_streamlit",
-        ),
+        _put_batch_query("@MockDatabase.MockSchema.streamlit/test_streamlit"),
         dedent(
             f"""
             CREATE STREAMLIT IDENTIFIER('MockDatabase.MockSchema.{STREAMLIT_NAME}')
@@ -384,8 +397,7 @@ def test_deploy_streamlit_and_environment_files(
     assert result.exit_code == 0, result.output
     assert ctx.get_queries() == [
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit')",
-        _put_query(tmp_dir, "environment.yml", root_path),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
+        _put_batch_query(root_path),
         dedent(
             f"""
             CREATE STREAMLIT IDENTIFIER('MockDatabase.MockSchema.{STREAMLIT_NAME}')
@@ -498,10 +510,8 @@ def test_deploy_all_streamlit_files(
     assert result.exit_code == 0, result.output
     assert ctx.get_queries() == [
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit')",
-        _put_query(tmp_dir, "environment.yml", root_path),
-        _put_query(tmp_dir, "extra_file.py", root_path),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         _put_query(tmp_dir, "utils/utils.py", f"{root_path}/utils"),
         dedent(
             f"""
@@ -573,9 +583,8 @@ def test_deploy_put_files_on_stage(
     assert result.exit_code == 0, result.output
     assert ctx.get_queries() == [
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit_stage')",
-        _put_query(tmp_dir, "environment.yml", root_path),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         dedent(
             f"""
                 CREATE STREAMLIT IDENTIFIER('MockDatabase.MockSchema.{STREAMLIT_NAME}')
@@ -629,8 +638,7 @@ def test_deploy_all_streamlit_files_not_defaults(
     assert result.exit_code == 0, result.output
     assert ctx.get_queries() == [
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit_stage')",
-        _put_query(tmp_dir, "main.py", root_path),
-        _put_query(tmp_dir, "streamlit_environment.yml", root_path),
+        _put_batch_query(root_path),
         _put_query(
             tmp_dir, "streamlit_pages/first_page.py", f"{root_path}/streamlit_pages"
         ),
@@ -729,9 +737,8 @@ def test_deploy_streamlit_main_and_pages_files_experimental(
             ).strip(),
             post_create_command,
             "create stage if not exists IDENTIFIER('streamlit')",
-            _put_query(tmp_dir, "environment.yml", f"{root_path}"),
+            _put_batch_query(root_path),
             _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-            _put_query(tmp_dir, "streamlit_app.py", root_path),
             "select system$get_snowsight_host()",
             "select current_account_name()",
         ]
@@ -813,9 +820,8 @@ def test_deploy_streamlit_main_and_pages_files_experimental_double_deploy(
             """
         ).strip(),
         "create stage if not exists IDENTIFIER('streamlit')",
-        _put_query(tmp_dir, "environment.yml", f"{root_path}"),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         "select system$get_snowsight_host()",
         "select current_account_name()",
     ]
@@ -885,9 +891,8 @@ def test_deploy_streamlit_main_and_pages_files_experimental_no_stage(
         ).strip(),
         post_create_command,
         "create stage if not exists IDENTIFIER('streamlit')",
-        _put_query(tmp_dir, "environment.yml", f"{root_path}"),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         f"select system$get_snowsight_host()",
         f"select current_account_name()",
     ]
@@ -945,9 +950,8 @@ def test_deploy_streamlit_main_and_pages_files_experimental_replace(
         ).strip(),
         f"ALTER streamlit MockDatabase.MockSchema.{STREAMLIT_NAME} CHECKOUT",
         "create stage if not exists IDENTIFIER('streamlit')",
-        _put_query(tmp_dir, "environment.yml", f"{root_path}"),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         f"select system$get_snowsight_host()",
         f"select current_account_name()",
     ]
@@ -1095,9 +1099,8 @@ def test_deploy_streamlit_with_comment_v2(
     assert ctx.get_queries() == [
         f"describe streamlit IDENTIFIER('MockDatabase.MockSchema.test_streamlit_deploy_snowcli')",
         "create stage if not exists IDENTIFIER('MockDatabase.MockSchema.streamlit')",
-        _put_query(tmp_dir, "environment.yml", root_path),
+        _put_batch_query(root_path),
         _put_query(tmp_dir, "pages/my_page.py", f"{root_path}/pages"),
-        _put_query(tmp_dir, "streamlit_app.py", root_path),
         dedent(
             f"""
             CREATE OR REPLACE STREAMLIT IDENTIFIER('MockDatabase.MockSchema.test_streamlit_deploy_snowcli')
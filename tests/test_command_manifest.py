@@ -0,0 +1,176 @@
+# Copyright (c) 2024 Snowflake Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+from snowflake.cli._app.commands_registration.command_plugins_loader import (
+    load_builtin_and_external_command_plugins,
+    load_command_plugins,
+)
+
+# Prints names of the imported plugin modules after listing commands in a new process
+HELP_IMPORTED_PLUGINS_SCRIPT = """
+import json
+import sys
+from snowflake.cli._app.__main__ import main
+try:
+    main(["--help"])
+except SystemExit:
+    pass
+print(json.dumps([m for m in sys.modules if m.startswith("snowflake.cli._plugins")]), file=sys.stderr)
+"""
+
+REGISTRATION = (
+    "snowflake.cli._app.commands_registration.commands_registration_with_callbacks"
+)
+
+
+def _full_registration_spy():
+    return mock.patch(
+        f"{REGISTRATION}.load_builtin_and_external_command_plugins",
+        wraps=load_builtin_and_external_command_plugins,
+    )
+
+
+def _lazy_registration_spy():
+    return mock.patch(
+        f"{REGISTRATION}.load_command_plugins", wraps=load_command_plugins
+    )
+
+
+def test_help_is_listed_from_manifest(runner, isolate_command_manifest):
+    with _full_registration_spy() as full_registration:
+        first = runner.invoke(["--help"])
+        assert full_registration.call_count == 1
+        assert isolate_command_manifest.exists()
+
+        second = runner.invoke(["--help"])
+        assert full_registration.call_count == 1
+
+    assert first.exit_code == 0
+    assert second.output == first.output
+
+
+def test_only_plugins_of_invoked_command_are_loaded(runner):
+    runner.invoke(["--help"])
+
+    with _full_registration_spy() as full_registration, _lazy_registration_spy() as lazy_registration:
+        result = runner.invoke(["connection", "list", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "Lists configured connections" in result.output
+    full_registration.assert_not_called()
+    lazy_registration.assert_called_once_with(
+        builtin_plugin_names=["connection"], external_plugin_names=[]
+    )
+
+
+def test_manifest_keeps_help_of_commands(runner, isolate_command_manifest):
+    runner.invoke(["--help"])
+
+    manifest = json.loads(isolate_command_manifest.read_text())
+    commands = {command["name"]: command for command in manifest["commands"]}
+    assert commands["connection"]["help"] == "Manages connections to Snowflake."
+
+
+def test_manifest_is_not_used_without_config_file(runner, isolate_command_manifest):
+    with mock.patch(
+        f"{REGISTRATION}.command_manifest_path", return_value=None
+    ), _full_registration_spy() as full_registration:
+        runner.invoke(["--help"])
+        result = runner.invoke(["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert full_registration.call_count == 2
+    assert not isolate_command_manifest.exists()
+
+
+def test_stale_manifest_is_not_used(runner):
+    runner.invoke(["--help"])
+
+    with _full_registration_spy() as full_registration, mock.patch(
+        "snowflake.cli.__about__.VERSION", "0.0.1-test_patched"
+    ):
+        runner.invoke(["--help"])
+        runner.invoke(["--help"])
+
+    assert full_registration.call_count == 1
+
+
+def test_corrupted_manifest_is_ignored(runner, isolate_command_manifest):
+    isolate_command_manifest.write_text("{not json")
+
+    with _full_registration_spy() as full_registration:
+        result = runner.invoke(["--help"])
+
+    assert result.exit_code == 0
+    assert "Manages connections to Snowflake" in result.output
+    full_registration.assert_called_once()
+    assert json.loads(isolate_command_manifest.read_text())["commands"]
+
+
+def test_all_commands_are_registered_if_manifest_points_to_wrong_plugin(
+    runner, isolate_command_manifest
+):
+    runner.invoke(["--help"])
+    manifest = json.loads(isolate_command_manifest.read_text())
+    for command in manifest["commands"]:
+        if command["name"] == "connection":
+            command["plugins"] = ["sql"]
+    isolate_command_manifest.write_text(json.dumps(manifest))
+
+    with _full_registration_spy() as full_registration:
+        result = runner.invoke(["connection", "list", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "Lists configured connections" in result.output
+    full_registration.assert_called_once()
+
+
+def test_docs_are_generated_from_all_commands(runner, temporary_directory):
+    runner.invoke(["--help"])
+
+    with _full_registration_spy() as full_registration:
+        result = runner.invoke(["--docs"])
+
+    assert result.exit_code == 0, result.output
+    full_registration.assert_called_once()
+
+
+def test_help_from_manifest_does_not_import_plugins(tmp_path):
+    snowflake_home = tmp_path / ".snowflake"
+    snowflake_home.mkdir()
+    config_file = snowflake_home / "config.toml"
+    config_file.touch()
+    config_file.chmod(0o600)
+    env = {**os.environ, "SNOWFLAKE_HOME": str(snowflake_home)}
+
+    # the first invocation registers all commands and saves the manifest
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-c", HELP_IMPORTED_PLUGINS_SCRIPT],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    imported_plugins = json.loads(result.stderr.splitlines()[-1])
+    assert "Manages connections to Snowflake" in result.stdout
+    assert "snowflake.cli._plugins.spcs" not in imported_plugins
+    assert "snowflake.cli._plugins.nativeapp" not in imported_plugins
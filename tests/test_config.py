@@ -18,9 +18,11 @@ from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import mock
 
 import pytest
+from click import ClickException
 from snowflake.cli.api.config import (
     ConfigFileTooWidePermissionsError,
     config_init,
+    get_config_positive_int_value,
     get_config_section,
     get_connection_dict,
     get_default_connection_dict,
@@ -589,3 +591,22 @@ def test_corrupted_config_raises_human_friendly_error(
 )
 def test_get_env_variable_name(path, key, expected):
     assert get_env_variable_name(*path, key=key) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(None, 7), ("1", 1), ("16", 16), ("0", None), ("x", None)]
+)
+def test_get_config_positive_int_value(test_snowcli_config, value, expected):
+    env = {"SNOWFLAKE_CLI_OUTPUT_LIMIT": value} if value else {}
+    with mock.patch.dict(os.environ, env):
+        if expected is None:
+            with pytest.raises(
+                ClickException,
+                match="Expected positive integer value for cli.output.limit option.",
+            ):
+                get_config_positive_int_value("cli", "output", key="limit", default=7)
+        else:
+            assert (
+                get_config_positive_int_value("cli", "output", key="limit", default=7)
+                == expected
+            )
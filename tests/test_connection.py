@@ -21,7 +21,6 @@ from unittest import mock
 
 import pytest
 import tomlkit
-from snowflake.cli.api.config import ConnectionConfig
 from snowflake.cli.api.constants import ObjectType
 from snowflake.cli.api.secret import SecretType
 from snowflake.cli.api.secure_utils import file_permissions_are_strict
@@ -1367,6 +1366,10 @@ def test_generate_jwt_raises_error_if_required_parameter_is_missing(
 
 @mock.patch("snowflake.cli._plugins.connection.commands.add_connection_to_proper_file")
 def test_connection_add_no_interactive(mock_add, runner):
+    # the config module is reloaded by the snowflake_home fixture, so compare with
+    # the class the lazily imported connection plugin was bound to
+    from snowflake.cli._plugins.connection.commands import ConnectionConfig
+
     mock_add.return_value = "file_name"
     result = runner.invoke(
         [
@@ -11,14 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
+import json
 import os
 import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
 from timeit import default_timer as timer
+from unittest import mock
 
 import pytest
+from snowflake.cli._app.printing import CustomJSONEncoder, print_result
+from snowflake.cli.api.output.formats import OutputFormat
+from snowflake.cli.api.output.types import QueryResult
 
 SAMPLE_AMOUNT = 20
 EXECUTION_TIME_THRESHOLD = 3.1  # seconds
+JSON_OUTPUT_ROWS = 200_000
 
 
 @pytest.mark.performance
@@ -38,3 +49,35 @@ def test_snow_help_performance():
     assert (
         results[int(SAMPLE_AMOUNT * 0.9)] <= EXECUTION_TIME_THRESHOLD
     ), f"90th percentile is too high: {results}"
+
+
+@pytest.mark.performance
+def test_json_output_performance():
+    columns = ["ID", "NAME", "AMOUNT", "CREATED", "COMMENT"]
+    rows = [
+        (i, f"name_{i}", Decimal("1.5"), datetime(2024, 1, 1), None)
+        for i in range(JSON_OUTPUT_ROWS)
+    ]
+    cursor = mock.MagicMock(description=[mock.Mock() for _ in columns])
+    for metadata, name in zip(cursor.description, columns):
+        metadata.name = name
+    remaining_rows = iter(rows)
+    cursor.fetchmany.side_effect = lambda size: list(islice(remaining_rows, size))
+
+    start = timer()
+    with redirect_stdout(io.StringIO()):
+        print_result(QueryResult(cursor), output_format=OutputFormat.JSON)
+    output_time = timer() - start
+
+    start = timer()
+    json.dump(
+        [dict(zip(columns, row)) for row in rows],
+        io.StringIO(),
+        cls=CustomJSONEncoder,
+        indent=4,
+    )
+    json_module_time = timer() - start
+
+    assert (
+        output_time <= json_module_time
+    ), f"JSON output is slower than the json module: {output_time} > {json_module_time}"
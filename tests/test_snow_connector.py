@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import os
+import sys
+import threading
 from unittest import mock
 
 import pytest
@@ -170,7 +172,10 @@ def test_no_output_from_connection(mock_connect, runner):
 
     mock_connect.connect = _mock
 
-    result = runner.invoke(["sql", "-q", "select 1"])
+    # logins which may print (like ones opening a browser) are done on the main thread
+    result = runner.invoke(
+        ["sql", "-q", "select 1", "--authenticator", "externalbrowser"]
+    )
     assert funny_text not in result.output
 
 
@@ -254,3 +259,124 @@ def test_internal_application_data_is_sent_if_feature_flag_is_set(
         result = runner.invoke(["sql", "-q", "select 1"])
     assert result.exit_code == 0
     mock_connect.assert_called_once_with(**expected_kwargs)
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+@mock.patch("snowflake.cli._app.snow_connector.lease_session")
+@mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_SESSION_BROKER_ENABLED": "true"})
+def test_connection_uses_session_from_session_broker(
+    mock_lease_session, mock_command_info, mock_connect, test_snowcli_config
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    mock_command_info.return_value = "SNOWCLI.SQL"
+    mock_lease_session.return_value = {
+        "session_token": "session",
+        "master_token": "master",
+    }
+    expected_kwargs = {
+        "database": "db_for_test",
+        "schema": "test_public",
+        "role": "test_role",
+        "warehouse": "xs",
+        "password": "dummy_password",
+        "application_name": "snowcli",
+        "using_session_keep_alive": True,
+    }
+
+    connect_to_snowflake(connection_name="default")
+
+    mock_lease_session.assert_called_once_with("default", expected_kwargs)
+    mock_connect.assert_called_once_with(
+        application="SNOWCLI.SQL",
+        session_token="session",
+        master_token="master",
+        **expected_kwargs,
+    )
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+@mock.patch("snowflake.cli._app.snow_connector.lease_session")
+@mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_SESSION_BROKER_ENABLED": "true"})
+def test_connection_logs_in_if_session_from_session_broker_is_invalid(
+    mock_lease_session, mock_command_info, mock_connect, test_snowcli_config
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+    from snowflake.connector.errors import ProgrammingError
+
+    config_init(test_snowcli_config)
+    mock_lease_session.return_value = {
+        "session_token": "session",
+        "master_token": "master",
+    }
+    mock_connect.side_effect = [
+        ProgrammingError("Session and master tokens invalid"),
+        mock.Mock(),
+    ]
+
+    connect_to_snowflake(connection_name="default")
+
+    assert "session_token" in mock_connect.mock_calls[0].kwargs
+    assert "session_token" not in mock_connect.mock_calls[1].kwargs
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+@mock.patch("snowflake.cli._app.snow_connector.lease_session")
+@mock.patch.dict(os.environ, {"SNOWFLAKE_CLI_SESSION_BROKER_ENABLED": "true"})
+def test_session_broker_is_not_used_by_temporary_connection(
+    mock_lease_session, mock_command_info, mock_connect, test_snowcli_config
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+
+    connect_to_snowflake(temporary_connection=True, account="a", user="u")
+
+    mock_lease_session.assert_not_called()
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+@mock.patch("snowflake.cli._app.snow_connector.lease_session")
+def test_session_broker_is_not_used_by_default(
+    mock_lease_session, mock_command_info, mock_connect, test_snowcli_config
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+
+    connect_to_snowflake(connection_name="default")
+
+    mock_lease_session.assert_not_called()
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli._app.snow_connector.command_info")
+def test_connection_in_background_does_not_replace_standard_streams(
+    mock_command_info, mock_connect, test_snowcli_config
+):
+    from snowflake.cli._app.snow_connector import connect_to_snowflake
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    streams = (sys.stdout, sys.stderr)
+    streams_during_connect = []
+    mock_connect.side_effect = lambda **_: streams_during_connect.append(
+        (sys.stdout, sys.stderr)
+    )
+
+    thread = threading.Thread(
+        target=connect_to_snowflake, kwargs={"connection_name": "default"}
+    )
+    thread.start()
+    thread.join()
+
+    assert streams_during_connect == [streams]